@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Acces comun la registrele Excel ale proiectului, cu cache binar pe coloane
+
+Fiecare registru se parsează cu openpyxl o singură dată; tabelul rezultat se
+păstrează în `.cache_date/` lângă fișierul sursă:
+   • Parquet (dacă pyarrow este instalat) sau
+   • NumPy .npz – câte un tablou tipizat pe coloană
+Cache-ul se invalidează când se schimbă fișierul sursă (mtime/dimensiune,
+confirmat prin SHA-256), iar în același proces tabelul se ține și în memorie.
+Fișierele din cache se scriu întâi sub un nume temporar în `.cache_date/` și
+apoi se mută peste cele vechi (os.replace), deci un proces care citește în
+paralel nu vede niciodată un fișier scris pe jumătate.
+Același mecanism servește tabelele derivate dintr-un registru
+(tabel_derivat, de ex. agregatele din agregate.py).
+
+Rulare (conversie anticipată a tuturor registrelor):
+    python acces_date.py            # registrele din directorul curent
+    python acces_date.py ../data    # registrele din alt director
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from instrumentare import cronometrat
+
+try:
+    import pyarrow  # noqa: F401  (doar pentru a alege formatul Parquet)
+    FORMAT = "parquet"
+except ImportError:
+    FORMAT = "npz"
+
+DIR_CACHE = ".cache_date"
+_memorie = {}
+
+# ─── 1. Amprenta sursei ──────────────────────────────────────────────────────
+def sha256(cale, bloc=1 << 20):
+    h = hashlib.sha256()
+    with open(cale, "rb") as f:
+        for bucata in iter(lambda: f.read(bloc), b""):
+            h.update(bucata)
+    return h.hexdigest()
+
+
+def amprenta(cale):
+    st = Path(cale).stat()
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _baza_cache(cale, optiuni):
+    cale = Path(cale)
+    cheie = hashlib.sha1(json.dumps(optiuni, sort_keys=True, default=str).encode()).hexdigest()[:10]
+    return cale.parent / DIR_CACHE / f"{cale.stem}.{cheie}"
+
+
+def _fisier(baza, extensie):
+    return baza.with_name(f"{baza.name}.{extensie}")
+
+
+def _cache_valid(cale, baza):
+    """True dacă cache-ul corespunde sursei; reîmprospătează mtime dacă doar acesta diferă."""
+    meta_path = _fisier(baza, "json")
+    if not meta_path.exists():
+        return False
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("format") not in ("npz", FORMAT) or not _fisier(baza, meta["format"]).exists():
+        return False
+    curent = amprenta(cale)
+    if curent == meta["sursa"]:
+        return True
+    if sha256(cale) != meta["sha256"]:
+        return False
+    meta["sursa"] = curent                      # fișier atins, conținut identic
+    with scriere_atomica(meta_path) as temp:
+        temp.write_text(json.dumps(meta, ensure_ascii=False, indent=1), encoding="utf-8")
+    return True
+
+
+# ─── 2. Serializare pe coloane ───────────────────────────────────────────────
+@contextmanager
+def scriere_atomica(cale):
+    """Cale temporară lângă `cale` (aceeași extensie); la ieșirea fără eroare
+    din blocul `with` înlocuiește `cale` dintr-o dată, altfel se șterge."""
+    cale = Path(cale)
+    fd, temp = tempfile.mkstemp(dir=cale.parent, prefix=f".{cale.stem}.", suffix=cale.suffix)
+    os.close(fd)
+    try:
+        yield Path(temp)
+        os.replace(temp, cale)
+    finally:
+        Path(temp).unlink(missing_ok=True)
+
+
+# Numele coloanelor din registre pot fi și numere (ex. lunile 10, 11, 12 …),
+# așa că pe disc coloanele se numesc c0, c1, … iar numele reale stau în meta.
+def _scrie(df, baza, meta):
+    meta["coloane"] = [[c, type(c).__name__] for c in df.columns]
+    pozitional = df.set_axis([f"c{i}" for i in range(df.shape[1])], axis=1)
+
+    meta["format"] = FORMAT
+    if FORMAT == "parquet":
+        try:
+            with scriere_atomica(_fisier(baza, "parquet")) as temp:
+                pozitional.to_parquet(temp, index=False)
+        except (TypeError, ValueError, ImportError):   # ex. coloane mixte text + numere
+            meta["format"] = "npz"
+    if meta["format"] == "npz":
+        tablouri, tipuri = {}, {}
+        for nume, col in pozitional.items():
+            if col.dtype != object:
+                tablouri[nume] = col.to_numpy()
+                tipuri[nume] = "nativ"
+            elif col.dropna().map(type).eq(str).all():
+                tablouri[nume] = col.fillna("").to_numpy(dtype=str)
+                tablouri[nume + "__nul"] = col.isna().to_numpy()
+                tipuri[nume] = "text"
+            else:                               # coloane mixte (text + numere)
+                tablouri[nume] = col.to_numpy(dtype=object)
+                tipuri[nume] = "obiect"
+        meta["tipuri"] = tipuri
+        with scriere_atomica(_fisier(baza, "npz")) as temp:
+            np.savez(temp, **tablouri)
+
+    # meta la urmă: un json nou garantează că fișierul de date este deja complet
+    text = json.dumps(meta, ensure_ascii=False, indent=1, default=str)
+    with scriere_atomica(_fisier(baza, "json")) as temp:
+        temp.write_text(text, encoding="utf-8")
+
+
+def _citeste(baza):
+    meta = json.loads(_fisier(baza, "json").read_text(encoding="utf-8"))
+    if meta["format"] == "parquet":
+        df = pd.read_parquet(_fisier(baza, "parquet"))
+    else:
+        coloane = {}
+        with np.load(_fisier(baza, "npz"),
+                     allow_pickle="obiect" in meta["tipuri"].values()) as f:
+            for nume, tip in meta["tipuri"].items():
+                valori = f[nume]
+                if tip == "text":
+                    valori = pd.Series(valori, dtype=object).mask(f[nume + "__nul"])
+                coloane[nume] = valori
+        df = pd.DataFrame(coloane)
+    tip_nume = {"int": int, "int64": int, "float": float, "float64": float, "str": str}
+    df.columns = [tip_nume.get(tip, str)(nume) for nume, tip in meta["coloane"]]
+    return df
+
+
+# ─── 3. Interfața publică ────────────────────────────────────────────────────
+@cronometrat("incarcare")
+def citeste_excel(cale, **optiuni) -> pd.DataFrame:
+    """Înlocuitor pentru `pd.read_excel(cale, **optiuni)` servit din cache.
+
+    Întoarce o copie, ca scripturile să poată modifica tabelul liber.
+    """
+    if optiuni.get("sheet_name", 0) is None:
+        raise ValueError("citeste_excel citește o singură foaie (sheet_name=None nu e suportat)")
+    return _din_cache(cale, optiuni, lambda: pd.read_excel(cale, **optiuni))
+
+
+@cronometrat("incarcare")
+def tabel_derivat(cale, nume, construieste, **optiuni) -> pd.DataFrame:
+    """Tabel calculat din registrul `cale`, păstrat în cache cât timp sursa nu se schimbă.
+
+    `construieste(df)` primește registrul (prin citeste_excel) și întoarce un
+    DataFrame cu coloane simple (fără Categorical); `nume` deosebește tabelele
+    derivate din aceeași sursă și trebuie schimbat când se schimbă calculul.
+    """
+    return _din_cache(cale, dict(optiuni, derivat=nume),
+                      lambda: construieste(citeste_excel(cale, **optiuni)))
+
+
+def _din_cache(cale, optiuni, calculeaza):
+    """Memorie → cache pe disc → `calculeaza()`, invalidate după amprenta sursei."""
+    cale = Path(cale)
+    cheie_mem = (str(cale.resolve()), json.dumps(optiuni, sort_keys=True, default=str))
+    curent = amprenta(cale)
+    if cheie_mem in _memorie and _memorie[cheie_mem][0] == curent:
+        return _memorie[cheie_mem][1].copy()
+
+    baza = _baza_cache(cale, optiuni)
+    if _cache_valid(cale, baza):
+        df = _citeste(baza)
+    else:
+        df = calculeaza()
+        baza.parent.mkdir(exist_ok=True)
+        meta = {"sursa": curent, "sha256": sha256(cale), "optiuni": optiuni}
+        _scrie(df, baza, meta)
+
+    _memorie[cheie_mem] = (curent, df)
+    return df.copy()
+
+
+def converteste_tot(director="."):
+    """Construiește cache-ul (foaia implicită) pentru toate registrele din director."""
+    for cale in sorted(Path(director).glob("*.xlsx")):
+        try:
+            citeste_excel(cale)
+            print(f"  ✔ {cale.name}")
+        except Exception as exc:                # registre goale / nestandard
+            print(f"  ✘ {cale.name}: {exc}")
+
+
+if __name__ == "__main__":
+    converteste_tot(sys.argv[1] if len(sys.argv) > 1 else ".")
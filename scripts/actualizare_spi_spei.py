@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Actualizare incrementală SPI/SPEI multi-scară pentru luni noi de observații
+
+Starea păstrată între rulări (fișier .npz):
+   • coada ferestrei mobile: ultimele max(scari)-1 luni de P și P–ETP pe stație
+   • ultima lună procesată, scările, perioada de referință, metoda de ajustare
+     și varianta ETP a istoricului (formula și sursa Ra), refolosită pentru
+     lunile noi – Thornthwaite nu se poate actualiza incremental (indicele
+     termic cere anul întreg)
+Parametrii distribuțiilor vin din depozitul CSV (vezi motor_spi_spei.py), deci
+lunile noi cer doar sume mobile scurte și evaluarea CDF – fără reajustare.
+Valorile noi se adaugă la sfârșitul tabelului de rezultate (CSV).
+
+Același mecanism, ca generator (indici_flux), evaluează înregistrări oricât de
+lungi pe bucăți: se păstrează doar coada ferestrei și parametrii, deci memoria
+depinde de fereastră și de bucată, nu de lungimea seriei (și pentru date
+zilnice, cu parametri pe ziua din an).
+
+Rulare:
+    python actualizare_spi_spei.py luni_noi.xlsx
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.stats import gamma, pearson3
+
+from etp import adauga_etp, eticheta_etp
+from motor_spi_spei import (acumulari, pivoteaza, standardizeaza_lunar, tabel_rezultate,
+                            spi_spei_multiscara, DepozitParametri, FARA_ETP, SCARI_STANDARD)
+
+STARE_FILE = "Stare_SPI_SPEI_6statii.npz"
+PARAM_FILE = "Parametri_SPI_SPEI_6statii.csv"
+REZULTATE_FILE = "Rezultate_SPI_SPEI_multiscara_6statii.csv"
+
+DISTRIBUTII = {"SPI": gamma, "SPEI": pearson3}
+ETP_FARA_INCREMENTAL = ("thornthwaite",)  # ETP-ul unei luni depinde de restul anului
+
+# ─── 1. Stare ────────────────────────────────────────────────────────────────
+def stare_din_istoric(df, scari=SCARI_STANDARD, perioada_ref=None, depozit=None,
+                      metoda="mle", precip="precip_total", etp="ETP",
+                      metoda_etp="hargreaves", ra_tabel=False):
+    """Calcul complet o singură dată; întoarce (rezultate, stare).
+
+    `metoda_etp` și `ra_tabel` descriu coloana `etp` (argumentele lui adauga_etp).
+    Starea are aceleași tipuri ca după citeste_stare, deci se poate folosi
+    direct, fără drum prin fișier:
+
+    >>> ani, luni = np.divmod(np.arange(30 * 12 + 2), 12)
+    >>> df = pd.DataFrame({"Statie": "A", "An_numeric": 1990 + ani, "Luna_numeric": luni + 1,
+    ...                    "Latitude": 44.5, "tmin_med": 5.0, "tmax_med": 15.0, "tmed_med": 10.0,
+    ...                    "precip_total": np.random.default_rng(0).gamma(2.0, 20.0, ani.size)})
+    >>> istoric, nou = df.iloc[:-2].copy(), df.iloc[-2:].copy()
+    >>> depozit = DepozitParametri()
+    >>> _, stare = stare_din_istoric(adauga_etp(istoric), (1, 3), depozit=depozit)
+    >>> rezultate, _ = actualizeaza(etp_din_stare(nou, stare), stare, depozit)
+    >>> rezultate[["An", "Luna"]].values.tolist(), bool(rezultate["SPEI-3"].notna().all())
+    ([[2020, 1], [2020, 2]], True)
+    """
+    rezultate = spi_spei_multiscara(df, scari, precip, etp, perioada_ref, depozit, metoda,
+                                    eticheta_etp(metoda_etp, ra_tabel))
+    statii, ani, luni, (p, e) = pivoteaza(df, [precip, etp])
+    coada = max(scari) - 1
+    stare = {
+        "statii": statii.astype(str),
+        "ultima": int(ani[-1]) * 12 + int(luni[-1]) - 1,
+        "coada_p": p[:, p.shape[1] - coada:],
+        "coada_d": (p - e)[:, p.shape[1] - coada:],
+        "scari": np.asarray(scari),
+        "perioada": np.asarray(perioada_ref if perioada_ref is not None
+                               else (int(ani.min()), int(ani.max()))),
+        "metoda": metoda,
+        "metoda_etp": metoda_etp,
+        "ra_tabel": ra_tabel,
+    }
+    return rezultate, _normalizeaza_stare(stare)
+
+
+def _normalizeaza_stare(stare):
+    """Scalarii stării ca tipuri Python (np.load îi întoarce ca tablouri 0-d)."""
+    stare["ultima"] = int(stare["ultima"])
+    stare["metoda"] = str(stare["metoda"])
+    stare["metoda_etp"] = str(stare.get("metoda_etp", "hargreaves"))   # stări scrise fără ETP
+    stare["ra_tabel"] = bool(stare.get("ra_tabel", False))
+    return stare
+
+
+def scrie_stare(stare, cale=STARE_FILE):
+    np.savez(cale, **stare)
+
+
+def citeste_stare(cale=STARE_FILE):
+    with np.load(cale) as f:
+        return _normalizeaza_stare({k: f[k] for k in f.files})
+
+
+# ─── 2. Evaluare în flux ─────────────────────────────────────────────────────
+def parametri_depozit(depozit, nume, scari, perioada, statii, metoda="mle", etp=FARA_ETP):
+    """{scara: parametri (statii × 12 × 4)} din depozit; eroare dacă lipsesc."""
+    param = {}
+    for k in scari:
+        param[k] = depozit.obtine(nume, k, perioada, statii, metoda, etp)
+        if np.isnan(param[k]).all(axis=2).any():
+            raise ValueError(f"Lipsesc parametrii {nume}-{k} în depozit (rulați calculul complet)")
+    return param
+
+
+def indici_flux(bucati, param, distributie, coada=None):
+    """Generator: pentru fiecare bucată întoarce ({scara: indice (serii × pas)}, coada).
+
+    `bucati` produce perechi (valori (serii × pas), coduri (pas,)), consecutive
+    în timp; codurile sunt luna 1…12 (sau ziua din an, cu parametri pe 366 de
+    sloturi). `param` este {scara: (serii × sloturi × 4)}, ajustați dinainte
+    (ajusteaza_lunar).
+    Fereastra se termină în pasul curent; se păstrează doar ultimii
+    max(scari) − 1 pași (`coada`, NaN la început), deci memoria nu crește
+    cu lungimea înregistrării. Ultima coadă întoarsă continuă fluxul ulterior.
+    """
+    scari = sorted(param)
+    lungime = max(scari) - 1
+    for valori, coduri in bucati:
+        valori = np.atleast_2d(np.asarray(valori, dtype=float))
+        if coada is None:
+            coada = np.full((valori.shape[0], lungime), np.nan)
+        serie = np.concatenate([coada, valori], axis=1)
+        acc = acumulari(serie, scari)
+        coada = serie[:, serie.shape[1] - lungime:]
+        yield ({k: standardizeaza_lunar(acc[k][:, lungime:], coduri, distributie, param[k]) for k in scari},
+               coada)
+
+
+# ─── 3. Luni noi ─────────────────────────────────────────────────────────────
+def etp_din_stare(df_nou, stare):
+    """Adaugă ETP lunilor noi cu varianta ETP a istoricului (din stare)."""
+    if stare["metoda_etp"] in ETP_FARA_INCREMENTAL:
+        raise ValueError(f"ETP {stare['metoda_etp']} nu se poate actualiza incremental "
+                         "(rulați calculul complet)")
+    return adauga_etp(df_nou, ra_tabel=stare["ra_tabel"], metoda=stare["metoda_etp"])
+
+
+def actualizeaza(df_nou, stare, depozit, precip="precip_total", etp="ETP"):
+    """Indicii doar pentru lunile din `df_nou`; întoarce (rezultate_noi, stare_noua).
+
+    Coloana `etp` trebuie calculată cu varianta din stare (etp_din_stare).
+    """
+    statii_nou, ani, luni, (p, e) = pivoteaza(df_nou, [precip, etp])
+    statii = stare["statii"]
+    necunoscute = set(statii_nou.astype(str)) - set(statii)
+    if necunoscute:
+        raise ValueError("Stații fără istoric (rulați calculul complet): "
+                         + ", ".join(sorted(necunoscute)))
+
+    # axă de timp continuă după ultima lună procesată
+    cheie = ani * 12 + luni - 1
+    if cheie.min() <= stare["ultima"]:
+        raise ValueError("Datele noi se suprapun cu lunile deja procesate")
+    timp = np.arange(stare["ultima"] + 1, cheie.max() + 1)
+    rand = pd.Index(statii).get_indexer(statii_nou.astype(str))
+    p_nou = np.full((len(statii), timp.size), np.nan)
+    d_nou = np.full_like(p_nou, np.nan)
+    p_nou[np.ix_(rand, cheie - timp[0])] = p
+    d_nou[np.ix_(rand, cheie - timp[0])] = p - e
+
+    scari = [int(k) for k in stare["scari"]]
+    perioada = tuple(int(a) for a in stare["perioada"])
+    luni_t = timp % 12 + 1
+
+    surse = {"SPI": FARA_ETP, "SPEI": eticheta_etp(stare["metoda_etp"], stare["ra_tabel"])}
+    indici, cozi = {}, {}
+    for nume, valori, coada in (("SPI", p_nou, stare["coada_p"]), ("SPEI", d_nou, stare["coada_d"])):
+        param = parametri_depozit(depozit, nume, scari, perioada, statii, stare["metoda"], surse[nume])
+        pe_scara, cozi[nume] = next(indici_flux([(valori, luni_t)], param, DISTRIBUTII[nume], coada))
+        indici.update({f"{nume}-{k}": v for k, v in pe_scara.items()})
+
+    stare_noua = dict(stare, ultima=int(timp[-1]), coada_p=cozi["SPI"], coada_d=cozi["SPEI"])
+    rezultate = tabel_rezultate(statii, timp // 12, luni_t, indici, valid=~np.isnan(p_nou))
+    return rezultate, stare_noua
+
+
+def adauga_rezultate(df, cale=REZULTATE_FILE):
+    """Adaugă rândurile la sfârșitul depozitului CSV (antet doar la creare)."""
+    cale = Path(cale)
+    df.to_csv(cale, mode="a", header=not cale.exists(), index=False)
+
+
+# ─── 4. Punct de intrare ─────────────────────────────────────────────────────
+def main() -> None:
+    if len(sys.argv) != 2:
+        sys.exit(__doc__)
+    df_nou = pd.read_excel(sys.argv[1])
+    df_nou.columns = df_nou.columns.str.strip()
+    stare = citeste_stare(STARE_FILE)
+    etp_din_stare(df_nou, stare)
+
+    depozit = DepozitParametri(PARAM_FILE)
+    rezultate, stare = actualizeaza(df_nou, stare, depozit)
+    adauga_rezultate(rezultate, REZULTATE_FILE)
+    scrie_stare(stare, STARE_FILE)
+    print(f"✅ {len(rezultate)} valori noi adăugate în {REZULTATE_FILE}")
+
+
+if __name__ == "__main__":
+    main()
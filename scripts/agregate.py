@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Agregate precalculate (vederi materializate) peste tabelele de indici
+
+Mediile standard se calculează o singură dată din rândurile brute și se
+păstrează în `.cache_date/` lângă registrul sursă (acces_date.tabel_derivat);
+cache-ul se invalidează automat când se schimbă registrul (amprentă + SHA-256)
+sau VERSIUNE (când se schimbă calculul de mai jos). Vederile:
+   • "medii_indici"  – SPI-3, SPEI-3 și SPI-3 − SPEI-3: media și numărul de
+     valori pe (indice × stație × grupare × sezon × perioadă); gruparea este
+     anotimpul, semestrul sau anul întreg, perioada este 1961–1990, 1991–2020
+     (după anul sezonier, vezi calendar_climatic.py) sau toată seria, iar
+     stația "Toate" înseamnă media tuturor rândurilor
+   • "serie_regionala" – media pe stații a fiecărui indice, pe (an, lună)
+   • "hellmann_anual" – scorul Hellmann mediu anual pe stație
+   • "hellmann_secetos" / "hellmann_secetos_anual" – procentul lunilor
+     secetoase (scor 1 sau 2) pe (interval, lună) și pe (lună, an)
+Consumatori: spi_spei_sezoniere.py, spi_spei_semestru_cald.py,
+spi_spei_semestru_rece.py, spi_spei_diferente_perioade.py,
+top-10-ani-secetosi_baragan.py, repartitie_luni_secetoase_baragan.py.
+
+Rulare (precalculează toate vederile, din directorul cu registrele Excel):
+    python ../scripts/agregate.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from acces_date import tabel_derivat
+from calendar_climatic import an_sezonier, cod_perioada, perioada, sezon, PERIOADE
+
+REZULTATE_SPI = "Rezultate_SPI3_SPEI3_6statii.xlsx"
+HELLMANN_LUNAR = "Date_6statii_cu_scor_hellmann_lunar.xlsx"
+VERSIUNE = 1
+
+INDICI = ("SPI-3", "SPEI-3", "Dif_SPI_SPEI")
+TOATE_STATIILE = "Toate"
+PERIOADA_TOTALA = "1961–2020"
+AN_INTREG = "An"
+SCORURI_SECETOASE = (1, 2)
+
+
+# ─── 1. Vederi peste indicii SPI / SPEI ──────────────────────────────────────
+def _cu_diferenta(df):
+    return df.assign(Dif_SPI_SPEI=df["SPI-3"] - df["SPEI-3"])
+
+
+def _medii_indici(df):
+    df = _cu_diferenta(df)
+    luna = df["Luna"].to_numpy()
+    grupari = {"Anotimp": np.asarray(sezon(luna), dtype=object),
+               "Semestru": np.asarray(sezon(luna, "semestru"), dtype=object),
+               AN_INTREG: np.full(len(df), AN_INTREG, dtype=object)}
+    cod_per = cod_perioada(an_sezonier(df["An"], luna))
+    perioade = {PERIOADA_TOTALA: np.ones(len(df), dtype=bool)}
+    perioade.update({eticheta: cod_per == k for k, eticheta in enumerate(PERIOADE)})
+
+    lung = df.melt(id_vars=["Statie"], value_vars=list(INDICI), var_name="Indice", value_name="Valoare")
+    n_ind = len(INDICI)
+    parti = []
+    for grupare, clase in grupari.items():
+        for nume_per, in_perioada in perioade.items():
+            selectie = np.tile(in_perioada & pd.notna(clase), n_ind)
+            bucata = lung[selectie].assign(Sezon=np.tile(clase, n_ind)[selectie])
+            for pe_statie in (True, False):
+                chei = ["Indice", "Statie", "Sezon"] if pe_statie else ["Indice", "Sezon"]
+                rez = bucata.groupby(chei)["Valoare"].agg(Medie="mean", N="count").reset_index()
+                if not pe_statie:
+                    rez["Statie"] = TOATE_STATIILE
+                parti.append(rez.assign(Grupare=grupare, Perioada=nume_per))
+    coloane = ["Indice", "Statie", "Grupare", "Sezon", "Perioada", "Medie", "N"]
+    return pd.concat(parti, ignore_index=True)[coloane]
+
+
+def _serie_regionala(df):
+    return _cu_diferenta(df).groupby(["An", "Luna"])[list(INDICI)].mean().reset_index()
+
+
+# ─── 2. Vederi peste scorul Hellmann lunar ───────────────────────────────────
+def _hellmann_anual(df):
+    anual = df.groupby(["Statie", "An_numeric"])["hellmann_score_lunar"].mean().reset_index()
+    return anual.rename(columns={"hellmann_score_lunar": "scor_hellmann_mediu_anual"})
+
+
+def _este_secetoasa(df):
+    return df.assign(este_secetoasa=df["hellmann_score_lunar"].isin(SCORURI_SECETOASE))
+
+
+def _hellmann_secetos(df):
+    df = _este_secetoasa(df)
+    df["Interval"] = np.asarray(perioada(df["An_numeric"]), dtype=object)
+    rez = df.groupby(["Interval", "Luna_numeric"])["este_secetoasa"].mean().reset_index()
+    rez["Procent_secetos"] = rez.pop("este_secetoasa") * 100
+    return rez
+
+
+def _hellmann_secetos_anual(df):
+    rez = _este_secetoasa(df).groupby(["Luna_numeric", "An_numeric"])["este_secetoasa"].mean().reset_index()
+    rez["Procent_secetos"] = rez.pop("este_secetoasa") * 100
+    return rez
+
+
+# nume → (registrul sursă, funcția de calcul)
+VEDERI = {
+    "medii_indici": (REZULTATE_SPI, _medii_indici),
+    "serie_regionala": (REZULTATE_SPI, _serie_regionala),
+    "hellmann_anual": (HELLMANN_LUNAR, _hellmann_anual),
+    "hellmann_secetos": (HELLMANN_LUNAR, _hellmann_secetos),
+    "hellmann_secetos_anual": (HELLMANN_LUNAR, _hellmann_secetos_anual),
+}
+
+
+# ─── 3. Interfață ────────────────────────────────────────────────────────────
+def vedere(nume, sursa=None):
+    """Tabelul agregat `nume`, din cache dacă registrul sursă nu s-a schimbat."""
+    if nume not in VEDERI:
+        raise ValueError(f"Vedere necunoscută: {nume!r} (disponibile: {', '.join(VEDERI)})")
+    registru, construieste = VEDERI[nume]
+    return tabel_derivat(sursa or registru, f"{nume}@{VERSIUNE}", construieste)
+
+
+def medii_pe_statii(grupare, sezon_ales, perioada_aleasa=PERIOADA_TOTALA, indici=("SPI-3", "SPEI-3")):
+    """Mediile (stații × indici) pentru un sezon și o perioadă, stațiile în ordine alfabetică."""
+    m = vedere("medii_indici")
+    m = m[(m["Grupare"] == grupare) & (m["Sezon"] == sezon_ales) & (m["Perioada"] == perioada_aleasa)
+          & (m["Statie"] != TOATE_STATIILE) & m["Indice"].isin(indici)]
+    return m.pivot(index="Statie", columns="Indice", values="Medie")[list(indici)].rename_axis(columns=None)
+
+
+def medii_regionale(grupare, indice, perioade=PERIOADE):
+    """Mediile tuturor rândurilor pe (perioadă, sezon) pentru un indice."""
+    m = vedere("medii_indici")
+    m = m[(m["Grupare"] == grupare) & (m["Indice"] == indice) & (m["Statie"] == TOATE_STATIILE)
+          & m["Perioada"].isin(perioade)]
+    return m[["Perioada", "Sezon", "Medie"]].reset_index(drop=True)
+
+
+def main() -> None:
+    for nume in VEDERI:
+        print(f"  ✔ {nume:24} {len(vedere(nume)):>6} rânduri")
+    print("✅ Agregatele sunt la zi în .cache_date/")
+
+
+if __name__ == "__main__":
+    main()
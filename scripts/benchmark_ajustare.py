@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark – metode de ajustare SPI/SPEI: MLE (scipy .fit) vs. L-momente
+
+Pe un lot sintetic de serii lunare (precipitații gamma, deficit P–ETP) compară:
+   • timpul de ajustare pe luni calendaristice pentru fiecare metodă
+   • acordul indicilor rezultați (diferență medie / maximă, corelație), față
+     de TOLERANTA_ACORD din motor_spi_spei.py – ambele metode ajustează același
+     model (SPI: gamma cu loc = 0 și p0; SPEI: Pearson III); ieșire cu cod 1
+     dacă acordul este în afara toleranței
+
+Rulare:
+    python benchmark_ajustare.py                 # 6, 60 și 600 de serii
+    python benchmark_ajustare.py -n 6 100 1000   # dimensiuni alese
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+from scipy.stats import gamma, pearson3
+
+from motor_spi_spei import (TOLERANTA_ACORD, acord_metode, acumulari, ajusteaza_lunar,
+                            standardizeaza_lunar)
+
+ANI = 60
+SCARA = 3
+
+
+def date_sintetice(n_serii, seed=0):
+    rng = np.random.default_rng(seed)
+    luni = np.tile(np.arange(1, 13), ANI)
+    sezon = 35 + 15 * np.sin((luni - 4) / 12 * 2 * np.pi)          # mm/lună
+    precip = rng.gamma(2.5, sezon / 2.5, size=(n_serii, luni.size))
+    etp = np.clip(60 + 55 * np.sin((luni - 4) / 12 * 2 * np.pi), 5, None)
+    etp = etp * rng.normal(1, 0.1, size=(n_serii, luni.size))
+    return luni, precip, precip - etp
+
+
+def ruleaza(n_serii):
+    luni, precip, deficit = date_sintetice(n_serii)
+    rezultate = {}
+    for nume, serii, distributie in (("SPI", precip, gamma), ("SPEI", deficit, pearson3)):
+        acc = acumulari(serii, (SCARA,))[SCARA]
+        indici = {}
+        for metoda in ("mle", "lmom"):
+            t0 = time.perf_counter()
+            param = ajusteaza_lunar(acc, luni, distributie, metoda=metoda)
+            durata = time.perf_counter() - t0
+            indici[metoda] = standardizeaza_lunar(acc, luni, distributie, param)
+            rezultate[(nume, metoda)] = durata
+
+        ok = ~np.isnan(indici["mle"]) & ~np.isnan(indici["lmom"])
+        dif = np.abs(indici["mle"][ok] - indici["lmom"][ok])
+        r = np.corrcoef(indici["mle"][ok], indici["lmom"][ok])[0, 1]
+        _, p99, in_toleranta = acord_metode(indici["mle"], indici["lmom"], *TOLERANTA_ACORD[nume])
+        rezultate[(nume, "acord")] = in_toleranta
+        print(f"  {nume}-{SCARA:<3} MLE {rezultate[(nume, 'mle')]:8.3f} s | "
+              f"L-mom {rezultate[(nume, 'lmom')]:8.4f} s | "
+              f"x{rezultate[(nume, 'mle')] / rezultate[(nume, 'lmom')]:7.0f} | "
+              f"|Δ| medie {dif.mean():.3f}, p99 {p99:.3f}, max {dif.max():.3f}, r = {r:.4f}"
+              f"{'' if in_toleranta else '  ← în afara toleranței'}")
+    return rezultate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--serii", type=int, nargs="+", default=[6, 60, 600])
+    args = parser.parse_args()
+
+    acord = True
+    for n in args.serii:
+        print(f"── {n} serii × {ANI * 12} luni")
+        rezultate = ruleaza(n)
+        acord &= rezultate[("SPI", "acord")] and rezultate[("SPEI", "acord")]
+    if not acord:
+        print(f"Acordul MLE / L-momente este în afara toleranței {TOLERANTA_ACORD}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
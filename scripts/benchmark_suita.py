@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Suita de benchmark-uri a lanțului de analiză, cu referință salvată și prag de regresie
+
+Pe loturi sintetice de 6 … 10 000 de stații (60 de ani de date lunare, ca în
+benchmark_ajustare.py) se cronometrează:
+   • încărcarea registrului: pd.read_excel vs. cache-ul din acces_date.py
+   • ajustarea SPI-3 / SPEI-3 (compute_spi_3, compute_spei_3), MLE și L-momente
+   • clasificarea Hellmann (hellmann.coduri) și tendințele anuale (tendinte.py)
+   • randarea unei hărți stații × luni (imshow + savefig la 300 dpi)
+   • opțional, fiecare script de figură al lucrării pe registrele reale (--date)
+Fiecare măsurătoare este minimul a REPETARI rulări (pregătirea nu se
+cronometrează). Rezultatele se compară cu referința din FISIER_REFERINTA; un
+benchmark mai lent de PRAG_REGRESIE × referința este o regresie, iar scriptul
+se termină cu cod 1. Totul rulează local, fără rețea.
+
+Rulare:
+    python benchmark_suita.py                        # toate, toate dimensiunile
+    python benchmark_suita.py spi hellmann -n 6 600  # doar dimensiunile / benchmark-urile alese
+    python benchmark_suita.py --salveaza             # rezultatele devin noua referință
+    python benchmark_suita.py --date ../date         # plus figurile, pe registrele reale
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import acces_date
+from benchmark_ajustare import ANI, date_sintetice
+from hellmann import coduri
+from motor_spi_spei import compute_spi_3, compute_spei_3
+from tendinte import tendinte
+
+DIMENSIUNI = (6, 60, 600, 10_000)
+REPETARI = 3
+PRAG_REGRESIE = 1.25                      # × timpul de referință
+FISIER_REFERINTA = Path(__file__).resolve().parent / "benchmark_referinta.json"
+
+
+# ─── 1. Date sintetice ───────────────────────────────────────────────────────
+def lot_sintetic(n_serii, seed=0):
+    """Tablourile (serii × luni) și tabelul lung cu coloanele registrului lunar."""
+    luni, precip, deficit = date_sintetice(n_serii, seed)
+    rng = np.random.default_rng(seed + 1)
+    tmed = 11 + 12 * np.sin((luni - 4) / 12 * 2 * np.pi) + rng.normal(0, 1.5, precip.shape)
+    ani = np.repeat(np.arange(1961, 1961 + ANI), 12)
+    statii = np.array([f"S{i:05d}" for i in range(n_serii)])
+    tabel = pd.DataFrame({
+        "Statie": np.repeat(statii, luni.size),
+        "Latitude": np.repeat(rng.uniform(43.8, 45.2, n_serii), luni.size),
+        "Longitude": np.repeat(rng.uniform(26.0, 28.0, n_serii), luni.size),
+        "An_numeric": np.tile(ani, n_serii), "Luna_numeric": np.tile(luni, n_serii),
+        "precip_total": precip.ravel(), "tmed_med": tmed.ravel(),
+        "tmin_med": (tmed - 5).ravel(), "tmax_med": (tmed + 6).ravel(),
+    })
+    anual = precip.reshape(n_serii, ANI, 12).sum(axis=2)
+    return {"precip": precip, "deficit": deficit, "anual": anual, "tabel": tabel}
+
+
+# ─── 2. Benchmark-uri ────────────────────────────────────────────────────────
+# Fiecare primește (lot, director temporar) și întoarce funcția de cronometrat;
+# pregătirea (scrierea registrului, încălzirea cache-ului) rămâne în afara ei.
+def _excel(lot, director):
+    cale = director / "registru.xlsx"
+    lot["tabel"].to_excel(cale, index=False)
+    return lambda: pd.read_excel(cale)
+
+
+def _cache(lot, director):
+    cale = director / "registru.xlsx"
+    if not cale.exists():
+        lot["tabel"].to_excel(cale, index=False)
+    acces_date.citeste_excel(cale)
+
+    def citeste():
+        acces_date._memorie.clear()             # doar cache-ul de pe disc
+        return acces_date.citeste_excel(cale)
+    return citeste
+
+
+def _randare(lot, director):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    def randeaza():
+        fig, ax = plt.subplots(figsize=(12, 6))
+        im = ax.imshow(lot["precip"], aspect="auto", cmap="BrBG", interpolation="nearest")
+        fig.colorbar(im, ax=ax)
+        # print_figure = savefig fără a intra în descoperirea din construieste_figuri.py
+        fig.canvas.print_figure(io.BytesIO(), dpi=300, bbox_inches="tight")
+        plt.close(fig)
+    return randeaza
+
+
+# nume → (funcție, dimensiunea maximă a lotului)
+BENCHMARKURI = {
+    "incarcare_excel": (_excel, 60),
+    "incarcare_cache": (_cache, 60),
+    "spi_3_mle": (lambda lot, d: lambda: compute_spi_3(lot["precip"], "mle"), 600),
+    "spi_3_lmom": (lambda lot, d: lambda: compute_spi_3(lot["precip"], "lmom"), None),
+    "spei_3_mle": (lambda lot, d: lambda: compute_spei_3(lot["deficit"], "mle"), 600),
+    "spei_3_lmom": (lambda lot, d: lambda: compute_spei_3(lot["deficit"], "lmom"), None),
+    "hellmann": (lambda lot, d: lambda: coduri(lot["precip"]), None),
+    "tendinte": (lambda lot, d: lambda: tendinte(lot["anual"]), None),
+    "randare_harta": (_randare, 600),
+}
+
+
+def masoara(functie, repetari=REPETARI):
+    """Cel mai scurt timp (s) din `repetari` rulări."""
+    durate = []
+    for _ in range(repetari):
+        t0 = time.perf_counter()
+        functie()
+        durate.append(time.perf_counter() - t0)
+    return min(durate)
+
+
+def ruleaza(dimensiuni=DIMENSIUNI, filtre=(), repetari=REPETARI):
+    """{benchmark: {n: secunde}} pentru benchmark-urile și dimensiunile alese."""
+    alese = {nume: b for nume, b in BENCHMARKURI.items() if not filtre or any(f in nume for f in filtre)}
+    rezultate = {nume: {} for nume in alese}
+    for n in dimensiuni:
+        lot = lot_sintetic(n)
+        with tempfile.TemporaryDirectory() as temp:
+            for nume, (pregateste, maxim) in alese.items():
+                if maxim is not None and n > maxim:
+                    continue
+                rezultate[nume][str(n)] = masoara(pregateste(lot, Path(temp)), repetari)
+                print(f"  {nume:18} {n:>6} serii  {rezultate[nume][str(n)]:9.4f} s")
+    return {nume: r for nume, r in rezultate.items() if r}
+
+
+def ruleaza_figuri(director_date, filtre=()):
+    """Timpul fiecărui script de figură (o rulare), pe registrele din `director_date`."""
+    from construieste_figuri import _initializeaza, descopera_figuri, randeaza
+
+    director_date = str(Path(director_date).resolve())
+    _initializeaza(director_date)
+    rezultate = {}
+    for cale in descopera_figuri(filtre):
+        nume, secunde, eroare, _ = randeaza(cale, director_date)
+        if eroare:
+            print(f"  ✘ {nume}: {eroare.splitlines()[-1]}")
+            continue
+        rezultate[f"figura:{nume}"] = {"real": secunde}
+        print(f"  figura {nume:48} {secunde:9.2f} s")
+    return rezultate
+
+
+# ─── 3. Referință și regresii ────────────────────────────────────────────────
+def compara(rezultate, referinta):
+    """Lista (benchmark, n, secunde, referință, raport) pentru măsurătorile comparabile."""
+    comparatii = []
+    for nume, pe_n in rezultate.items():
+        for n, secunde in pe_n.items():
+            ref = referinta.get(nume, {}).get(n)
+            if ref:
+                comparatii.append((nume, n, secunde, ref, secunde / ref))
+    return comparatii
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Benchmark-urile lanțului de analiză, cu prag de regresie")
+    ap.add_argument("filtre", nargs="*", help="doar benchmark-urile al căror nume conține textul dat")
+    ap.add_argument("-n", "--serii", type=int, nargs="+", default=list(DIMENSIUNI))
+    ap.add_argument("-r", "--repetari", type=int, default=REPETARI)
+    ap.add_argument("--referinta", default=str(FISIER_REFERINTA), help="fișierul JSON cu timpii de referință")
+    ap.add_argument("--prag", type=float, default=PRAG_REGRESIE, help="raportul peste care e regresie")
+    ap.add_argument("--salveaza", action="store_true", help="scrie rezultatele ca nouă referință")
+    ap.add_argument("--date", default=None, help="directorul cu registrele Excel (cronometrează și figurile)")
+    args = ap.parse_args()
+
+    rezultate = ruleaza(args.serii, args.filtre, args.repetari)
+    if args.date:
+        rezultate.update(ruleaza_figuri(args.date, args.filtre))
+
+    cale_ref = Path(args.referinta)
+    if args.salveaza:
+        referinta = json.loads(cale_ref.read_text(encoding="utf-8")) if cale_ref.exists() else {}
+        for nume, pe_n in rezultate.items():
+            referinta.setdefault(nume, {}).update(pe_n)
+        cale_ref.write_text(json.dumps(referinta, indent=1, sort_keys=True), encoding="utf-8")
+        print(f"✅ Referința actualizată în: {cale_ref}")
+        return
+    if not cale_ref.exists():
+        print(f"(fără referință: {cale_ref}; rulați cu --salveaza)")
+        return
+
+    comparatii = compara(rezultate, json.loads(cale_ref.read_text(encoding="utf-8")))
+    print("\nFață de referință:")
+    regresii = []
+    for nume, n, secunde, ref, raport in comparatii:
+        marcaj = "REGRESIE" if raport > args.prag else ""
+        print(f"  {nume:18} {n:>6}  {secunde:9.4f} s / {ref:9.4f} s  x{raport:5.2f}  {marcaj}")
+        if marcaj:
+            regresii.append(nume)
+    if regresii:
+        sys.exit(f"✘ {len(regresii)} regresii peste x{args.prag}: {', '.join(sorted(set(regresii)))}")
+    print(f"✅ Fără regresii (prag x{args.prag})")
+
+
+if __name__ == "__main__":
+    main()
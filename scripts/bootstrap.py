@@ -0,0 +1,160 @@
+"""
+Reeșantionare pentru incertitudinea trendurilor și a diferențelor între perioade
+
+   • bootstrap pe blocuri circulare (Politis & Romano, 1992) – păstrează
+     autocorelația seriilor lunare; aceleași indici se aplică tuturor seriilor,
+     deci și corelația dintre stații se păstrează
+   • test de permutare pe blocuri pentru diferența dintre două perioade
+   • intervale de încredere percentile pentru panta OLS (bootstrap pe
+     reziduuri) și pentru diferența mediilor
+
+Fiecare reeșantionare se reduce la o matrice de ponderi (reeșantionări × timp),
+deci statisticile pentru toate seriile sunt un singur produs matriceal.
+Reeșantionările se împart în sarcini de REESANTIONARI_PE_SARCINA, rulate într-un
+ProcessPoolExecutor; fiecare sarcină are propriul generator, derivat cu
+np.random.SeedSequence(seed).spawn, deci rezultatul nu depinde de numărul de
+procese sau de ordinea în care se termină sarcinile.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from instrumentare import cronometrat
+
+N_REESANTIONARI = 10_000
+REESANTIONARI_PE_SARCINA = 500
+LUNGIME_BLOC = 12                         # luni; pentru serii anuale, 2–3 ani
+NIVEL = 0.95
+SEED = 20250101
+
+
+# ─── 1. Indici și ponderi ────────────────────────────────────────────────────
+def indici_bloc(rng, n_res, n, lungime_bloc=LUNGIME_BLOC):
+    """Indici (n_res × n) din blocuri circulare de lungime fixă cu început aleator."""
+    n_blocuri = -(-n // lungime_bloc)
+    inceput = rng.integers(0, n, size=(n_res, n_blocuri, 1))
+    return ((inceput + np.arange(lungime_bloc)) % n).reshape(n_res, -1)[:, :n]
+
+
+def permutari_bloc(rng, n_res, n, lungime_bloc=LUNGIME_BLOC):
+    """Indici (n_res × n) obținuți prin amestecarea ordinii blocurilor consecutive."""
+    n_blocuri = -(-n // lungime_bloc)
+    ordine = np.argsort(rng.random((n_res, n_blocuri)), axis=1)
+    idx = (ordine[:, :, None] * lungime_bloc + np.arange(lungime_bloc)).reshape(n_res, -1)
+    return idx[idx < n].reshape(n_res, n)
+
+
+def matrice_ponderi(indici, n_t, ponderi=None):
+    """W (n_res × n_t): W[r, u] = Σ ponderile pozițiilor t pentru care indici[r, t] = u."""
+    n_res = indici.shape[0]
+    ponderi = np.ones(indici.shape[1]) if ponderi is None else ponderi
+    plat = (np.arange(n_res)[:, None] * n_t + indici).ravel()
+    return np.bincount(plat, weights=np.broadcast_to(ponderi, indici.shape).ravel(),
+                       minlength=n_res * n_t).reshape(n_res, n_t)
+
+
+def _medii(valori, prezent, w):
+    """Mediile ponderate cu W pentru toate seriile: (serii × n_res)."""
+    with np.errstate(all="ignore"):
+        return (valori @ w.T) / (prezent @ w.T)
+
+
+# ─── 2. Sarcini (rulate în procese) ──────────────────────────────────────────
+def _sarcina_diferenta(seed, n_res, valori, prezent, poz_a, poz_b, lungime_bloc):
+    """Bootstrap separat în fiecare perioadă + permutare pe blocuri între perioade."""
+    rng = np.random.default_rng(seed)
+    n_t = valori.shape[1]
+
+    def in_perioada(poz):
+        return matrice_ponderi(poz[indici_bloc(rng, n_res, poz.size, lungime_bloc)], n_t)
+
+    boot = _medii(valori, prezent, in_perioada(poz_b)) - _medii(valori, prezent, in_perioada(poz_a))
+
+    comun = np.concatenate([poz_a, poz_b])
+    amestec = comun[permutari_bloc(rng, n_res, comun.size, lungime_bloc)]
+    perm = (_medii(valori, prezent, matrice_ponderi(amestec[:, poz_a.size:], n_t))
+            - _medii(valori, prezent, matrice_ponderi(amestec[:, :poz_a.size], n_t)))
+    return boot, perm
+
+
+def _sarcina_panta(seed, n_res, reziduuri, ponderi_panta, lungime_bloc):
+    """Pante bootstrap = panta estimată + panta reziduurilor reeșantionate."""
+    rng = np.random.default_rng(seed)
+    n_t = reziduuri.shape[1]
+    w = matrice_ponderi(indici_bloc(rng, n_res, n_t, lungime_bloc), n_t, ponderi_panta)
+    return reziduuri @ w.T
+
+
+def _ruleaza(sarcina, n_res, seed, procese, *argumente):
+    """Împarte reeșantionările pe sarcini cu semințe independente și le concatenează."""
+    marimi = [min(REESANTIONARI_PE_SARCINA, n_res - k) for k in range(0, n_res, REESANTIONARI_PE_SARCINA)]
+    seminte = np.random.SeedSequence(seed).spawn(len(marimi))
+    if procese == 1:
+        rezultate = [sarcina(s, m, *argumente) for s, m in zip(seminte, marimi)]
+    else:
+        with ProcessPoolExecutor(max_workers=procese) as executor:
+            viitoare = [executor.submit(sarcina, s, m, *argumente) for s, m in zip(seminte, marimi)]
+            rezultate = [v.result() for v in viitoare]
+    if isinstance(rezultate[0], tuple):
+        return tuple(np.concatenate(parti, axis=1) for parti in zip(*rezultate))
+    return np.concatenate(rezultate, axis=1)
+
+
+def _interval(distributie, nivel):
+    coada = (1 - nivel) / 2 * 100
+    with np.errstate(all="ignore"):
+        return np.nanpercentile(distributie, [coada, 100 - coada], axis=1)
+
+
+# ─── 3. Interfață ────────────────────────────────────────────────────────────
+@cronometrat()
+def ic_diferenta(valori, in_a, in_b, n_res=N_REESANTIONARI, lungime_bloc=LUNGIME_BLOC,
+                 nivel=NIVEL, seed=SEED, procese=None):
+    """Diferența mediilor (perioada B − perioada A) cu IC bootstrap și p de permutare.
+
+    `valori` este (serii × timp), cu NaN pentru lipsă; `in_a`, `in_b` sunt măști
+    booleene pe axa timpului. Întoarce un dict de tablouri (câte o valoare pe serie):
+    diferenta, ic_inf, ic_sup, p_permutare.
+    """
+    valori = np.atleast_2d(np.asarray(valori, dtype=float))
+    prezent = (~np.isnan(valori)).astype(float)
+    curat = np.where(prezent > 0, valori, 0.0)
+    poz_a, poz_b = np.flatnonzero(in_a), np.flatnonzero(in_b)
+
+    with np.errstate(all="ignore"):
+        diferenta = np.nanmean(valori[:, poz_b], axis=1) - np.nanmean(valori[:, poz_a], axis=1)
+    boot, perm = _ruleaza(_sarcina_diferenta, n_res, seed, procese,
+                          curat, prezent, poz_a, poz_b, lungime_bloc)
+    inf, sup = _interval(boot, nivel)
+    depasiri = (np.abs(perm) >= np.abs(diferenta)[:, None]).sum(axis=1)
+    return {"diferenta": diferenta, "ic_inf": inf, "ic_sup": sup,
+            "p_permutare": (depasiri + 1) / (n_res + 1)}
+
+
+@cronometrat()
+def ic_panta(valori, x=None, n_res=N_REESANTIONARI, lungime_bloc=LUNGIME_BLOC,
+             nivel=NIVEL, seed=SEED, procese=None):
+    """Panta OLS cu IC bootstrap pe blocuri de reziduuri.
+
+    Lunile lipsă contribuie cu reziduu 0 (valoarea de pe dreapta de trend).
+    Întoarce un dict de tablouri: panta, ic_inf, ic_sup.
+    """
+    valori = np.atleast_2d(np.asarray(valori, dtype=float))
+    n_t = valori.shape[1]
+    x = np.arange(n_t, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    prezent = ~np.isnan(valori)
+    with np.errstate(all="ignore"):
+        xv = np.where(prezent, x, np.nan)
+        dx = xv - np.nanmean(xv, axis=1, keepdims=True)
+        panta = np.nansum(dx * (valori - np.nanmean(valori, axis=1, keepdims=True)), axis=1) \
+            / np.nansum(dx**2, axis=1)
+        interceptie = np.nanmean(valori, axis=1) - panta * np.nanmean(xv, axis=1)
+    reziduuri = np.where(prezent, valori - (panta[:, None] * x + interceptie[:, None]), 0.0)
+
+    ponderi_panta = (x - x.mean()) / ((x - x.mean()) ** 2).sum()
+    boot = panta[:, None] + _ruleaza(_sarcina_panta, n_res, seed, procese,
+                                     reziduuri, ponderi_panta, lungime_bloc)
+    inf, sup = _interval(boot, nivel)
+    return {"panta": panta, "ic_inf": inf, "ic_sup": sup}
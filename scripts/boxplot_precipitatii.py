@@ -16,6 +16,9 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+from bootstrap import ic_diferenta
+
 # ────────────────── 1. fişiere ───────────────────────────────────────────────
 HERE   = Path(__file__).resolve().parent
 FILE_A = HERE / "Temperatura-precipitatii_1961-1990.xlsx"
@@ -28,7 +31,7 @@ for f in (FILE_A, FILE_B):
 # ────────────────── 2. funcţie extragere precipitaţii ────────────────────────
 def extract_precip(path: Path) -> np.ndarray:
     """Returnează vectorul precipitaţiilor anuale (Σ P) din fişier."""
-    df  = pd.read_excel(path, engine="openpyxl")
+    df  = citeste_excel(path, engine="openpyxl")
     # prima coloană drept index (indiferent de antet)
     df  = df.set_index(df.columns[0])
     ser = pd.to_numeric(df.iloc[1], errors="coerce")   # rând 1 = Σ P
@@ -37,6 +40,13 @@ def extract_precip(path: Path) -> np.ndarray:
 prec_1961_1990 = extract_precip(FILE_A)
 prec_1991_2020 = extract_precip(FILE_B)
 
+# diferența mediilor cu IC bootstrap (blocuri de 3 ani) și test de permutare
+serie = np.concatenate([prec_1961_1990, prec_1991_2020])
+in_b  = np.arange(serie.size) >= prec_1961_1990.size
+ic = ic_diferenta(serie, ~in_b, in_b, lungime_bloc=3, procese=1)
+delta, ic_inf, ic_sup, p_perm = (ic[k][0] for k in ("diferenta", "ic_inf", "ic_sup", "p_permutare"))
+print(f"Δ P (1991-2020 − 1961-1990) = {delta:+.1f} mm [IC95%: {ic_inf:+.1f}; {ic_sup:+.1f}], p = {p_perm:.3f}")
+
 # ────────────────── 3. box-plot ──────────────────────────────────────────────
 fig, ax = plt.subplots(figsize=(10, 6))
 
@@ -57,7 +67,8 @@ for median in box["medians"]:
     median.set(color="yellow", linewidth=2)
 
 ax.set_ylabel("Precipitaţii Medii Anuale (mm)")
-ax.set_title("Distribuţia Precipitaţiilor Medii Anuale\n(1961-1990 vs. 1991-2020)",
+ax.set_title("Distribuţia Precipitaţiilor Medii Anuale\n(1961-1990 vs. 1991-2020)\n"
+             f"Δ medie = {delta:+.1f} mm [IC95%: {ic_inf:+.1f}; {ic_sup:+.1f}], p = {p_perm:.3f}",
              fontsize=13, fontweight="bold")
 ax.grid(axis="y", linestyle=":", linewidth=0.5, alpha=0.6)
 
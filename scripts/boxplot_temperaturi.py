@@ -19,6 +19,8 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+
 # ───────── 1. fișierele Excel (în același folder) ───────────────────────────
 HERE   = Path(__file__).resolve().parent
 FILE_A = HERE / "Temperatura-precipitatii_1961-1990.xlsx"
@@ -34,7 +36,7 @@ def extract_temp(path: Path) -> np.ndarray:
     Returnează vectorul temperaturilor medii anuale pentru fișierul dat.
     Presupunem că rândul 0 = T medie, conform fișierelor precedente.
     """
-    df  = pd.read_excel(path, engine="openpyxl")
+    df  = citeste_excel(path, engine="openpyxl")
     df  = df.set_index(df.columns[0])              # prima coloană drept index
     ser = pd.to_numeric(df.iloc[0], errors="coerce")  # rând 0 = T medie
     return ser.dropna().values
@@ -1,69 +1,84 @@
-import pandas as pd
-import numpy as np
-from scipy.stats import gamma, pearson3, norm
-from scipy.ndimage import uniform_filter1d
+from acces_date import citeste_excel
+from etp import adauga_etp, adauga_etp_ansamblu, METODE_ETP
+from motor_spi_spei import spi_spei_3, spei_ansamblu, SCARI_STANDARD, DepozitParametri
+from paralel_spi_spei import spi_spei_3_paralel
+from actualizare_spi_spei import stare_din_istoric, scrie_stare, STARE_FILE, REZULTATE_FILE
 
 INPUT_FILE = "Date-climatologice-6statii-3Temp-Prec.xlsx"
 OUTPUT_FILE = "Rezultate_SPI3_SPEI3_6statii.xlsx"
 
-# 1. Citește datele climatologice
-df = pd.read_excel(INPUT_FILE)
-df.columns = df.columns.str.strip()
+# Mod istoric: reproduce exact rezultatele publicate (OUTPUT_FILE din data/, păstrat
+# ca referință a lucrării) – Ra din tabelul pentru ~45° N, serii doar din lunile
+# prezente (ferestrele trec peste 2014), gamma cu loc liber prin "mle". Implicit
+# (False): Ra din latitudinea fiecărei stații, calendar complet cu lunile lipsă NaN
+# și gamma cu loc = 0 – SPI-3 / SPEI-3 diferă puțin de fișierul publicat
+ISTORIC = False
 
-# 2. Adaugă Ra (radiație solară extraterestră medie lunară pentru ~45° lat N)
-ra_month = {
-    1: 8.4, 2: 10.5, 3: 13.1, 4: 15.2, 5: 16.5, 6: 17.1,
-    7: 17.0, 8: 15.9, 9: 13.4, 10: 10.8, 11: 8.8, 12: 7.7
-}
-df["Ra"] = df["Luna_numeric"].map(ra_month)
+# Ra din latitudinea fiecărei stații (False) sau tabelul istoric pentru ~45° N (True)
+RA_TABEL_ISTORIC = ISTORIC
 
-# 3. Calculează ETP prin metoda Hargreaves
-df["ETP"] = (
-    0.0023 * df["Ra"] *
-    np.sqrt(np.maximum(0, df["tmax_med"] - df["tmin_med"])) *
-    (df["tmed_med"] + 17.8)
-)
+# Formula ETP pentru SPEI: "hargreaves" (varianta lucrării), "thornthwaite" sau "penman-monteith"
+METODA_ETP = "hargreaves"
 
-# 4. Funcții SPI și SPEI cu standardizare statistică
-def compute_spi_3(series):
-    smoothed = uniform_filter1d(series, size=3, mode='nearest')
-    shape, loc, scale = gamma.fit(smoothed[~np.isnan(smoothed)])
-    cdf = gamma.cdf(smoothed, shape, loc=loc, scale=scale)
-    spi = norm.ppf(np.clip(cdf, 1e-6, 1 - 1e-6))  # transformare normală
-    return spi
+# Metoda de ajustare a distribuțiilor: "mle" (scipy .fit) sau "lmom" (L-momente, vectorizat);
+# modul ISTORIC cere "mle"
+METODA_AJUSTARE = "mle"
 
-def compute_spei_3(deficit):
-    smoothed = uniform_filter1d(deficit, size=3, mode='nearest')
-    shape, loc, scale = pearson3.fit(smoothed[~np.isnan(smoothed)])
-    cdf = pearson3.cdf(smoothed, shape, loc=loc, scale=scale)
-    spei = norm.ppf(np.clip(cdf, 1e-6, 1 - 1e-6))
-    return spei
+# Procese pentru SPI-3 / SPEI-3: 1 = procesul curent; >1 sau None (toate nucleele) =
+# stațiile împărțite pe procese, cu date în memorie partajată (paralel_spi_spei.py)
+PROCESE = 1
 
-# 5. Parcurge fiecare stație
-rezultate = []
+# Mod multi-scară: SPI/SPEI la 1, 3, 6, 9, 12, 24 luni într-un singur tabel lat;
+# pregătește și starea pentru actualizarea incrementală (actualizare_spi_spei.py).
+# Atenție: ieșirea principală (OUTPUT_FILE) rămâne SPI-3 / SPEI-3 în definiția
+# lucrării – netezire centrată pe 3 luni și o singură ajustare pe toată seria.
+# SPI-3 / SPEI-3 din modul multi-scară folosesc definiția standard (fereastră
+# terminată în luna curentă, ajustare pe luni calendaristice), deci valorile celor
+# două fișiere diferă. În ambele, SPI folosește gamma cu loc = 0 și probabilitate
+# de zero – același model pentru "mle" și "lmom" (lucrarea și ISTORIC: loc liber).
+MULTISCARA = False
+OUTPUT_FILE_MULTISCARA = "Rezultate_SPI_SPEI_multiscara_6statii.xlsx"
+PARAM_FILE = "Parametri_SPI_SPEI_6statii.csv"   # parametri ajustați pe luni calendaristice
 
-for statie in df["Statie"].unique():
-    df_st = df[df["Statie"] == statie].copy()
-    df_st = df_st.sort_values(["An_numeric", "Luna_numeric"]).reset_index(drop=True)
+# Ansamblu de sensibilitate: SPEI multi-scară cu fiecare formulă ETP (SPI comun)
+ANSAMBLU_ETP = False
+OUTPUT_FILE_ANSAMBLU = "Rezultate_SPEI_ansamblu_ETP_6statii.xlsx"
 
-    precip = df_st["precip_total"].values
-    etp = df_st["ETP"].values
-    deficit = precip - etp
+# 1. Citește datele climatologice
+df = citeste_excel(INPUT_FILE)
+df.columns = df.columns.str.strip()
 
-    spi_vals = compute_spi_3(precip)
-    spei_vals = compute_spei_3(deficit)
+# 2. Adaugă Ra (radiație solară extraterestră) și ETP după METODA_ETP (vezi etp.py)
+adauga_etp(df, ra_tabel=RA_TABEL_ISTORIC, metoda=METODA_ETP)
 
-    for i in range(len(df_st)):
-        rezultate.append({
-            "Statie": statie,
-            "An": int(df_st.loc[i, "An_numeric"]),
-            "Luna": int(df_st.loc[i, "Luna_numeric"]),
-            "SPI-3": round(spi_vals[i], 3),
-            "SPEI-3": round(spei_vals[i], 3)
-        })
+# 3. SPI-3 și SPEI-3 pentru toate stațiile într-o singură trecere (vezi motor_spi_spei.py)
+if PROCESE == 1:
+    df_out = spi_spei_3(df, metoda=METODA_AJUSTARE, istoric=ISTORIC)
+else:
+    df_out = spi_spei_3_paralel(df, metoda=METODA_AJUSTARE, procese=PROCESE, istoric=ISTORIC)
 
-# 6. Export în Excel
-df_out = pd.DataFrame(rezultate)
+# 4. Export în Excel
 df_out.to_excel(OUTPUT_FILE, index=False)
 
 print(f"✅ Calcul SPI-3 și SPEI-3 a fost finalizat și salvat în fișierul: {OUTPUT_FILE}")
+
+# 5. Opțional: toate scările standard, dintr-o singură trecere
+#    (parametrii deja ajustați se refolosesc din PARAM_FILE doar pentru aceeași
+#    variantă ETP și aceleași date de referință – altfel se reajustează)
+if MULTISCARA:
+    depozit = DepozitParametri(PARAM_FILE)
+    df_multi, stare = stare_din_istoric(df, SCARI_STANDARD, depozit=depozit, metoda=METODA_AJUSTARE,
+                                        metoda_etp=METODA_ETP, ra_tabel=RA_TABEL_ISTORIC)
+    depozit.scrie()
+    scrie_stare(stare, STARE_FILE)
+    df_multi.to_csv(REZULTATE_FILE, index=False)
+    df_multi.to_excel(OUTPUT_FILE_MULTISCARA, index=False)
+    print(f"✅ SPI/SPEI multi-scară {SCARI_STANDARD} salvat în fișierul: {OUTPUT_FILE_MULTISCARA}")
+
+# 6. Opțional: SPEI cu toate formulele ETP, dintr-o singură pivotare a datelor
+if ANSAMBLU_ETP:
+    coloane = adauga_etp_ansamblu(df, METODE_ETP, ra_tabel=RA_TABEL_ISTORIC)
+    df_ans = spei_ansamblu(df, {f"SPEI_{m}": c for m, c in coloane.items()}, SCARI_STANDARD,
+                           metoda=METODA_AJUSTARE)
+    df_ans.to_excel(OUTPUT_FILE_ANSAMBLU, index=False)
+    print(f"✅ Ansamblu SPEI ({', '.join(coloane)}) salvat în fișierul: {OUTPUT_FILE_ANSAMBLU}")
@@ -0,0 +1,100 @@
+"""
+Calendarul climatic comun: anotimpuri, sezoane extinse și perioade climatologice
+
+Atribuirea se face prin tabele de căutare NumPy indexate direct cu numărul
+lunii (1…12) sau cu anul, deci o coloană întreagă se clasifică într-o singură
+indexare, iar rezultatul sunt coduri întregi (-1 = în afara oricărei clase):
+   • anotimpuri: Iarnă (DJF), Primăvară (MAM), Vară (JJA), Toamnă (SON)
+   • sezoane extinse: rece (octombrie–martie) și cald (aprilie–septembrie),
+     ca în sezon_rece_extins_baragan.py / sezon_cald_extins_baragan.py
+   • semestre: cald (aprilie–septembrie) și rece (noiembrie–martie), ca în
+     spi_spei_semestru_cald.py / spi_spei_semestru_rece.py (octombrie rămâne
+     în afara lor)
+   • perioade climatologice: 1961–1990 și 1991–2020
+Anul sezonier atribuie decembrie iernii anului următor (DJF 1990/91 → 1991),
+octombrie–decembrie sezonului rece extins al anului următor, iar
+noiembrie–decembrie semestrului rece al anului următor.
+Agregările pe (an sezonier, sezon) sunt un singur np.bincount.
+"""
+
+import numpy as np
+import pandas as pd
+
+ANOTIMPURI = ("Iarnă", "Primăvară", "Vară", "Toamnă")
+SEZOANE_EXTINSE = ("Rece extins", "Cald extins")
+SEMESTRE = ("Semestru cald", "Semestru rece")
+PERIOADE = ("1961–1990", "1991–2020")
+LIMITE_PERIOADE = (1961, 1991, 2021)      # începutul fiecărei perioade + sfârșitul ultimei
+
+# indexate cu luna 1…12 (poziția 0 nu este folosită)
+COD_ANOTIMP = np.array([-1, 0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0], dtype=np.int8)
+COD_SEZON_EXTINS = np.array([-1, 0, 0, 0, 1, 1, 1, 1, 1, 1, 0, 0, 0], dtype=np.int8)
+COD_SEMESTRU = np.array([-1, 1, 1, 1, 0, 0, 0, 0, 0, 0, -1, 1, 1], dtype=np.int8)
+# luni atribuite anului sezonier următor
+DECALAJ_ANOTIMP = np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1], dtype=np.int64)
+DECALAJ_SEZON_EXTINS = np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1, 1], dtype=np.int64)
+DECALAJ_SEMESTRU = np.array([0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 1], dtype=np.int64)
+
+_CLASIFICARI = {
+    "anotimp": (COD_ANOTIMP, DECALAJ_ANOTIMP, ANOTIMPURI),
+    "sezon_extins": (COD_SEZON_EXTINS, DECALAJ_SEZON_EXTINS, SEZOANE_EXTINSE),
+    "semestru": (COD_SEMESTRU, DECALAJ_SEMESTRU, SEMESTRE),
+}
+
+
+def _clasificare(tip):
+    if tip not in _CLASIFICARI:
+        raise ValueError(f"Clasificare necunoscută: {tip!r} (disponibile: {', '.join(_CLASIFICARI)})")
+    return _CLASIFICARI[tip]
+
+
+# ─── 1. Coduri ───────────────────────────────────────────────────────────────
+def cod_sezon(luna, tip="anotimp"):
+    """Codul sezonului pentru fiecare lună (1…12), după ordinea din ANOTIMPURI / SEZOANE_EXTINSE / SEMESTRE."""
+    return _clasificare(tip)[0][np.asarray(luna, dtype=np.int64)]
+
+
+def an_sezonier(an, luna, tip="anotimp"):
+    """Anul căruia îi aparține sezonul lunii (decembrie → iarna anului următor)."""
+    return np.asarray(an, dtype=np.int64) + _clasificare(tip)[1][np.asarray(luna, dtype=np.int64)]
+
+
+def cod_perioada(an, limite=LIMITE_PERIOADE):
+    """Indicele perioadei climatologice (0 = 1961–1990, 1 = 1991–2020; -1 în afara lor)."""
+    limite = np.asarray(limite)
+    cod = np.searchsorted(limite, np.asarray(an), side="right") - 1
+    return np.where((cod >= 0) & (cod < limite.size - 1), cod, -1).astype(np.int8)
+
+
+# ─── 2. Categorii pandas ─────────────────────────────────────────────────────
+def sezon(luna, tip="anotimp"):
+    """pd.Categorical cu numele sezonului, în ordinea calendaristică a claselor."""
+    return pd.Categorical.from_codes(cod_sezon(luna, tip), _clasificare(tip)[2])
+
+
+def perioada(an, limite=LIMITE_PERIOADE, etichete=PERIOADE):
+    """pd.Categorical cu perioada climatologică (NaN în afara perioadelor)."""
+    return pd.Categorical.from_codes(cod_perioada(an, limite), list(etichete), ordered=True)
+
+
+# ─── 3. Agregări pe (an sezonier, sezon) ─────────────────────────────────────
+def agrega_sezonier(valori, an, luna, tip="anotimp"):
+    """Sume, număr de valori și medii pe (an sezonier × sezon).
+
+    Întoarce (ani, suma, numar, medie); tablourile au forma (ani × sezoane),
+    iar valorile NaN și lunile din afara oricărei clase sunt ignorate.
+    """
+    valori = np.asarray(valori, dtype=float)
+    cod = cod_sezon(luna, tip).astype(np.int64)
+    ani_s = an_sezonier(an, luna, tip)
+    an0 = ani_s.min()
+    n_ani, n_sez = ani_s.max() - an0 + 1, len(_clasificare(tip)[2])
+
+    cheie = (ani_s - an0) * n_sez + cod
+    prezent = ~np.isnan(valori) & (cod >= 0)         # lunile din afara claselor (octombrie la semestre)
+    suma = np.bincount(cheie[prezent], weights=valori[prezent], minlength=n_ani * n_sez)
+    numar = np.bincount(cheie[prezent], minlength=n_ani * n_sez)
+    with np.errstate(all="ignore"):
+        medie = suma / numar
+    forma = (n_ani, n_sez)
+    return np.arange(an0, an0 + n_ani), suma.reshape(forma), numar.reshape(forma), medie.reshape(forma)
@@ -1,34 +1,19 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
-import seaborn as sns
 import matplotlib.patches as mpatches
 
+from acces_date import citeste_excel
+from hellmann import clasa_modala, coduri, deseneaza_calendar, etichete_schema
+
 # 1. Încarcă datele
-df = pd.read_excel("Date-statii-precipitatii.xlsx")
+df = citeste_excel("Date-6statii-precipitatii.xlsx")
 df.rename(columns={"An_numeric": "An", "Luna_numeric": "Luna"}, inplace=True)
 
-# 2. Clasificare Hellmann
-def clasificare_hellmann(p):
-    if p < 5:
-        return "Excesiv secetoasă"
-    elif p < 10:
-        return "Secetoasă"
-    elif p < 20:
-        return "Moderat secetoasă"
-    elif p < 40:
-        return "Normală"
-    elif p < 60:
-        return "Umedă"
-    elif p < 100:
-        return "Foarte umedă"
-    else:
-        return "Excesiv umedă"
-
-df["Clasa_Hellmann"] = df["precip_total"].apply(clasificare_hellmann)
+# 2. Clasificare Hellmann (coduri 0…6, -1 = lipsă)
+df["Cod_Hellmann"] = coduri(df["precip_total"], "7 clase")
 
 # 3. Ordine și paletă roșu-albastru
-ordine = ["Excesiv secetoasă", "Secetoasă", "Moderat secetoasă", "Normală",
-          "Umedă", "Foarte umedă", "Excesiv umedă"]
+ordine = etichete_schema("7 clase")
 culori = {
     "Excesiv secetoasă": "#7f0000",
     "Secetoasă": "#d7301f",
@@ -39,28 +24,14 @@ culori = {
     "Excesiv umedă": "#313695"
 }
 
-# 4. Grupare și pivotare
-pivot = df.pivot_table(
-    index="An",
-    columns="Luna",
-    values="Clasa_Hellmann",
-    aggfunc=lambda x: x.mode().iloc[0] if not x.mode().empty else None
-)
-pivot = pivot[sorted(pivot.columns)]
+# 4. Clasa modală pe (an, lună) peste cele 6 stații; la egalitate câștigă
+#    eticheta prima în ordine alfabetică, ca în varianta publicată (Series.mode)
+ani, grila = clasa_modala(df["Cod_Hellmann"], df["An"], df["Luna"], len(ordine),
+                          prioritate=np.argsort(ordine))
 
-# 5. Heatmap categoric
-cmap = [culori[c] for c in ordine]
-lut = dict(zip(ordine, cmap))
-heatmap_data = pivot.replace(lut)
-
-plt.figure(figsize=(10, 12))
-sns.heatmap(
-    heatmap_data.applymap(lambda x: list(lut.values()).index(x) if x in lut.values() else None),
-    cmap=cmap,
-    cbar=False,
-    linewidths=0.2,
-    linecolor='white'
-)
+# 5. Heatmap categoric (anii fără date rămân albi)
+fig, ax = plt.subplots(figsize=(10, 12))
+deseneaza_calendar(ax, ani, grila, [culori[c] for c in ordine])
 
 plt.title("Calendar Hellmann al secetei și umidității în Câmpia Bărăganului (1961–2020)", fontsize=13)
 plt.xlabel("Lună")
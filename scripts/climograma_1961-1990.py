@@ -11,13 +11,15 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+from acces_date import citeste_excel
+
 # === 1. Citire date ==========================================
 HERE = Path(__file__).resolve().parent
 EXCEL = HERE / "Temperatura-precipitatii_1961-1990.xlsx"
 if not EXCEL.exists():
     raise FileNotFoundError(f"Fișierul {EXCEL.name} nu a fost găsit în {HERE}")
 
-df_raw = pd.read_excel(EXCEL, engine="openpyxl")
+df_raw = citeste_excel(EXCEL, engine="openpyxl")
 firstcol = df_raw.columns[0]
 df = df_raw.set_index(firstcol).apply(pd.to_numeric, errors="coerce")
 
@@ -3,7 +3,7 @@
 Climogramă anuală 1991-2020
 – bare precipitaţii (#5bc0de) | axă dreapta: 0-800 mm
 – linie temperatură  (#d9534f) | axă stânga : 9.5-14 °C
-– 2014: lipseşte → NaN ⇒ bară omisă + linie întreruptă + etichetă
+– ani fără date → NaN ⇒ bară omisă + linie întreruptă + etichetă (lipsa_date.py)
 """
 
 from pathlib import Path
@@ -12,17 +12,20 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+from acces_date import citeste_excel
+from lipsa_date import adnoteaza_lipsuri
+
 HERE  = Path(__file__).resolve().parent
 EXCEL = HERE / "Temperatura-precipitatii_1991-2020.xlsx"
 if not EXCEL.exists():
     sys.exit(f"{EXCEL.name} nu a fost găsit în {HERE}")
 
 # 1. Citire flexibilă (prima coloană devine index)
-df_raw   = pd.read_excel(EXCEL, engine="openpyxl")
+df_raw   = citeste_excel(EXCEL, engine="openpyxl")
 firstcol = df_raw.columns[0]
 df       = df_raw.set_index(firstcol).apply(pd.to_numeric, errors="coerce")
 
-years = df.columns.astype(int)      # 1991 … 2020 (include 2014)
+years = df.columns.astype(int)      # 1991 … 2020
 temp  = df.iloc[0].values
 prec  = df.iloc[1].values
 
@@ -44,12 +47,8 @@ ax_t.plot(years, temp,
 ax_t.set_ylim(9.5, 14)
 ax_p.set_ylim(0, 800)
 
-# 4. Etichetă pentru anul 2014 (lipsă date)
-if 2014 in years:
-    idx = np.where(years == 2014)[0][0]
-    ax_p.text(years[idx], ax_p.get_ylim()[1]*0.94,
-              "(2014 – lipsă date)",
-              ha="center", va="top", rotation=90, fontsize=9)
+# 4. Etichetă pentru anii fără date
+adnoteaza_lipsuri(ax_p, years, ~(np.isnan(temp) & np.isnan(prec)))
 
 # 5. Estetică
 ax_t.set_xlabel("An")
@@ -2,6 +2,7 @@
 """
 Climogramă combinată – Câmpia Bărăganului (1961-2020)
 Temperatură (stânga) + Precipitaţii (dreapta) + Trend liniar OLS & Sen-Theil
+(ambele serii într-un singur apel tendinte(), vezi tendinte.py)
 """
 
 from pathlib import Path
@@ -9,8 +10,10 @@ import sys
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
-from scipy.stats import linregress          # pip install scipy
-import pymannkendall as mk                  # pip install pymannkendall
+
+from acces_date import citeste_excel
+from lipsa_date import adnoteaza_lipsuri
+from tendinte import tendinte
 
 # ─── 1. Fişiere ──────────────────────────────────────────────────────────────
 HERE   = Path(__file__).resolve().parent
@@ -22,7 +25,7 @@ for f in (FILE_A, FILE_B):
 
 # ─── 2. Funcţie citire ───────────────────────────────────────────────────────
 def load(path: Path):
-    df = pd.read_excel(path, engine="openpyxl")
+    df = citeste_excel(path, engine="openpyxl")
     df = df.set_index(df.columns[0]).apply(pd.to_numeric, errors="coerce")
     years = df.columns.astype(int)
     temp  = df.iloc[0].values
@@ -40,19 +43,10 @@ ord_ = np.argsort(years)
 years, temp, prec = years[ord_], temp[ord_], prec[ord_]
 
 # ─── 3. Trend OLS + Sen-Theil ────────────────────────────────────────────────
-def ols(x, y):
-    mask = ~np.isnan(y)
-    res  = linregress(x[mask], y[mask])
-    return res, res.slope * x + res.intercept
-
-def sen(y):
-    mask = ~np.isnan(y)
-    return mk.sens_slope(y[mask]).slope     # numai seria, fără x
-
-ols_t, t_fit = ols(years, temp)
-ols_p, p_fit = ols(years, prec)
-sen_t = sen(temp)
-sen_p = sen(prec)
+trend = tendinte(np.vstack([temp, prec]), years)
+t_fit, p_fit = trend["ols"][:, None] * years + trend["interceptie_ols"][:, None]
+(ols_t, ols_p), (pval_t, pval_p) = trend["ols"], trend["p_ols"]
+sen_t, sen_p = trend["sen"]
 
 # ─── 4. Figură ───────────────────────────────────────────────────────────────
 fig, ax_t = plt.subplots(figsize=(13,6))          # T = axa stânga
@@ -70,16 +64,19 @@ ax_t.plot(years, temp, ls="--", marker="o", lw=2.2,
 
 # trenduri punctate
 ax_t.plot(years, t_fit, ls=":", lw=2, color="firebrick", zorder=4,
-          label=f"Trend T: {ols_t.slope*10:+.2f}°C/dec, p={ols_t.pvalue:.3f}; "
+          label=f"Trend T: {ols_t*10:+.2f}°C/dec, p={pval_t:.3f}; "
                 f"Sen={sen_t*10:+.2f}°C/dec")
 ax_p.plot(years, p_fit, ls=":", lw=2, color="navy", zorder=4,
-          label=f"Trend P: {ols_p.slope:+.1f} mm/an, p={ols_p.pvalue:.3f}; "
+          label=f"Trend P: {ols_p:+.1f} mm/an, p={pval_p:.3f}; "
                 f"Sen={sen_p:+.1f} mm/an")
 
 # scări
 ax_t.set_ylim(9.5, 14)
 ax_p.set_ylim(0, 800)
 
+# ani fără date
+adnoteaza_lipsuri(ax_p, years, ~(np.isnan(temp) & np.isnan(prec)))
+
 # etichete, stil
 ax_t.set_xlabel("Ani")
 ax_t.set_ylabel("Temperatura medie anuală (°C)", color="#d9534f")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Generarea tuturor figurilor lucrării, în paralel, fără interfață grafică
+
+   • descoperă scripturile de figuri (cele care apelează savefig) din acest director
+   • le rulează în procese separate, cu backend-ul Agg (plt.show() nu mai blochează)
+   • fiecare proces importă o singură dată matplotlib/seaborn/pandas, iar
+     registrele Excel rămân în memoria procesului (vezi acces_date.py)
+   • la final afișează timpul fiecărei figuri
+   • cu INSTRUMENTARE=1, fiecare figură își scrie traseul de etape (vezi instrumentare.py)
+
+Rulare (din directorul cu registrele Excel):
+    python ../scripts/construieste_figuri.py
+    python ../scripts/construieste_figuri.py -j 4 spi_spei hellmann
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+import traceback
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from instrumentare import sesiune
+
+DIR_SCRIPTURI = Path(__file__).resolve().parent
+
+# Scripturi cu linie de comandă: fără -o ar deschide fereastra interactivă
+ARGUMENTE = {
+    "diagrama_walter_lieth_1961-1990.py": ["-o", "diagrama_walter_lieth_1961-1990.png"],
+    "diagrama_walter_lieth_1991-2020.py": ["-o", "diagrama_walter_lieth_1991-2020.png"],
+}
+
+# ─── 1. Descoperire ──────────────────────────────────────────────────────────
+def descopera_figuri(filtre=()):
+    """Scripturile care salvează cel puțin o figură, opțional filtrate după nume."""
+    figuri = []
+    for cale in sorted(DIR_SCRIPTURI.glob("*.py")):
+        if cale.name == Path(__file__).name:
+            continue
+        if "savefig(" not in cale.read_text(encoding="utf-8"):
+            continue
+        if filtre and not any(f in cale.stem for f in filtre):
+            continue
+        figuri.append(cale)
+    return figuri
+
+
+# ─── 2. Proces de lucru ──────────────────────────────────────────────────────
+def _initializeaza(director_date):
+    os.environ["MPLBACKEND"] = "Agg"
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot  # noqa: F401  (import unic per proces)
+    warnings.filterwarnings("ignore", message=".*non-interactive.*")
+    sys.path.insert(0, str(DIR_SCRIPTURI))
+    os.chdir(director_date)
+
+
+def randeaza(cale_script, director_date):
+    """Execută un script de figură; întoarce (nume, secunde, eroare, pid)."""
+    import matplotlib.pyplot as plt
+
+    cale_script = Path(cale_script)
+    argv_vechi = sys.argv
+    sys.argv = [cale_script.name] + ARGUMENTE.get(cale_script.name, [])
+    # __file__ indică directorul de date: scripturile care caută registrele
+    # „lângă script” (Path(__file__).parent) le găsesc astfel acolo.
+    spatiu = {"__name__": "__main__", "__file__": str(Path(director_date) / cale_script.name)}
+    eroare = None
+    t0 = time.perf_counter()
+    try:
+        cod = compile(cale_script.read_text(encoding="utf-8"), str(cale_script), "exec")
+        with redirect_stdout(io.StringIO()), sesiune(cale_script.stem):
+            exec(cod, spatiu)
+    except SystemExit as exc:
+        if exc.code not in (None, 0):
+            eroare = f"SystemExit: {exc.code}"
+    except Exception:
+        eroare = traceback.format_exc(limit=3)
+    finally:
+        sys.argv = argv_vechi
+        plt.close("all")
+    return cale_script.name, time.perf_counter() - t0, eroare, os.getpid()
+
+
+# ─── 3. Rulare și raport ─────────────────────────────────────────────────────
+def construieste(figuri, director_date=".", procese=None):
+    director_date = str(Path(director_date).resolve())
+    rezultate = []
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procese, initializer=_initializeaza,
+                             initargs=(director_date,)) as executor:
+        viitoare = [executor.submit(randeaza, str(f), director_date) for f in figuri]
+        for v in as_completed(viitoare):
+            rezultate.append(v.result())
+            nume, sec, eroare, _ = rezultate[-1]
+            print(f"  {'✘' if eroare else '✔'} {nume} ({sec:.1f} s)")
+    return rezultate, time.perf_counter() - t0
+
+
+def raport(rezultate, durata_totala):
+    print("\nTimp pe figură:")
+    for nume, sec, eroare, pid in sorted(rezultate, key=lambda r: -r[1]):
+        stare = "EROARE" if eroare else "ok"
+        print(f"  {sec:7.2f} s  [{pid}] {stare:6} {nume}")
+    suma = sum(r[1] for r in rezultate)
+    print(f"\nTotal: {len(rezultate)} figuri, {suma:.1f} s de lucru în {durata_totala:.1f} s "
+          f"(accelerare x{suma / durata_totala:.1f})")
+    for nume, _, eroare, _ in rezultate:
+        if eroare:
+            print(f"\n── {nume}\n{eroare}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Generează toate figurile lucrării în paralel")
+    ap.add_argument("filtre", nargs="*", help="doar scripturile al căror nume conține textul dat")
+    ap.add_argument("-d", "--date", default=".", help="directorul cu registrele Excel (implicit: .)")
+    ap.add_argument("-j", "--procese", type=int, default=None, help="număr de procese (implicit: toate nucleele)")
+    args = ap.parse_args()
+
+    figuri = descopera_figuri(args.filtre)
+    if not figuri:
+        sys.exit("Nicio figură găsită")
+    print(f"Generare {len(figuri)} figuri în {args.date} …")
+    rezultate, durata = construieste(figuri, args.date, args.procese)
+    raport(rezultate, durata)
+    if any(r[2] for r in rezultate):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Cub dens (variabilă × stație × an × lună [× zi]) pe disc, citit prin memory-map
+
+Tabelele lungi (Statie, An_numeric, Luna_numeric, …) se scriu o singură dată
+într-un director cu:
+   • valori.npy – tabloul dens, deschis cu np.load(mmap_mode=…)
+   • valid.npy  – masca de validitate (stație × an × lună [× zi]): celulele
+     pentru care există o înregistrare; zilele inexistente (30 februarie) și
+     lunile fără date (2014) sunt False
+   • meta.json  – variabilele, stațiile, primul an, pasul (lunar / zilnic) și
+     atributele variabilelor (de ex. varianta ETP, etp.eticheta_etp)
+Cubul se poate felia fără copiere; doar paginile atinse ajung în RAM, iar
+construirea acceptă tabelul pe bucăți, deci funcționează și pentru mii de
+stații cu date zilnice pe mai multe decenii.
+
+Cub.pivoteaza întoarce același (statii, ani, luni, cub) ca
+motor_spi_spei.pivoteaza, care îl folosește când primește un Cub în locul
+tabelului lung: spi_spei_3, spi_spei_multiscara și spei_ansamblu citesc
+astfel direct cubul lunar, iar lipsa_date.py raportează completitudinea
+din masca cubului. Cubul canonic conține și ETP (varianta implicită
+din etp.py), necesar SPEI; valorile sunt float32.
+
+Rulare (cubul canonic al celor 6 stații):
+    python cub_date.py [director_cub]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from acces_date import citeste_excel
+from etp import adauga_etp, eticheta_etp
+
+DIR_CUB = "cub_6statii"
+VARIABILE_CLIMA = ["precip_total", "tmed_med", "tmin_med", "tmax_med"]
+VARIABILE_CUB = VARIABILE_CLIMA + ["ETP", "hellmann_score_lunar"]
+
+# ─── 1. Cubul deschis ────────────────────────────────────────────────────────
+class Cub:
+    """Tabloul memory-mapped plus indexul stațiilor și variabilelor."""
+
+    def __init__(self, cale, mod="r"):
+        self.cale = Path(cale)
+        meta = json.loads((self.cale / "meta.json").read_text(encoding="utf-8"))
+        self.variabile = meta["variabile"]
+        self.statii = meta["statii"]
+        self.an0 = meta["an0"]
+        self.zilnic = meta["zilnic"]
+        self.atribute = meta.get("atribute", {})
+        self.valori = np.load(self.cale / "valori.npy", mmap_mode=mod)
+        cale_masca = self.cale / "valid.npy"
+        self.masca = np.load(cale_masca, mmap_mode=mod) if cale_masca.exists() else None
+        self._var = {v: i for i, v in enumerate(self.variabile)}
+        self._st = {s: i for i, s in enumerate(self.statii)}
+
+    @property
+    def ani(self):
+        return np.arange(self.an0, self.an0 + self.valori.shape[2])
+
+    def variabila(self, nume):
+        """Felie (statii × ani × 12 [× 31]) – vedere, fără copiere."""
+        return self.valori[self._var[nume]]
+
+    def statie(self, nume, variabila=None):
+        v = slice(None) if variabila is None else self._var[variabila]
+        return self.valori[v, self._st[nume]]
+
+    def index_statii(self, nume):
+        return np.array([self._st[s] for s in nume])
+
+    def valid(self, variabila=None):
+        """Masca de validitate: înregistrare existentă și, pentru o variabilă, valoare non-NaN."""
+        if variabila is None:
+            if self.masca is not None:
+                return np.asarray(self.masca)
+            return ~np.isnan(self.valori).all(axis=0)
+        valid = ~np.isnan(self.variabila(variabila))
+        return valid if self.masca is None else valid & self.masca
+
+    def serie(self, variabila):
+        """Variabila ca (statii × timp), cu timpul lunar/zilnic aplatizat."""
+        v = self.variabila(variabila)
+        return v.reshape(v.shape[0], -1)
+
+    def pivoteaza(self, coloane, complet=True):
+        """Ca motor_spi_spei.pivoteaza: (statii, ani, luni, cub (coloane × statii × timp)).
+
+        Axa timpului merge de la prima la ultima lună cu înregistrări (masca
+        de validitate); celulele fără înregistrare sau cu valoare lipsă sunt
+        NaN. Cu `complet=False` rămân doar lunile cu înregistrări.
+        """
+        if self.zilnic:
+            raise ValueError("Cub.pivoteaza cere un cub lunar")
+        n_st = len(self.statii)
+        are_date = self.valid().reshape(n_st, -1).any(axis=0)
+        if complet:
+            prezente = np.flatnonzero(are_date)
+            timp = np.arange(prezente[0], prezente[-1] + 1)
+        else:
+            timp = np.flatnonzero(are_date)
+        cub = np.stack([np.where(self.valid(c).reshape(n_st, -1)[:, timp], self.serie(c)[:, timp], np.nan)
+                        for c in coloane]).astype(float)
+        timp = timp + self.an0 * 12
+        return np.asarray(self.statii), timp // 12, timp % 12 + 1, cub
+
+
+# ─── 2. Construire ───────────────────────────────────────────────────────────
+def construieste_cub(bucati, cale, variabile, statii, ani, zilnic=False,
+                     statie="Statie", an="An_numeric", luna="Luna_numeric", zi="Zi",
+                     dtype=np.float32, atribute=None):
+    """Scrie cubul din tabele lungi date pe bucăți (orice iterabil de DataFrame-uri).
+
+    Stațiile și intervalul de ani se dau dinainte, ca tabloul să poată fi
+    alocat direct pe disc; celulele fără observații rămân NaN. `atribute`
+    ({variabilă: descriere}) se păstrează în meta.json.
+    """
+    cale = Path(cale)
+    cale.mkdir(parents=True, exist_ok=True)
+    statii = [str(s) for s in statii]
+    an0, an1 = int(ani[0]), int(ani[-1])
+    forma = (len(variabile), len(statii), an1 - an0 + 1, 12) + ((31,) if zilnic else ())
+
+    valori = np.lib.format.open_memmap(cale / "valori.npy", mode="w+", dtype=dtype, shape=forma)
+    valori[:] = np.nan
+    masca = np.lib.format.open_memmap(cale / "valid.npy", mode="w+", dtype=bool, shape=forma[1:])
+    masca[:] = False
+    index_st = pd.Index(statii)
+
+    for df in bucati:
+        i_st = index_st.get_indexer(df[statie].astype(str))
+        if (i_st < 0).any():
+            raise ValueError("Stații necunoscute: "
+                             + ", ".join(sorted(set(df[statie][i_st < 0].astype(str)))))
+        poz = (i_st, df[an].to_numpy(dtype=int) - an0, df[luna].to_numpy(dtype=int) - 1)
+        if zilnic:
+            poz = poz + (df[zi].to_numpy(dtype=int) - 1,)
+        for k, var in enumerate(variabile):
+            valori[(k,) + poz] = df[var].to_numpy(dtype=dtype)
+        masca[poz] = True
+
+    valori.flush()
+    masca.flush()
+    meta = {"variabile": list(variabile), "statii": statii, "an0": an0,
+            "zilnic": zilnic, "dtype": np.dtype(dtype).name, "atribute": dict(atribute or {})}
+    (cale / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=1),
+                                    encoding="utf-8")
+    return Cub(cale)
+
+
+def cub_din_tabel(df, cale, variabile, **optiuni):
+    """Varianta pentru un tabel aflat deja în memorie."""
+    statie = optiuni.get("statie", "Statie")
+    an = optiuni.get("an", "An_numeric")
+    statii = pd.unique(df[statie].astype(str))
+    ani = (int(df[an].min()), int(df[an].max()))
+    return construieste_cub([df], cale, variabile, statii, ani, **optiuni)
+
+
+def deschide_cub(cale=DIR_CUB, mod="r"):
+    return Cub(cale, mod)
+
+
+# ─── 3. Cubul canonic al proiectului ─────────────────────────────────────────
+def cub_6statii(cale=DIR_CUB):
+    clima = citeste_excel("Date-climatologice-6statii-3Temp-Prec.xlsx")
+    clima.columns = clima.columns.str.strip()
+    adauga_etp(clima)
+    hellmann = citeste_excel("Date_6statii_cu_scor_hellmann_lunar.xlsx")
+    cheie = ["Statie", "An_numeric", "Luna_numeric"]
+    df = clima.merge(hellmann[cheie + ["hellmann_score_lunar"]], on=cheie, how="outer")
+    return cub_din_tabel(df, cale, VARIABILE_CUB, atribute={"ETP": eticheta_etp()})
+
+
+if __name__ == "__main__":
+    cub = cub_6statii(sys.argv[1] if len(sys.argv) > 1 else DIR_CUB)
+    print(f"✅ Cub {cub.valori.shape} ({', '.join(cub.variabile)}) salvat în {cub.cale}")
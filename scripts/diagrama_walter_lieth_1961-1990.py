@@ -10,6 +10,8 @@ python walter_lieth_1961_1990.py [-i EXCEL] [-o FIGURE]
 import argparse, os, sys
 import numpy as np, pandas as pd, matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+
 
 def build_diagram(df: pd.DataFrame) -> plt.Figure:
     # --- Series ---------------------------------------------------------------
@@ -77,7 +79,7 @@ def main():
     if not os.path.isfile(args.input):
         sys.exit(f"Nu a fost găsit fișierul: {args.input}")
 
-    df = pd.read_excel(args.input, engine="openpyxl").set_index("Indicator")
+    df = citeste_excel(args.input, engine="openpyxl").set_index("Indicator")
     fig = build_diagram(df)
 
     if args.output:
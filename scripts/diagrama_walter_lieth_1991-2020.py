@@ -11,6 +11,8 @@ python diagrama_walter_lieth_1991-2020.py -o figura.png
 import argparse, os, sys
 import numpy as np, pandas as pd, matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+
 
 def build_diagram(df: pd.DataFrame) -> plt.Figure:
     # ── Extragem seriile lunare ────────────────────────────────────────────────
@@ -86,7 +88,7 @@ def main():
     if not os.path.isfile(args.input):
         sys.exit(f"Nu am găsit fișierul: {args.input}")
 
-    df = pd.read_excel(args.input, engine="openpyxl").set_index("Indicator")
+    df = citeste_excel(args.input, engine="openpyxl").set_index("Indicator")
     fig = build_diagram(df)
 
     if args.output:
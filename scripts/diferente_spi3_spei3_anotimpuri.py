@@ -1,25 +1,17 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+from calendar_climatic import sezon
+
 # === 1. Încarcă datele
-df = pd.read_excel("Rezultate_SPI3_SPEI3_6statii.xlsx")
+df = citeste_excel("Rezultate_SPI3_SPEI3_6statii.xlsx")
 
 # === 2. Adaugă coloana „Anotimp”
-def map_anotimp(luna):
-    if luna in [12, 1, 2]:
-        return "Iarnă"
-    elif luna in [3, 4, 5]:
-        return "Primăvară"
-    elif luna in [6, 7, 8]:
-        return "Vară"
-    elif luna in [9, 10, 11]:
-        return "Toamnă"
-
-df["Anotimp"] = df["Luna"].apply(map_anotimp)
+df["Anotimp"] = sezon(df["Luna"])
 
 # === 3. Diferența SPI - SPEI și medie pe anotimp
 df["Dif_SPI_SPEI"] = df["SPI-3"] - df["SPEI-3"]
-df_grouped = df.groupby("Anotimp")["Dif_SPI_SPEI"].mean().reindex(["Primăvară", "Vară", "Toamnă", "Iarnă"])
+df_grouped = df.groupby("Anotimp", observed=True)["Dif_SPI_SPEI"].mean().reindex(["Primăvară", "Vară", "Toamnă", "Iarnă"])
 
 # === 4. Creare grafic
 plt.figure(figsize=(10, 6))
@@ -1,28 +1,13 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
-df = pd.read_excel("Date-6statii-precipitatii.xlsx")
+from acces_date import citeste_excel
+from hellmann import categorii, etichete_schema
+
+df = citeste_excel("Date-6statii-precipitatii.xlsx")
 df.rename(columns={"An_numeric": "An", "Luna_numeric": "Luna"}, inplace=True)
 
-def clasificare_hellmann(p):
-    if p < 5:
-        return "Excesiv secetoasă"
-    elif p < 10:
-        return "Secetoasă"
-    elif p < 20:
-        return "Moderat secetoasă"
-    elif p < 40:
-        return "Normală"
-    elif p < 60:
-        return "Umedă"
-    elif p < 100:
-        return "Foarte umedă"
-    else:
-        return "Excesiv umedă"
-
-ordine = ["Excesiv secetoasă", "Secetoasă", "Moderat secetoasă", "Normală",
-          "Umedă", "Foarte umedă", "Excesiv umedă"]
+ordine = etichete_schema("7 clase")
 
 # Noua paletă roșu-albastru
 culori_rb = {
@@ -35,9 +20,9 @@ culori_rb = {
     "Excesiv umedă": "#045a8d"
 }
 
-df["Clasa_Hellmann"] = df["precip_total"].apply(clasificare_hellmann)
+df["Clasa_Hellmann"] = categorii(df["precip_total"], "7 clase")
 
-distributie_count = df.groupby(["Statie", df["Clasa_Hellmann"]]).size().unstack(fill_value=0)
+distributie_count = df.groupby(["Statie", "Clasa_Hellmann"], observed=False).size().unstack(fill_value=0)
 distributie_pct = distributie_count.div(distributie_count.sum(axis=1), axis=0) * 100
 distributie_pct = distributie_pct[ordine]
 
@@ -1,32 +1,18 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+from hellmann import categorii, etichete_schema
+
 # 1. Încărcare date
-df = pd.read_excel("Date-6statii-precipitatii.xlsx")
+df = citeste_excel("Date-6statii-precipitatii.xlsx")
 df.rename(columns={"An_numeric": "An", "Luna_numeric": "Luna"}, inplace=True)
 
 # 2. Clasificare Hellmann
-def clasificare_hellmann(p):
-    if p < 5:
-        return "Excesiv secetoasă"
-    elif p < 10:
-        return "Secetoasă"
-    elif p < 20:
-        return "Moderat secetoasă"
-    elif p < 40:
-        return "Normală"
-    elif p < 60:
-        return "Umedă"
-    elif p < 100:
-        return "Foarte umedă"
-    else:
-        return "Excesiv umedă"
-
-df["Clasa_Hellmann"] = df["precip_total"].apply(clasificare_hellmann)
+df["Clasa_Hellmann"] = categorii(df["precip_total"], "7 clase")
 
 # 3. Ordine și paletă roșu-albastru
-ordine = ["Excesiv secetoasă", "Secetoasă", "Moderat secetoasă", "Normală",
-          "Umedă", "Foarte umedă", "Excesiv umedă"]
+ordine = etichete_schema("7 clase")
 culori_rb = {
     "Excesiv secetoasă": "#7f0000",
     "Secetoasă": "#d7301f",
@@ -38,7 +24,7 @@ culori_rb = {
 }
 
 # 4. Grupare
-grup = df.groupby(["An", "Clasa_Hellmann"]).size().unstack(fill_value=0)
+grup = df.groupby(["An", "Clasa_Hellmann"], observed=False).size().unstack(fill_value=0)
 grup = grup[ordine]
 
 # 5. Plot
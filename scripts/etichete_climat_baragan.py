@@ -1,10 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+from acces_date import citeste_excel
+
 # === 1. Încarcă datele din fișier Excel ===================
 excel_file = "Date-climatologice-sezoane-extinse.xlsx"
-df = pd.read_excel(excel_file, sheet_name="Foaie1")
+df = citeste_excel(excel_file, sheet_name="Foaie1")
 
 # Ordonăm după sezon și perioadă (rece/cald, 1961–1990 / 1991–2020)
 df = df.sort_values(by=["Sezon", "Perioada"], ascending=[True, True])
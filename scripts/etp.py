@@ -0,0 +1,231 @@
+"""
+Evapotranspirația potențială (ETP) lunară, vectorizată pe stații × luni
+
+Radiația extraterestră Ra se calculează analitic din latitudine și ziua din an
+(FAO-56, ec. 21–25: declinația solară, unghiul orar la apus, distanța relativă
+Pământ–Soare), ca medie a valorilor zilnice din fiecare lună, exprimată în
+mm/zi echivalent evaporare (× 0,408). Tabelul Ra (12 luni) se păstrează pe
+benzi de latitudine de 0,1°, în memorie și în `.cache_date/ra_latitudini.npz`,
+deci nu se mai recalculează la rulările următoare.
+
+Formulele ETP sunt interschimbabile (registrul METODE_ETP), toate în mm/zi:
+   • "hargreaves"      – Tmin, Tmax, Tmed și Ra (varianta istorică)
+   • "thornthwaite"    – Tmed, indicele termic anual și durata zilei
+   • "penman-monteith" – FAO-56 (ec. 6); umiditatea, vântul, radiația globală și
+     altitudinea se iau din coloanele COLOANE_PM dacă există, altfel se
+     estimează ca în FAO-56 cap. 3 (ea din Tmin, Rs Hargreaves, u2 = 2 m/s)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from acces_date import DIR_CACHE, scriere_atomica
+from instrumentare import cronometrat
+
+PAS_LATITUDINE = 0.1                      # lățimea benzii de latitudine (grade)
+MJ_LA_MM = 0.408                          # MJ m⁻² zi⁻¹ → mm/zi
+ZILE_LUNA = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+
+# Coloane opționale pentru Penman-Monteith și valorile folosite când lipsesc
+COLOANE_PM = {"umiditate": "RH_med", "vant": "vant_2m", "radiatie": "Rs", "altitudine": "Altitudine"}
+VANT_IMPLICIT = 2.0                       # m/s la 2 m (FAO-56, ec. 47 și recomandarea globală)
+ALTITUDINE_IMPLICITA = 50.0               # m, ordinul de mărime pentru Câmpia Bărăganului
+KRS = 0.16                                # coeficient Hargreaves pentru radiație, interior
+
+# Tabelul istoric (mm/zi) folosit inițial în calcule_6statii_spi_spei-3.py;
+# păstrat doar pentru reproducerea rezultatelor publicate.
+RA_TABEL = np.array([8.4, 10.5, 13.1, 15.2, 16.5, 17.1, 17.0, 15.9, 13.4, 10.8, 8.8, 7.7])
+
+_ra_benzi = {}
+
+# ─── 1. Radiația extraterestră ───────────────────────────────────────────────
+def _geometrie(latitudine, zi_an):
+    phi = np.radians(latitudine)
+    decl = 0.409 * np.sin(2 * np.pi / 365 * zi_an - 1.39)
+    ws = np.arccos(np.clip(-np.tan(phi) * np.tan(decl), -1, 1))
+    return phi, decl, ws
+
+
+def ra_zilnic(latitudine, zi_an):
+    """Ra (MJ m⁻² zi⁻¹) pentru latitudini (grade) și zile din an, cu broadcast."""
+    phi, decl, ws = _geometrie(latitudine, zi_an)
+    dr = 1 + 0.033 * np.cos(2 * np.pi / 365 * zi_an)
+    return (24 * 60 / np.pi * 0.0820 * dr
+            * (ws * np.sin(phi) * np.sin(decl) + np.cos(phi) * np.cos(decl) * np.sin(ws)))
+
+
+def _medie_lunara(functie, latitudini):
+    """Media pe fiecare lună calendaristică a unei mărimi zilnice, formă (latitudini × 12)."""
+    zile = np.arange(1, 366)
+    zilnic = functie(np.asarray(latitudini, dtype=float)[:, None], zile[None, :])
+    inceput_luna = np.concatenate([[0], np.cumsum(ZILE_LUNA)[:-1]])
+    return np.add.reduceat(zilnic, inceput_luna, axis=1) / ZILE_LUNA
+
+
+def _calculeaza_ra_lunar(latitudini):
+    return _medie_lunara(ra_zilnic, latitudini) * MJ_LA_MM
+
+
+def durata_zi_lunar(latitudine):
+    """Durata medie a zilei (ore, FAO-56 ec. 34) pe lună, formă (…, 12)."""
+    lat = np.asarray(latitudine, dtype=float)
+    unice, inv = np.unique(lat, return_inverse=True)
+    ore = _medie_lunara(lambda l, z: 24 / np.pi * _geometrie(l, z)[2], unice)
+    return ore[inv].reshape(lat.shape + (12,))
+
+
+def _fisier_cache(director):
+    return Path(director) / DIR_CACHE / "ra_latitudini.npz"
+
+
+def _incarca_cache(director):
+    cale = _fisier_cache(director)
+    if not _ra_benzi and cale.exists():
+        with np.load(cale) as f:
+            _ra_benzi.update(zip(f["benzi"].tolist(), f["ra"]))
+
+
+def ra_lunar(latitudine, director="."):
+    """Ra lunar mediu (mm/zi) de formă (…, 12), cu cache pe benzi de latitudine."""
+    _incarca_cache(director)
+    benzi = np.round(np.asarray(latitudine, dtype=float) / PAS_LATITUDINE).astype(int)
+    unice, inv = np.unique(benzi, return_inverse=True)
+
+    lipsa = [b for b in unice.tolist() if b not in _ra_benzi]
+    if lipsa:
+        _ra_benzi.update(zip(lipsa, _calculeaza_ra_lunar(np.array(lipsa) * PAS_LATITUDINE)))
+        cale = _fisier_cache(director)
+        cale.parent.mkdir(exist_ok=True)
+        toate = sorted(_ra_benzi)
+        with scriere_atomica(cale) as temp:
+            np.savez(temp, benzi=np.array(toate), ra=np.array([_ra_benzi[b] for b in toate]))
+
+    tabel = np.array([_ra_benzi[b] for b in unice.tolist()])
+    return tabel[inv].reshape(benzi.shape + (12,))
+
+
+# ─── 2. Formule ETP (mm/zi), vectorizate pe rândurile tabelului ──────────────
+def etp_hargreaves(tmin, tmax, tmed, ra):
+    """ETP Hargreaves (mm/zi), element cu element."""
+    return 0.0023 * ra * np.sqrt(np.maximum(0, tmax - tmin)) * (tmed + 17.8)
+
+
+def etp_thornthwaite(tmed, indice_termic, durata_zi):
+    """ETP Thornthwaite (mm/zi) din media lunară, indicele termic anual I și durata zilei."""
+    t = np.maximum(tmed, 0.0)
+    i = np.where(indice_termic > 0, indice_termic, np.nan)
+    a = 6.75e-7 * i**3 - 7.71e-5 * i**2 + 1.792e-2 * i + 0.49239
+    lunar = np.where(t < 26.5, 16 * (10 * t / i) ** a, -415.85 + 32.24 * t - 0.43 * t**2)
+    # formula dă mm pentru o lună de 30 de zile cu zile de 12 ore
+    return np.where(t > 0, lunar * durata_zi / 12 / 30, 0.0)
+
+
+def _presiune_vapori(t):
+    return 0.6108 * np.exp(17.27 * t / (t + 237.3))
+
+
+def etp_penman_monteith(tmin, tmax, tmed, ra, rh=None, u2=None, rs=None, altitudine=None):
+    """ETo Penman-Monteith FAO-56 (mm/zi) pentru cultura de referință.
+
+    `ra` este în mm/zi (ca în restul modulului). Fluxul de căldură în sol G se
+    neglijează (media lunară ≈ 0 față de Rn). Mărimile lipsă (None sau NaN)
+    se estimează ca în FAO-56 cap. 3.
+    """
+    def sau(valori, implicit):
+        if valori is None:
+            return implicit
+        return np.where(np.isnan(valori), implicit, valori)
+
+    ra_mj = ra / MJ_LA_MM
+    z = sau(altitudine, ALTITUDINE_IMPLICITA)
+    u2 = sau(u2, VANT_IMPLICIT)
+    rs = sau(rs, KRS * np.sqrt(np.maximum(0, tmax - tmin)) * ra_mj)
+
+    es = (_presiune_vapori(tmax) + _presiune_vapori(tmin)) / 2
+    ea = _presiune_vapori(tmin) if rh is None else sau(rh / 100 * es, _presiune_vapori(tmin))
+    delta = 4098 * _presiune_vapori(tmed) / (tmed + 237.3) ** 2
+    gama = 0.665e-3 * 101.3 * ((293 - 0.0065 * z) / 293) ** 5.26
+
+    rso = (0.75 + 2e-5 * z) * ra_mj
+    rns = 0.77 * rs
+    rnl = (4.903e-9 * ((tmax + 273.16) ** 4 + (tmin + 273.16) ** 4) / 2
+           * (0.34 - 0.14 * np.sqrt(ea)) * (1.35 * np.minimum(rs / rso, 1.0) - 0.35))
+    rn = rns - rnl
+
+    return np.maximum(0, (0.408 * delta * rn + gama * 900 / (tmed + 273) * u2 * (es - ea))
+                      / (delta + gama * (1 + 0.34 * u2)))
+
+
+# Fiecare metodă primește (df, ra mm/zi, latitudine, indice lună 0…11) pe rânduri
+def _coloana(df, nume):
+    return df[nume].to_numpy(dtype=float)
+
+
+def _hargreaves(df, ra, latitudine, idx_luna):
+    return etp_hargreaves(_coloana(df, "tmin_med"), _coloana(df, "tmax_med"),
+                          _coloana(df, "tmed_med"), ra)
+
+
+def _thornthwaite(df, ra, latitudine, idx_luna, statie="Statie", an="An_numeric"):
+    tmed = _coloana(df, "tmed_med")
+    termen = pd.Series((np.maximum(tmed, 0) / 5) ** 1.514, index=df.index)
+    indice_termic = termen.groupby([df[statie], df[an]]).transform("sum").to_numpy()
+    durata = durata_zi_lunar(latitudine)[np.arange(len(df)), idx_luna]
+    return etp_thornthwaite(tmed, indice_termic, durata)
+
+
+def _penman_monteith(df, ra, latitudine, idx_luna):
+    optionale = {cheie: _coloana(df, col) if col in df.columns else None
+                 for cheie, col in COLOANE_PM.items()}
+    return etp_penman_monteith(_coloana(df, "tmin_med"), _coloana(df, "tmax_med"),
+                               _coloana(df, "tmed_med"), ra, optionale["umiditate"],
+                               optionale["vant"], optionale["radiatie"], optionale["altitudine"])
+
+
+METODE_ETP = {"hargreaves": _hargreaves, "thornthwaite": _thornthwaite,
+              "penman-monteith": _penman_monteith}
+
+
+def _ra_randuri(df, latitudine, idx_luna, ra_tabel):
+    if ra_tabel:
+        return RA_TABEL[idx_luna]
+    return ra_lunar(latitudine)[np.arange(len(df)), idx_luna]
+
+
+@cronometrat()
+def calculeaza_etp(df, metoda="hargreaves", latitudine="Latitude", luna="Luna_numeric", ra_tabel=False):
+    """ETP (mm/zi) pentru fiecare rând al unui tabel lung de stații-luni.
+
+    Cu `ra_tabel=True` se folosește tabelul istoric RA_TABEL (o singură
+    latitudine) în locul Ra calculat din latitudinea fiecărei stații.
+    """
+    if metoda not in METODE_ETP:
+        raise ValueError(f"Metodă ETP necunoscută: {metoda!r} (disponibile: {', '.join(METODE_ETP)})")
+    idx_luna = df[luna].to_numpy(dtype=int) - 1
+    lat = _coloana(df, latitudine)
+    return METODE_ETP[metoda](df, _ra_randuri(df, lat, idx_luna, ra_tabel), lat, idx_luna)
+
+
+def eticheta_etp(metoda="hargreaves", ra_tabel=False):
+    """Eticheta variantei ETP (formulă + sursa Ra), ex. "hargreaves/ra_latitudine"."""
+    return f"{metoda}/{'ra_tabel' if ra_tabel else 'ra_latitudine'}"
+
+
+def adauga_etp(df, latitudine="Latitude", luna="Luna_numeric", ra_tabel=False, metoda="hargreaves"):
+    """Adaugă coloanele Ra și ETP (formula `metoda`) unui tabel lung de stații-luni."""
+    idx_luna = df[luna].to_numpy(dtype=int) - 1
+    df["Ra"] = _ra_randuri(df, _coloana(df, latitudine), idx_luna, ra_tabel)
+    df["ETP"] = calculeaza_etp(df, metoda, latitudine, luna, ra_tabel)
+    return df
+
+
+def adauga_etp_ansamblu(df, metode=tuple(METODE_ETP), latitudine="Latitude", luna="Luna_numeric",
+                        ra_tabel=False):
+    """Câte o coloană ETP_<metodă> pentru fiecare formulă; întoarce {metodă: coloană}."""
+    coloane = {}
+    for metoda in metode:
+        coloane[metoda] = f"ETP_{metoda}"
+        df[coloane[metoda]] = calculeaza_etp(df, metoda, latitudine, luna, ra_tabel)
+    return coloane
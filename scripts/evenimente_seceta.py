@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Catalogul evenimentelor de secetă (teoria pragurilor / „run theory”)
+
+Un eveniment este o succesiune de luni consecutive cu indicele sub prag
+(implicit SPI/SPEI < -1). Pentru fiecare eveniment se rețin:
+   • începutul, sfârșitul și durata (luni)
+   • severitatea – deficitul cumulat față de prag, Σ(prag − x)
+   • intensitatea – severitate / durată
+   • vârful – valoarea minimă a indicelui și luna în care apare
+Lunile lipsă (NaN) întrerup evenimentul. Opțional, evenimentele separate de
+cel mult `pauza_max` luni cu date (fără NaN) se unesc într-unul singur.
+
+Detecția este o codificare pe secvențe (run-length) pe tot tabloul
+serii × timp deodată, fără bucle pe stații sau pe luni.
+
+Rulare (din directorul cu registrele Excel):
+    python ../scripts/evenimente_seceta.py
+"""
+
+import numpy as np
+import pandas as pd
+
+from acces_date import citeste_excel
+from instrumentare import cronometrat
+from motor_spi_spei import pivoteaza
+
+INPUT_FILE = "Rezultate_SPI3_SPEI3_6statii.xlsx"
+OUTPUT_FILE = "Evenimente_seceta_6statii.xlsx"
+INDICI = ("SPI-3", "SPEI-3")
+PRAG = -1.0
+
+
+# ─── 1. Detecția pe tablou (serii × timp) ────────────────────────────────────
+def evenimente(valori, prag=PRAG, durata_min=1, pauza_max=0):
+    """Evenimentele sub prag din toate seriile; întoarce un dict de tablouri 1-D.
+
+    Cheile: serie, inceput, sfarsit (indici pe axa timpului, inclusiv),
+    durata, severitate, intensitate, varf, pozitie_varf. Cu `pauza_max` se
+    unesc doar evenimentele separate de luni cu date (NaN nu se „sare”).
+
+    >>> evenimente([[0, -1.5, -2, 0, np.nan, 0, -1.2, 0, np.nan]])["varf"].tolist()
+    [-2.0, -1.2]
+    >>> evenimente([[-1.5, 0, -1.2], [-1.5, np.nan, -1.2]], pauza_max=1)["durata"].tolist()
+    [3, 1, 1]
+    """
+    x = np.atleast_2d(np.asarray(valori, dtype=float))
+    n_serii, n_t = x.shape
+
+    # o coloană de separare la final: secvențele nu trec de la o serie la alta
+    sub = np.zeros((n_serii, n_t + 1), dtype=bool)
+    sub[:, :n_t] = x < prag                       # NaN < prag este False
+    plat = sub.ravel()
+    schimbari = np.flatnonzero(np.diff(np.concatenate([[False], plat]).astype(np.int8)))
+    inceput, sfarsit = schimbari[::2], schimbari[1::2] - 1
+
+    deficit = np.where(plat, prag - np.append(x, np.zeros((n_serii, 1)), axis=1).ravel(), 0.0)
+    x_plat = np.append(x, np.full((n_serii, 1), np.inf), axis=1).ravel()
+    severitate = np.add.reduceat(deficit, inceput) if inceput.size else np.empty(0)
+
+    # vârful: primul minim din fiecare secvență (doar lunile secvenței, nu și
+    # cele de după ea, care pot fi NaN)
+    marcaj = np.zeros(plat.size, dtype=np.int64)
+    marcaj[inceput] = 1
+    in_secventa = np.flatnonzero(plat)
+    pozitie_varf = in_secventa[_primul_minim(x_plat[in_secventa], np.cumsum(marcaj)[in_secventa])]
+    varf = x_plat[pozitie_varf]
+
+    # lunile NaN din pauza dintre două secvențe consecutive
+    nan_cumulat = np.cumsum(np.isnan(x_plat))
+    nan_in_pauza = nan_cumulat[inceput[1:] - 1] - nan_cumulat[sfarsit[:-1]]
+
+    serie, inceput = np.divmod(inceput, n_t + 1)
+    sfarsit = sfarsit - serie * (n_t + 1)
+    pozitie_varf = pozitie_varf - serie * (n_t + 1)
+
+    if pauza_max > 0 and inceput.size:
+        nou = np.ones(inceput.size, dtype=bool)
+        nou[1:] = ((serie[1:] != serie[:-1]) | (inceput[1:] - sfarsit[:-1] - 1 > pauza_max)
+                   | (nan_in_pauza > 0))
+        grup = np.flatnonzero(nou)
+        ultim = np.append(grup[1:], inceput.size) - 1
+        idx_varf = _primul_minim(varf, np.cumsum(nou))
+        serie, inceput, sfarsit = serie[grup], inceput[grup], sfarsit[ultim]
+        severitate = np.add.reduceat(severitate, grup)
+        varf, pozitie_varf = varf[idx_varf], pozitie_varf[idx_varf]
+
+    durata = sfarsit - inceput + 1
+    pastrat = durata >= durata_min
+    rezultat = {"serie": serie, "inceput": inceput, "sfarsit": sfarsit, "durata": durata,
+                "severitate": severitate, "intensitate": severitate / np.maximum(durata, 1),
+                "varf": varf, "pozitie_varf": pozitie_varf}
+    return {k: v[pastrat] for k, v in rezultat.items()}
+
+
+def _primul_minim(valori, eticheta):
+    """Indicele primului minim din fiecare grup (etichete crescătoare, grupuri contigue)."""
+    ordine = np.lexsort((np.arange(valori.size), valori, eticheta))
+    primul = np.ones(valori.size, dtype=bool)
+    primul[1:] = np.diff(eticheta[ordine]) != 0
+    return ordine[primul]
+
+
+# ─── 2. Catalog din tabelul de rezultate ─────────────────────────────────────
+def _format_luna(cheie):
+    cheie = np.asarray(cheie)
+    return pd.Series(cheie // 12).astype(str) + "-" + pd.Series(cheie % 12 + 1).astype(str).str.zfill(2)
+
+
+@cronometrat()
+def catalog_evenimente(df, indice="SPI-3", prag=PRAG, durata_min=1, pauza_max=0,
+                       statie="Statie", an="An", luna="Luna"):
+    """Tabelul evenimentelor pentru un indice dintr-un tabel lung de rezultate.
+
+    Axa timpului este calendarul complet (lunile lipsă la toate stațiile,
+    de ex. 2014, devin NaN și întrerup evenimentele).
+    """
+    statii, ani, luni, (valori,) = pivoteaza(df, [indice], statie, an, luna)
+    cheie = ani * 12 + luni - 1
+
+    ev = evenimente(valori, prag, durata_min, pauza_max)
+    return pd.DataFrame({
+        "Statie": np.asarray(statii)[ev["serie"]],
+        "Indice": indice,
+        "Inceput": _format_luna(ev["inceput"] + cheie.min()),
+        "Sfarsit": _format_luna(ev["sfarsit"] + cheie.min()),
+        "Durata": ev["durata"],
+        "Severitate": np.round(ev["severitate"], 3),
+        "Intensitate": np.round(ev["intensitate"], 3),
+        "Varf": np.round(ev["varf"], 3),
+        "Luna_varf": _format_luna(ev["pozitie_varf"] + cheie.min()),
+    })
+
+
+def main() -> None:
+    df = citeste_excel(INPUT_FILE)
+    catalog = pd.concat([catalog_evenimente(df, indice) for indice in INDICI], ignore_index=True)
+    catalog.to_excel(OUTPUT_FILE, index=False)
+    print(f"✅ {len(catalog)} evenimente de secetă salvate în fișierul: {OUTPUT_FILE}")
+    print(catalog.groupby(["Indice", "Statie"])["Durata"].agg(["count", "sum", "max"]).to_string())
+
+
+if __name__ == "__main__":
+    main()
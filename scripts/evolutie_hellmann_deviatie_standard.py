@@ -1,40 +1,25 @@
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
+from acces_date import citeste_excel
+from hellmann import scoruri
+from lipsa_date import completeaza_ani, adnoteaza_lipsuri
+
 # Încarcă datele
-df = pd.read_excel("Date-6statii-precipitatii.xlsx")
+df = citeste_excel("Date-6statii-precipitatii.xlsx")
 df.rename(columns={"An_numeric": "An", "Luna_numeric": "Luna"}, inplace=True)
 
-# Clasificare scor Hellmann
-def scor_hellmann(p):
-    if p < 5:
-        return 1
-    elif p < 10:
-        return 2
-    elif p < 20:
-        return 3
-    elif p < 40:
-        return 4
-    elif p < 60:
-        return 5
-    elif p < 100:
-        return 6
-    else:
-        return 7
-
-df["Scor_Hellmann"] = df["precip_total"].apply(scor_hellmann)
+# Clasificare scor Hellmann (schema cu 7 clase, scor 1–7)
+df["Scor_Hellmann"] = scoruri(df["precip_total"], "7 clase")
 
 # Deviație standard anuală
 dev_std_anual = df.groupby("An")["Scor_Hellmann"].std()
 
-# Adaugă 2014 cu NaN pentru gap
-if 2014 not in dev_std_anual.index:
-    dev_std_anual.loc[2014] = np.nan
-dev_std_anual = dev_std_anual.sort_index()
+# Axa completă a anilor: anii fără date devin NaN
+dev_std_anual = completeaza_ani(dev_std_anual)
 
-# Trend fără 2014
+# Trend doar pe anii cu date
 x = dev_std_anual.dropna().index.values
 y = dev_std_anual.dropna().values
 slope, intercept = np.polyfit(x, y, 1)
@@ -48,10 +33,8 @@ plt.plot(dev_std_anual.index, trend,
          linestyle='--', color="#002147", linewidth=1.5,
          label=f"Trend: y = {slope:.4f}x + {intercept:.2f}")
 
-# Evidențiază 2014
-plt.axvline(x=2014, color='gray', linestyle='--', alpha=0.6)
-plt.text(2014, plt.ylim()[1]*0.97, "2014\n(lipsă date)", rotation=90,
-         color='gray', fontsize=9, ha='center', va='top')
+# Evidențiază anii fără date
+adnoteaza_lipsuri(plt.gca(), dev_std_anual.index, dev_std_anual.notna())
 
 # Stil
 plt.title("Evoluția variabilității lunare a scorurilor Hellmann în Câmpia Bărăganului (1961–2020)", fontsize=13)
@@ -1,9 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+from lipsa_date import completeaza_ani, adnoteaza_lipsuri
+
 # Încarcă fișierul Excel
 file_path = "Rezultate_SPI3_SPEI3_6statii.xlsx"  # Asigură-te că e în același folder
-df = pd.read_excel(file_path)
+df = citeste_excel(file_path)
 
 # Clasificare categorii pe baza SPI-3
 def clasificare_spi3(val):
@@ -21,10 +23,8 @@ df["Categorie"] = df["SPI-3"].apply(clasificare_spi3)
 # Grupare: număr de cazuri pe an și categorie
 count_data = df.groupby(["An", "Categorie"]).size().unstack(fill_value=0)
 
-# Adaugă anul 2014 cu valori NaN pentru gap
-if 2014 not in count_data.index:
-    count_data.loc[2014] = [None] * count_data.shape[1]
-count_data = count_data.sort_index()
+# Axa completă a anilor: anii fără date devin NaN (linie întreruptă)
+count_data = completeaza_ani(count_data)
 
 # Culori pentru categorii
 culori = {
@@ -41,10 +41,8 @@ for categorie in ["Secetă Severă", "Secetă Moderată", "Excedent Pluviometric
                  label=categorie, marker='o', linewidth=1.5,
                  color=culori[categorie])
 
-# Evidențiere an 2014
-plt.axvline(x=2014, color='gray', linestyle='--', alpha=0.6)
-plt.text(2014, plt.ylim()[1]*0.95, '2014\n(lipsă date)', rotation=90,
-         color='gray', fontsize=9, ha='center', va='top')
+# Evidențiere ani fără date
+adnoteaza_lipsuri(plt.gca(), count_data.index, count_data.notna().any(axis=1))
 
 # Stilizare
 plt.title("Evoluția Secetelor și Excedentului Pluviometric pe Ani (1961–2020)", fontsize=14)
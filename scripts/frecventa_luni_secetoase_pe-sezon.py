@@ -2,7 +2,7 @@
 """Generare grafic – Frecvența lunilor secetoase pe anotimpuri (Câmpia Bărăganului)
    * Indicator Hellmann, 1961‑2020
    * Subplot‑uri în ordinea: Iarna, Primăvara, Vara, Toamna (stânga‑dreapta / sus‑jos)
-   * Gap vizual în 2014 (lipsă date)
+   * Gap vizual în anii fără date (deduși din registrul lunar, vezi lipsa_date.py)
    * Spaţiu suplimentar deasupra liniei de 100 % (axe y extinsă la 110 %)
    * Linia de trend: roşu‑purpuriu (vizibilă)
 
@@ -16,6 +16,10 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+from lipsa_date import ani_fara_date_registru, completeaza_ani, mascheaza_ani, adnoteaza_lipsuri
+from tendinte import tendinte
+
 # -----------------------------------------------------------------------------
 # Paletă culori (linie, umplere) & trend line
 # -----------------------------------------------------------------------------
@@ -34,10 +38,11 @@ TREND_WIDTH = 2.5
 
 def citeste_date(path: str | Path = "Calcul_frecventa_luni-secetoase_pe-anotimp_pas2.xlsx") -> pd.DataFrame:
     """Returnează un *DataFrame* cu anii 1961‑2020 + procente lunilor secetoase.
-    Anul **2014** este setat la *NaN* pentru toate anotimpurile → gap vizual.
+    Anii fără observații în registrul lunar (tabelul derivat îi are cu 0) devin
+    *NaN* pentru toate anotimpurile → gap vizual.
     """
 
-    df = pd.read_excel(path)
+    df = citeste_excel(path)
 
     # verificare coloane
     expected: List[str] = ["An", "Primăvara", "Vara", "Toamna", "Iarna"]
@@ -52,14 +57,9 @@ def citeste_date(path: str | Path = "Calcul_frecventa_luni-secetoase_pe-anotimp_
         df[col] = df[col].astype(float)
 
     # serie continuă 1961‑2020
-    serie = pd.DataFrame({"An": range(1961, 2021)})
-    df_full = serie.merge(df, on="An", how="left")
-
-    # forţăm NaN pe 2014
-    mask2014 = df_full["An"] == 2014
-    df_full.loc[mask2014, expected[1:]] = np.nan
+    df_full = completeaza_ani(df[expected], "An", np.arange(1961, 2021))
 
-    return df_full
+    return mascheaza_ani(df_full, ani_fara_date_registru(), "An")
 
 # -----------------------------------------------------------------------------
 # 2. Desenarea subplot‑urilor
@@ -71,6 +71,9 @@ def deseneaza(df: pd.DataFrame) -> None:
     # ordinea dorită Iarna, Primăvara, Vara, Toamna
     anotimpuri = ["Iarna", "Primăvara", "Vara", "Toamna"]
 
+    # trend OLS + testul Mann-Kendall pentru toate anotimpurile deodată
+    trend = tendinte((df[anotimpuri] * 100).to_numpy(dtype=float).T, df["An"].to_numpy())
+
     for i, sezon in enumerate(anotimpuri, start=1):
         ax = plt.subplot(2, 2, i)
 
@@ -101,17 +104,16 @@ def deseneaza(df: pd.DataFrame) -> None:
         )
 
         # linia de trend
-        ok = ~np.isnan(y)
-        if ok.sum() >= 2:
-            coef = np.polyfit(x[ok], y[ok], 1)
-            trend = np.poly1d(coef)
+        k = i - 1
+        if trend["n"][k] >= 2:
+            panta, interceptie = trend["ols"][k], trend["interceptie_ols"][k]
             ax.plot(
                 x,
-                trend(x),
+                panta * x + interceptie,
                 "--",
                 color=TREND_COLOR,
                 linewidth=TREND_WIDTH,
-                label=f"Trend: y = {coef[0]:+.02f}x + {coef[1]:.1f}",
+                label=f"Trend: y = {panta:+.02f}x + {interceptie:.1f} (MK p={trend['p'][k]:.3f})",
             )
 
         # axă Y: 0‑110 (spaţiu >100 %) sau 15 % peste maxim dacă depăşeşte 100
@@ -120,6 +122,7 @@ def deseneaza(df: pd.DataFrame) -> None:
         ax.set_ylim(0, ytop)
 
         # cosmetizare
+        adnoteaza_lipsuri(ax, x, ~np.isnan(y))
         ax.set_title(sezon)
         ax.set_ylabel("% luni secetoase")
         ax.grid(True, linestyle=":", linewidth=0.7)
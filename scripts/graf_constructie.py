@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Graf de dependențe: registre sursă → tabele derivate → figuri
+
+Fiecare nod declară scriptul, fișierele de intrare și fișierele produse.
+Semnătura unui nod este hash-ul (SHA-256) al intrărilor, al scriptului și al
+modulelor locale pe care le importă; un nod se reconstruiește doar dacă
+semnătura s-a schimbat sau lipsește o ieșire. Nodurile independente rulează
+în paralel (vezi construieste_figuri.py), nivel după nivel.
+
+Rulare (din directorul cu registrele Excel):
+    python ../scripts/graf_constructie.py            # doar ce s-a schimbat
+    python ../scripts/graf_constructie.py --arata    # doar listează
+    python ../scripts/graf_constructie.py --tot      # reconstruiește tot
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from acces_date import sha256, amprenta
+from construieste_figuri import construieste, raport, ARGUMENTE, DIR_SCRIPTURI
+
+FISIER_STARE = ".graf_constructie.json"
+
+REGISTRU_LUNAR = "Date-climatologice-6statii-3Temp-Prec.xlsx"
+REZULTATE_SPI = "Rezultate_SPI3_SPEI3_6statii.xlsx"
+PRECIP_6STATII = "Date-6statii-precipitatii.xlsx"
+HELLMANN_LUNAR = "Date_6statii_cu_scor_hellmann_lunar.xlsx"
+ANUAL_6190 = "Temperatura-precipitatii_1961-1990.xlsx"
+ANUAL_9120 = "Temperatura-precipitatii_1991-2020.xlsx"
+
+# ─── 1. Graful declarat ──────────────────────────────────────────────────────
+GRAF = {
+    # tabele derivate
+    "calcule_6statii_spi_spei-3.py": {
+        "intrari": [REGISTRU_LUNAR],
+        "iesiri": [REZULTATE_SPI]},
+    "evenimente_seceta.py": {"intrari": [REZULTATE_SPI], "iesiri": ["Evenimente_seceta_6statii.xlsx"]},
+    "lipsa_date.py": {"intrari": [REGISTRU_LUNAR], "iesiri": ["Raport_completitudine_6statii.xlsx"]},
+    # figuri din indicii SPI/SPEI
+    "spi_spei_sezoniere.py": {
+        "intrari": [REZULTATE_SPI],
+        "iesiri": [f"grafice_spi_spei_sezoniere_custom/grafic_{a}.png"
+                   for a in ("primăvară", "vară", "toamnă", "iarnă")]},
+    "spi_spei_semestru_cald.py": {"intrari": [REZULTATE_SPI], "iesiri": ["grafic_spi_spei_semestru_cald.png"]},
+    "spi_spei_semestru_rece.py": {"intrari": [REZULTATE_SPI], "iesiri": ["grafic_spi_spei_semestru_rece.png"]},
+    "diferente_spi3_spei3_anotimpuri.py": {
+        "intrari": [REZULTATE_SPI], "iesiri": ["grafic_diferente_spi3_spei3_anotimpuri.png"]},
+    "spi_spei_diferente_perioade.py": {
+        "intrari": [REZULTATE_SPI], "iesiri": ["grafic_spi_spei_diferente_perioade.png"]},
+    "evolutie_secete_excedente.py": {
+        "intrari": [REZULTATE_SPI], "iesiri": ["grafic_evolutie_secete_excedente.png"]},
+    # figuri Hellmann
+    "calendar_hellmann_categorie_campia_baraganului.py": {
+        "intrari": [PRECIP_6STATII], "iesiri": ["grafic_calendar_hellmann_categorie_baragan.png"]},
+    "distributie_hellmann_pe_statii.py": {
+        "intrari": [PRECIP_6STATII], "iesiri": ["grafic_distributie_clasificari_hellmann_pe_statii.png"]},
+    "distributie_hellmann_stacked_bar_baragan.py": {
+        "intrari": [PRECIP_6STATII], "iesiri": ["grafic_distributie_hellmann_stacked_bar_baragan.png"]},
+    "evolutie_hellmann_deviatie_standard.py": {
+        "intrari": [PRECIP_6STATII], "iesiri": ["grafic_evolutie_hellmann_deviatie_standard_final.png"]},
+    "heatmap_hellmann_campia_baraganului.py": {
+        "intrari": [PRECIP_6STATII], "iesiri": ["grafic_heatmap_hellmann_campia_baraganului.png"]},
+    "top-10-ani-secetosi_baragan.py": {
+        "intrari": [HELLMANN_LUNAR], "iesiri": ["grafic_top-10-ani-secetosi_baragan.png"]},
+    "repartitie_luni_secetoase_baragan.py": {
+        "intrari": [HELLMANN_LUNAR], "iesiri": ["grafic_repartitie_luni_secetoase_baragan.png"]},
+    "frecventa_luni_secetoase_pe-sezon.py": {
+        "intrari": ["Calcul_frecventa_luni-secetoase_pe-anotimp_pas2.xlsx", REGISTRU_LUNAR],
+        "iesiri": ["grafic_frecventa_luni_secetoase_pe-anotimpuri.png"]},
+    # climă: medii anuale, sezoniere și multianuale
+    "boxplot_precipitatii.py": {"intrari": [ANUAL_6190, ANUAL_9120], "iesiri": ["boxplot_precipitatii.png"]},
+    "boxplot_temperaturi.py": {"intrari": [ANUAL_6190, ANUAL_9120], "iesiri": ["boxplot_temperaturi.png"]},
+    "climograma_1961-1990.py": {"intrari": [ANUAL_6190], "iesiri": ["Climograma_1961-1990.png"]},
+    "climograma_1991-2020.py": {"intrari": [ANUAL_9120], "iesiri": ["climograma_1991-2020.png"]},
+    "climograma_baragan_1961-2020.py": {
+        "intrari": [ANUAL_6190, ANUAL_9120], "iesiri": ["climograma_baragan_1961-2020.png"]},
+    "diagrama_walter_lieth_1961-1990.py": {
+        "intrari": ["Date-climatologice-1961-1990.xlsx"], "iesiri": ["diagrama_walter_lieth_1961-1990.png"]},
+    "diagrama_walter_lieth_1991-2020.py": {
+        "intrari": ["Date-climatologice-1991-2020.xlsx"], "iesiri": ["diagrama_walter_lieth_1991-2020.png"]},
+    "etichete_climat_baragan.py": {
+        "intrari": ["Date-climatologice-sezoane-extinse.xlsx"],
+        "iesiri": ["grafic_climat_sezoane_extinse_Campie_Baragan.png"]},
+    "sezon_cald_extins_baragan.py": {
+        "intrari": ["Date-climatologice-sezon-cald-extins_1961-1990.xlsx",
+                    "Date-climatologice-sezon-cald-extins_1991-2020.xlsx"],
+        "iesiri": ["sezon_cald_extins_Bragan.png"]},
+    "sezon_rece_extins_baragan.py": {
+        "intrari": ["Date-climatologice-sezon-rece-extins_1961-1990.xlsx",
+                    "Date-climatologice-sezon-rece-extins_1991-2020.xlsx"],
+        "iesiri": ["sezon_rece_extins_Baragan.png"]},
+    "precipitatii_1961-2020.py": {
+        "intrari": ["Precip-medii-pe-anotimp_1961-2020.xlsx"], "iesiri": ["precipitatii_sezoniere_1961-2020.png"]},
+    "temperaturi_1961-2020.py": {
+        "intrari": ["Temp-medii-pe-anotimp_1961-2020.xlsx"], "iesiri": ["temperaturi_sezoniere_1961-2020.png"]},
+}
+
+
+def niveluri(graf=GRAF):
+    """Ordinea topologică, grupată pe niveluri de noduri independente."""
+    producator = {iesire: nod for nod, d in graf.items() for iesire in d["iesiri"]}
+    dependente = {nod: {producator[i] for i in d["intrari"] if i in producator}
+                  for nod, d in graf.items()}
+    rezultat, facute = [], set()
+    while len(facute) < len(graf):
+        nivel = sorted(n for n, dep in dependente.items() if n not in facute and dep <= facute)
+        if not nivel:
+            raise ValueError("Graful conține un ciclu: " + ", ".join(sorted(set(graf) - facute)))
+        rezultat.append(nivel)
+        facute.update(nivel)
+    return rezultat
+
+
+# ─── 2. Semnături ────────────────────────────────────────────────────────────
+def module_locale(script, vazute=None):
+    """Scriptul și modulele din acest director importate de el (tranzitiv)."""
+    vazute = set() if vazute is None else vazute
+    cale = DIR_SCRIPTURI / script
+    if cale in vazute or not cale.exists():
+        return vazute
+    vazute.add(cale)
+    for nod in ast.walk(ast.parse(cale.read_text(encoding="utf-8"))):
+        nume = []
+        if isinstance(nod, ast.Import):
+            nume = [a.name for a in nod.names]
+        elif isinstance(nod, ast.ImportFrom) and nod.module:
+            nume = [nod.module]
+        for n in nume:
+            module_locale(n.split(".")[0] + ".py", vazute)
+    return vazute
+
+
+class Hashuri:
+    """SHA-256 al fișierelor, recalculat doar când mtime/dimensiunea se schimbă."""
+
+    def __init__(self, memorat):
+        self.memorat = memorat
+
+    def __call__(self, cale):
+        cale = Path(cale)
+        if not cale.exists():
+            return None
+        cheie, curent = str(cale.resolve()), amprenta(cale)
+        vechi = self.memorat.get(cheie)
+        if vechi is None or vechi["sursa"] != curent:
+            vechi = self.memorat[cheie] = {"sursa": curent, "sha256": sha256(cale)}
+        return vechi["sha256"]
+
+
+def semnatura(nod, hashuri, graf=GRAF):
+    h = hashlib.sha256()
+    for cale in sorted(module_locale(nod)):
+        h.update(f"{cale.name}:{hashuri(cale)}\n".encode())
+    for intrare in graf[nod]["intrari"]:
+        h.update(f"{intrare}:{hashuri(intrare)}\n".encode())
+    h.update(json.dumps(ARGUMENTE.get(nod, [])).encode())
+    return h.hexdigest()
+
+
+# ─── 3. Reconstruire incrementală ────────────────────────────────────────────
+def citeste_stare(cale=FISIER_STARE):
+    cale = Path(cale)
+    if cale.exists():
+        return json.loads(cale.read_text(encoding="utf-8"))
+    return {"noduri": {}, "fisiere": {}}
+
+
+def de_reconstruit(nod, stare, hashuri, graf=GRAF):
+    if any(not Path(i).exists() for i in graf[nod]["iesiri"]):
+        return True
+    return stare["noduri"].get(nod) != semnatura(nod, hashuri, graf)
+
+
+def ruleaza(procese=None, tot=False, doar_arata=False, graf=GRAF):
+    stare = citeste_stare()
+    hashuri = Hashuri(stare["fisiere"])
+    rezultate, durata, esuate, programate = [], 0.0, set(), set()
+
+    def depinde_de(nod, alte):
+        return any(i in graf[a]["iesiri"] for a in alte for i in graf[nod]["intrari"])
+
+    for nivel in niveluri(graf):
+        # nodurile care depind de un nod eșuat se sar
+        blocate = {n for n in nivel if depinde_de(n, esuate)}
+        esuate |= blocate
+        noduri = [n for n in nivel if n not in blocate
+                  and (tot or de_reconstruit(n, stare, hashuri, graf))]
+        if doar_arata:
+            # fără rulare, ieșirile noi nu există încă: aval se consideră afectat
+            noduri += [n for n in nivel if n not in noduri and depinde_de(n, programate)]
+            programate.update(noduri)
+            for n in noduri:
+                print(f"  ↻ {n}")
+            continue
+        if not noduri:
+            continue
+
+        rez, sec = construieste([DIR_SCRIPTURI / n for n in noduri], ".", procese)
+        rezultate += rez
+        durata += sec
+        for nume, _, eroare, _ in rez:
+            if eroare:
+                esuate.add(nume)
+            else:
+                stare["noduri"][nume] = semnatura(nume, hashuri, graf)
+
+    if not doar_arata:
+        Path(FISIER_STARE).write_text(json.dumps(stare, ensure_ascii=False, indent=1), encoding="utf-8")
+        if rezultate:
+            raport(rezultate, durata)
+        else:
+            print("Totul este la zi.")
+    return esuate
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Reconstruiește doar tabelele și figurile afectate de modificări")
+    ap.add_argument("-j", "--procese", type=int, default=None, help="număr de procese")
+    ap.add_argument("--tot", action="store_true", help="ignoră semnăturile și reconstruiește tot")
+    ap.add_argument("--arata", action="store_true", help="doar afișează nodurile de reconstruit")
+    args = ap.parse_args()
+
+    esuate = ruleaza(args.procese, args.tot, args.arata)
+    if esuate:
+        sys.exit("Noduri eșuate: " + ", ".join(sorted(esuate)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SPI-3 / SPEI-3 pe grilă (timp × lat × lon) din NetCDF sau Zarr, pe blocuri
+
+Pentru hărțile de secetă ale întregii câmpii, din date de reanaliză lunare:
+   • grila se împarte în blocuri spațiale de BLOC × BLOC celule, cu toată
+     seria de timp; fiecare bloc se citește separat din fișier (xarray,
+     fără a încărca tot tabloul), deci memoria depinde de bloc, nu de grilă
+   • în fiecare bloc celulele devin serii (celule × timp) și trec prin
+     compute_spi_3 / compute_spei_3 din motor_spi_spei.py – aceleași
+     definiții ca la stații (netezire centrată pe 3 luni, gamma / Pearson III)
+   • blocurile se calculează într-un ProcessPoolExecutor; cel mult
+     BLOCURI_IN_ZBOR × procese blocuri sunt simultan în memorie, iar procesul
+     principal le scrie pe rând în ieșire (Zarr sau NetCDF cu chunk-uri de
+     aceeași mărime)
+ETP se ia din variabila `etp` dacă există, altfel se calculează Hargreaves din
+tmin / tmax / tmed și Ra pe latitudinea fiecărui rând al grilei (etp.py), în
+aceleași unități ca la stații. Precipitațiile trebuie să fie în mm/lună, iar
+axa timpului lunară și completă (lunile lipsă = NaN).
+
+xarray este opțional pentru restul proiectului; modul pe grilă are nevoie de
+xarray + netCDF4 (ieșire .nc) sau xarray + zarr + dask (ieșire .zarr).
+
+Rulare:
+    python grila_spi_spei.py era5_lunar.nc spi_spei_baragan.zarr
+    python grila_spi_spei.py intrare.zarr iesire.nc -j 8 --bloc 32 --variabile precip=tp,tmed=t2m
+"""
+
+import argparse
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+import numpy as np
+
+from etp import etp_hargreaves, ra_lunar
+from motor_spi_spei import compute_spi_3, compute_spei_3
+
+try:
+    import xarray as xr
+except ImportError:
+    xr = None
+
+BLOC = 64                                 # celule pe latură într-un bloc spațial
+BLOCURI_IN_ZBOR = 2                       # blocuri în lucru per proces
+# "mle" = ajustarea stațiilor; "lmom" (--metoda lmom) ajustează același model, vectorizat și
+# mult mai rapid, în limitele motor_spi_spei.TOLERANTA_ACORD
+METODA_AJUSTARE = "mle"
+
+# nume canonic → numele variabilei / dimensiunii din fișierul de intrare
+VARIABILE_IMPLICITE = {"precip": "precip", "etp": "etp", "tmin": "tmin", "tmax": "tmax",
+                       "tmed": "tmed", "timp": "time", "lat": "lat", "lon": "lon"}
+
+_ds = None                                # setul de date deschis în fiecare proces
+
+
+def _cere_xarray():
+    if xr is None:
+        raise ImportError("Modul pe grilă are nevoie de xarray (pip install xarray netCDF4 zarr dask)")
+
+
+# ─── 1. Intrare ──────────────────────────────────────────────────────────────
+def deschide(cale):
+    """Setul de date, citit leneș (fără încărcarea valorilor); timpul rămâne numeric."""
+    _cere_xarray()
+    if Path(cale).suffix == ".zarr":
+        return xr.open_zarr(cale, decode_times=False, chunks=None)
+    return xr.open_dataset(cale, decode_times=False)
+
+
+def luni_calendaristice(ds, timp="time"):
+    """Luna (1…12) a fiecărui pas de timp, din coordonata CF a timpului."""
+    return xr.decode_cf(ds[[timp]])[timp].dt.month.to_numpy()
+
+
+def blocuri(n_lat, n_lon, bloc=BLOC):
+    """Perechi (felie lat, felie lon) care acoperă grila."""
+    return [(slice(i, min(i + bloc, n_lat)), slice(j, min(j + bloc, n_lon)))
+            for i in range(0, n_lat, bloc) for j in range(0, n_lon, bloc)]
+
+
+def _citeste(ds, nume, var, felie_lat, felie_lon):
+    """Blocul (timp × lat × lon) al unei variabile, ca float64."""
+    bloc = ds[nume].isel({var["lat"]: felie_lat, var["lon"]: felie_lon})
+    return bloc.transpose(var["timp"], var["lat"], var["lon"]).to_numpy().astype(float)
+
+
+# ─── 2. Calcul pe bloc ───────────────────────────────────────────────────────
+def indici_bloc(p, deficit=None, metoda=METODA_AJUSTARE):
+    """SPI-3 (și SPEI-3, dacă există deficitul P − ETP) pentru un bloc (timp × lat × lon)."""
+    forma = p.shape
+
+    def ca_serii(x):
+        return x.reshape(forma[0], -1).T
+
+    def ca_bloc(x):
+        return x.T.reshape(forma).astype(np.float32)
+
+    rezultat = {"SPI-3": ca_bloc(compute_spi_3(ca_serii(p), metoda))}
+    if deficit is not None:
+        rezultat["SPEI-3"] = ca_bloc(compute_spei_3(ca_serii(deficit), metoda))
+    return rezultat
+
+
+def _initializeaza(intrare):
+    global _ds
+    _ds = deschide(intrare)
+
+
+def _sarcina(felie_lat, felie_lon, ra, luni, var, metoda):
+    """Citește blocul din setul de date al procesului și întoarce indicii lui."""
+    p = _citeste(_ds, var["precip"], var, felie_lat, felie_lon)
+    if var["etp"] in _ds:
+        e = _citeste(_ds, var["etp"], var, felie_lat, felie_lon)
+    elif ra is not None:
+        tmin, tmax, tmed = (_citeste(_ds, var[v], var, felie_lat, felie_lon) for v in ("tmin", "tmax", "tmed"))
+        ra_bloc = ra[felie_lat][:, luni - 1].T[:, :, None]        # (timp × lat × 1)
+        e = etp_hargreaves(tmin, tmax, tmed, ra_bloc)
+    else:
+        e = None
+    return felie_lat, felie_lon, indici_bloc(p, None if e is None else p - e, metoda)
+
+
+def _ruleaza(felii, procese, intrare, *argumente):
+    """Generator de rezultate pe blocuri, cu cel mult BLOCURI_IN_ZBOR × procese în lucru."""
+    if procese == 1:
+        _initializeaza(intrare)
+        for fl, fo in felii:
+            yield _sarcina(fl, fo, *argumente)
+        return
+    procese = procese or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=procese, initializer=_initializeaza,
+                             initargs=(intrare,)) as executor:
+        limita = BLOCURI_IN_ZBOR * procese
+        ramase = iter(felii)
+        in_lucru = set()
+        while True:
+            for fl, fo in ramase:
+                in_lucru.add(executor.submit(_sarcina, fl, fo, *argumente))
+                if len(in_lucru) >= limita:
+                    break
+            if not in_lucru:
+                return
+            gata, in_lucru = wait(in_lucru, return_when=FIRST_COMPLETED)
+            for viitor in gata:
+                yield viitor.result()
+
+
+# ─── 3. Ieșire pe chunk-uri ──────────────────────────────────────────────────
+class IesireZarr:
+    """Depozit Zarr: structura se scrie o dată (dask, fără valori), apoi fiecare bloc pe regiunea lui."""
+
+    def __init__(self, cale, ds, var, indici, bloc):
+        import dask.array as da
+
+        self.cale, self.var = str(cale), var
+        dims = (var["timp"], var["lat"], var["lon"])
+        forma = tuple(ds.sizes[d] for d in dims)
+        bucati = (forma[0], min(bloc, forma[1]), min(bloc, forma[2]))
+        sablon = xr.Dataset({n: (dims, da.full(forma, np.nan, chunks=bucati, dtype=np.float32))
+                             for n in indici},
+                            coords={d: ds[d] for d in dims})
+        sablon.to_zarr(self.cale, mode="w", compute=False)
+
+    def scrie(self, felie_lat, felie_lon, valori):
+        dims = (self.var["timp"], self.var["lat"], self.var["lon"])
+        xr.Dataset({n: (dims, v) for n, v in valori.items()}).to_zarr(
+            self.cale, region={dims[0]: slice(None), dims[1]: felie_lat, dims[2]: felie_lon})
+
+    def inchide(self):
+        pass
+
+
+class IesireNetCDF:
+    """Fișier NetCDF-4 comprimat, cu chunk-uri (timp întreg × bloc × bloc), scris cu netCDF4."""
+
+    def __init__(self, cale, ds, var, indici, bloc):
+        import netCDF4
+
+        self.nc = netCDF4.Dataset(cale, "w")
+        dims = (var["timp"], var["lat"], var["lon"])
+        for d in dims:
+            coord = ds[d]
+            self.nc.createDimension(d, coord.size)
+            v = self.nc.createVariable(d, coord.dtype, (d,))
+            v.setncatts({k: a for k, a in coord.attrs.items() if not k.startswith("_")})
+            v[:] = coord.to_numpy()
+        bucati = (ds.sizes[dims[0]], min(bloc, ds.sizes[dims[1]]), min(bloc, ds.sizes[dims[2]]))
+        for n in indici:
+            self.nc.createVariable(n, "f4", dims, zlib=True, chunksizes=bucati, fill_value=np.nan)
+
+    def scrie(self, felie_lat, felie_lon, valori):
+        for n, v in valori.items():
+            self.nc[n][:, felie_lat, felie_lon] = v
+
+    def inchide(self):
+        self.nc.close()
+
+
+FORMATE_IESIRE = {".zarr": IesireZarr, ".nc": IesireNetCDF}
+
+
+# ─── 4. Interfață ────────────────────────────────────────────────────────────
+def grila_spi_spei(intrare, iesire, variabile=None, bloc=BLOC, procese=None, metoda=METODA_AJUSTARE):
+    """Calculează SPI-3 / SPEI-3 pe toată grila și le scrie în `iesire` (.zarr sau .nc).
+
+    `variabile` suprascrie numele din VARIABILE_IMPLICITE. Întoarce lista
+    indicilor scriși.
+    """
+    var = dict(VARIABILE_IMPLICITE, **(variabile or {}))
+    sufix = Path(iesire).suffix
+    if sufix not in FORMATE_IESIRE:
+        raise ValueError(f"Format de ieșire necunoscut: {sufix!r} (disponibile: {', '.join(FORMATE_IESIRE)})")
+
+    ds = deschide(intrare)
+    luni = luni_calendaristice(ds, var["timp"])
+    cu_temperaturi = all(var[v] in ds for v in ("tmin", "tmax", "tmed"))
+    ra = ra_lunar(ds[var["lat"]].to_numpy()) if var["etp"] not in ds and cu_temperaturi else None
+    indici = ["SPI-3"] + (["SPEI-3"] if var["etp"] in ds or cu_temperaturi else [])
+
+    scriitor = FORMATE_IESIRE[sufix](iesire, ds, var, indici, bloc)
+    felii = blocuri(ds.sizes[var["lat"]], ds.sizes[var["lon"]], bloc)
+    ds.close()
+    try:
+        for felie_lat, felie_lon, valori in _ruleaza(felii, procese, intrare, ra, luni, var, metoda):
+            scriitor.scrie(felie_lat, felie_lon, valori)
+    finally:
+        scriitor.inchide()
+    return indici
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="SPI-3 / SPEI-3 pe grilă (NetCDF / Zarr), pe blocuri")
+    ap.add_argument("intrare", help="fișier NetCDF sau depozit Zarr cu date lunare (timp × lat × lon)")
+    ap.add_argument("iesire", help="ieșirea: .zarr sau .nc")
+    ap.add_argument("-j", "--procese", type=int, default=None, help="număr de procese (implicit: toate nucleele)")
+    ap.add_argument("--bloc", type=int, default=BLOC, help="celule pe latura unui bloc")
+    ap.add_argument("--metoda", default=METODA_AJUSTARE, help="ajustarea distribuțiilor: mle sau lmom")
+    ap.add_argument("--variabile", default="", help="corespondențe canonic=sursă, de ex. precip=tp,lat=latitude")
+    args = ap.parse_args()
+
+    variabile = dict(p.split("=", 1) for p in args.variabile.split(",") if p)
+    indici = grila_spi_spei(args.intrare, args.iesire, variabile, args.bloc, args.procese, args.metoda)
+    print(f"✅ {', '.join(indici)} pe grilă salvate în: {args.iesire}")
+
+
+if __name__ == "__main__":
+    main()
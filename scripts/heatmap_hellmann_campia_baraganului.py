@@ -1,5 +1,4 @@
 
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
@@ -7,26 +6,15 @@ import matplotlib.patches as mpatches
 from matplotlib.cm import ScalarMappable
 from matplotlib.colors import Normalize
 
+from acces_date import citeste_excel
+from hellmann import scoruri, etichete_schema
+
 # 1. Încarcă datele
-df = pd.read_excel("Date-6statii-precipitatii.xlsx")
+df = citeste_excel("Date-6statii-precipitatii.xlsx")
 df.rename(columns={"An_numeric": "An", "Luna_numeric": "Luna"}, inplace=True)
 
-# 2. Clasificare Hellmann numerică
-def scor_hellmann(p):
-    if p < 5:
-        return 1
-    elif p < 10:
-        return 2
-    elif p < 20:
-        return 3
-    elif p < 40:
-        return 4
-    elif p < 60:
-        return 5
-    else:
-        return 6
-
-df["Scor_Hellmann"] = df["precip_total"].apply(scor_hellmann)
+# 2. Clasificare Hellmann numerică (schema cu 6 clase, scor 1–6)
+df["Scor_Hellmann"] = scoruri(df["precip_total"], "6 clase")
 
 # 3. Media regională lunară
 media = df.groupby(["An", "Luna"])["Scor_Hellmann"].mean().unstack()
@@ -56,10 +44,7 @@ plt.xticks(
 plt.yticks(rotation=0, fontweight='bold')
 
 # 5. Legendă cu scoruri 6–1 și culori din colormap în ordine inversă
-etichete = [
-    "Excesiv secetoasă", "Secetoasă", "Moderat secetoasă",
-    "Normală", "Umedă", "Excesiv umedă"
-]
+etichete = etichete_schema("6 clase")
 norm = Normalize(vmin=1, vmax=6)
 sm = ScalarMappable(norm=norm, cmap=cmap)
 colors = [sm.to_rgba(i) for i in range(6, 0, -1)]  # de la 6 la 1
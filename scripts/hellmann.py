@@ -0,0 +1,113 @@
+"""
+Clasificarea Hellmann a precipitațiilor lunare – o singură tabelă de praguri
+
+Schemele folosite în lucrare:
+   • "7 clase": < 5, 10, 20, 40, 60, 100 mm, ≥ 100 mm = Excesiv umedă
+   • "6 clase": aceleași praguri fără clasa „Foarte umedă” (≥ 60 mm = Excesiv umedă)
+Clasificarea este o căutare binară (np.searchsorted) pe tot tabloul; rezultatul
+sunt coduri int8 0…n-1, iar valorile lipsă primesc codul -1.
+
+Calendarul (an × lună) al clasei modale se construiește din coduri cu un
+singur np.bincount pe (an, lună, clasă) și argmax pe axa claselor, iar
+desenarea este un singur pcolormesh cu ListedColormap – deci scalează la
+sute de ani și mii de stații.
+"""
+
+import numpy as np
+import pandas as pd
+
+from instrumentare import cronometrat
+
+SCHEME = {
+    "7 clase": {
+        "praguri": (5, 10, 20, 40, 60, 100),
+        "etichete": ("Excesiv secetoasă", "Secetoasă", "Moderat secetoasă", "Normală",
+                     "Umedă", "Foarte umedă", "Excesiv umedă"),
+    },
+    "6 clase": {
+        "praguri": (5, 10, 20, 40, 60),
+        "etichete": ("Excesiv secetoasă", "Secetoasă", "Moderat secetoasă", "Normală",
+                     "Umedă", "Excesiv umedă"),
+    },
+}
+SCHEMA_IMPLICITA = "7 clase"
+
+
+def _schema(schema):
+    if isinstance(schema, dict):
+        return schema
+    if schema not in SCHEME:
+        raise ValueError(f"Schemă Hellmann necunoscută: {schema!r} (disponibile: {', '.join(SCHEME)})")
+    return SCHEME[schema]
+
+
+def etichete_schema(schema=SCHEMA_IMPLICITA):
+    """Etichetele claselor, de la cea mai secetoasă la cea mai umedă."""
+    return list(_schema(schema)["etichete"])
+
+
+@cronometrat()
+def coduri(precip, schema=SCHEMA_IMPLICITA):
+    """Codul clasei (int8, 0 = Excesiv secetoasă); -1 pentru valori lipsă."""
+    p = np.asarray(precip, dtype=float)
+    cod = np.searchsorted(np.asarray(_schema(schema)["praguri"], dtype=float), p, side="right")
+    return np.where(np.isnan(p), -1, cod).astype(np.int8)
+
+
+def scoruri(precip, schema=SCHEMA_IMPLICITA):
+    """Scorul Hellmann numeric 1…n (float, NaN pentru valori lipsă)."""
+    cod = coduri(precip, schema)
+    return np.where(cod < 0, np.nan, cod + 1.0)
+
+
+def categorii(precip, schema=SCHEMA_IMPLICITA):
+    """pd.Categorical ordonat cu etichetele clasei."""
+    return pd.Categorical.from_codes(coduri(precip, schema), etichete_schema(schema), ordered=True)
+
+
+def etichete(precip, schema=SCHEMA_IMPLICITA):
+    """Etichetele clasei ca tablou de obiecte (None pentru valori lipsă)."""
+    tabel = np.array(etichete_schema(schema) + [None], dtype=object)
+    return tabel[coduri(precip, schema)]
+
+
+# ─── Calendarul clasei modale ────────────────────────────────────────────────
+def clasa_modala(cod, an, luna, n_clase=None, prioritate=None):
+    """Clasa cea mai frecventă pe (an, lună), peste toate stațiile.
+
+    Întoarce (ani, grila), cu grila int8 (ani × 12) pe toți anii dintre primul
+    și ultimul; -1 unde nu există nicio valoare. La egalitate câștigă clasa
+    care apare prima în `prioritate` (implicit codul cel mai mic).
+    """
+    cod = np.asarray(cod, dtype=np.int64)
+    an = np.asarray(an, dtype=np.int64)
+    luna = np.asarray(luna, dtype=np.int64)
+    valid = cod >= 0
+    n_clase = int(cod.max()) + 1 if n_clase is None else n_clase
+    an0, n_ani = an.min(), an.max() - an.min() + 1
+
+    cheie = ((an - an0) * 12 + luna - 1) * n_clase + cod
+    numar = np.bincount(cheie[valid], minlength=n_ani * 12 * n_clase).reshape(n_ani, 12, n_clase)
+    ordine = np.arange(n_clase) if prioritate is None else np.asarray(prioritate)
+    grila = ordine[numar[..., ordine].argmax(axis=-1)]
+    return np.arange(an0, an0 + n_ani), np.where(numar.any(axis=-1), grila, -1).astype(np.int8)
+
+
+def deseneaza_calendar(ax, ani, grila, culori, linii=0.2):
+    """Grila de coduri (ani × luni) ca un singur pcolormesh; celulele -1 rămân albe.
+
+    `culori` are câte o culoare pe cod; cu `linii` = 0 se omit marginile
+    celulelor (recomandat pentru grile foarte mari).
+    """
+    from matplotlib.colors import BoundaryNorm, ListedColormap
+
+    cmap = ListedColormap(culori)
+    cmap.set_bad("white")
+    norma = BoundaryNorm(np.arange(len(culori) + 1) - 0.5, len(culori))
+    x = np.arange(grila.shape[1] + 1) + 0.5
+    y = np.append(ani, ani[-1] + 1) - 0.5
+    ax.pcolormesh(x, y, np.ma.masked_less(grila, 0), cmap=cmap, norm=norma,
+                  edgecolors="white" if linii else "face", linewidth=linii)
+    ax.set_xlim(x[0], x[-1])
+    ax.set_ylim(y[-1], y[0])                      # primul an sus, ca în sns.heatmap
+    ax.set_xticks(np.arange(1, grila.shape[1] + 1))
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Ingestia datelor zilnice (sau sub-zilnice) ale stațiilor → tabelul lunar canonic
+
+Fișierele CSV / text mari se citesc pe bucăți (pd.read_csv(chunksize=…)):
+   1. validare: date calendaristice, limite fizice, Tmin ≤ Tmax – valorile
+      invalide devin NaN și se numără în raport
+   2. agregare la nivel de zi (P = sumă, Tmin = minim, Tmax = maxim, Tmed = medie);
+      ultima zi a fiecărei stații dintr-o bucată rămâne „deschisă” și se
+      completează cu bucata următoare, deci observațiile orare pot fi tăiate
+      oriunde între bucăți
+   3. agregare la nivel de lună, din sume parțiale aditive; temperaturile
+      medii lunare cer cel puțin PRAG_COMPLETITUDINE din zile, iar suma
+      precipitațiilor cere toate zilele – altfel ar lipsi exact zilele
+      nemăsurate; lunile respinse rămân NaN și se numără în raport
+Memoria depinde de mărimea bucății și a tabelului lunar, nu a fișierului.
+Fișierele trebuie să fie ordonate cronologic în cadrul fiecărei stații.
+
+Rezultatul are coloanele registrului Date-climatologice-6statii-3Temp-Prec.xlsx
+(citit de calcule_6statii_spi_spei-3.py), cu aceleași tipuri; lunile noi
+înlocuiesc rândurile existente cu aceeași (Statie, An, Luna), restul
+registrului rămâne neschimbat. Verificator (1.0 = rând verificat, altfel NaN)
+rămâne NaN pentru lunile ingerate.
+
+Rulare:
+    python ingestie_zilnica.py zilnic_braila.csv zilnic_buzau.csv
+    python ingestie_zilnica.py orar.txt --sep "\\s+" --coloane data=DATA,precip=RR,tmin=T,tmax=T,tmed=T
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from acces_date import citeste_excel
+from calendar_climatic import COD_ANOTIMP
+
+REGISTRU_LUNAR = "Date-climatologice-6statii-3Temp-Prec.xlsx"
+RANDURI_PE_BUCATA = 500_000
+PRAG_COMPLETITUDINE = 0.9                 # fracția minimă de zile cu date (medii de temperatură)
+
+# coloana canonică → coloana din fișierul sursă (aceeași sursă poate alimenta
+# Tmin/Tmax/Tmed la date orare de temperatură)
+COLOANE_IMPLICITE = {"statie": "Statie", "data": "Data", "precip": "precip",
+                     "tmin": "tmin", "tmax": "tmax", "tmed": "tmed"}
+LIMITE = {"precip": (0.0, 500.0), "tmin": (-45.0, 45.0), "tmax": (-40.0, 50.0), "tmed": (-45.0, 45.0)}
+VARIABILE = ("precip", "tmin", "tmax", "tmed")
+
+# etichetele de anotimp exact ca în registrul lunar (ordinea codurilor din calendar_climatic)
+ETICHETE_ANOTIMP = np.array(["Iarna", "Primăvara", "Vara", "Toamna"], dtype=object)
+COLOANE_REGISTRU = ["Statie", "Longitude", "Latitude", "tmed_med", "tmin_med", "tmax_med",
+                    "precip_total", "An", "Luna", "An_numeric", "Luna_numeric", "Verificator", "Anotimp"]
+
+# sumele parțiale zilnice și modul în care se combină între bucăți
+_PARTIAL_ZI = {"p_suma": "sum", "p_n": "sum", "tmin": "min", "tmax": "max", "t_suma": "sum", "t_n": "sum"}
+
+
+# ─── 1. Citire și validare ───────────────────────────────────────────────────
+def citeste_bucati(cale, coloane=None, randuri=RANDURI_PE_BUCATA, sep=",", format_data=None, statie=None):
+    """Generator de bucăți cu coloanele canonice (statie, zi, precip, tmin, tmax, tmed)."""
+    coloane = dict(COLOANE_IMPLICITE, **(coloane or {}))
+    surse = {c for k, c in coloane.items() if c and not (k == "statie" and statie)}
+    cititor = pd.read_csv(cale, sep=sep, chunksize=randuri, engine="c" if len(sep) == 1 else "python",
+                          usecols=lambda c: c in surse)
+    for bucata in cititor:
+        momente = pd.to_datetime(bucata[coloane["data"]], format=format_data, errors="coerce")
+        canonic = pd.DataFrame({
+            "statie": statie if statie else bucata[coloane["statie"]].astype(str).str.strip(),
+            "zi": momente.dt.normalize(),
+        })
+        for v in VARIABILE:
+            sursa = coloane.get(v)
+            canonic[v] = (pd.to_numeric(bucata[sursa], errors="coerce")
+                          if sursa in bucata.columns else np.nan)
+        yield canonic
+
+
+def valideaza(bucata, raport):
+    """Elimină rândurile fără dată/stație și anulează valorile în afara limitelor."""
+    fara_data = bucata["zi"].isna() | bucata["statie"].isna()
+    raport["randuri"] += len(bucata)
+    raport["fara_data"] += int(fara_data.sum())
+    bucata = bucata[~fara_data].copy()
+
+    for v, (jos, sus) in LIMITE.items():
+        x = bucata[v].to_numpy()
+        gresit = (x < jos) | (x > sus)
+        raport[f"{v}_invalid"] += int(gresit.sum())
+        bucata.loc[gresit, v] = np.nan
+    inversat = (bucata["tmin"] > bucata["tmax"]).to_numpy()
+    raport["tmin_peste_tmax"] += int(inversat.sum())
+    bucata.loc[inversat, ["tmin", "tmax"]] = np.nan
+    return bucata
+
+
+# ─── 2. Agregare zilnică cu zile deschise între bucăți ───────────────────────
+def _partial_zilnic(bucata):
+    return bucata.assign(p_suma=bucata["precip"], p_n=bucata["precip"].notna().astype(int),
+                         t_suma=bucata["tmed"], t_n=bucata["tmed"].notna().astype(int)) \
+        .groupby(["statie", "zi"], sort=False).agg(
+            p_suma=("p_suma", "sum"), p_n=("p_n", "sum"), tmin=("tmin", "min"),
+            tmax=("tmax", "max"), t_suma=("t_suma", "sum"), t_n=("t_n", "sum"))
+
+
+def _inchide_zile(partial):
+    """Valorile zilnice finale din sumele parțiale."""
+    zi = partial.reset_index()
+    tmed = np.where(zi["t_n"] > 0, zi["t_suma"] / zi["t_n"].where(zi["t_n"] > 0), (zi["tmin"] + zi["tmax"]) / 2)
+    return pd.DataFrame({"statie": zi["statie"], "an": zi["zi"].dt.year, "luna": zi["zi"].dt.month,
+                         "zile_luna": zi["zi"].dt.days_in_month,
+                         "precip": zi["p_suma"].where(zi["p_n"] > 0), "tmin": zi["tmin"],
+                         "tmax": zi["tmax"], "tmed": tmed})
+
+
+def _partial_lunar(zile):
+    """Sume și numere de zile pe (stație, an, lună) – aditive între bucăți."""
+    prezent = zile[list(VARIABILE)].notna().astype(int).add_suffix("_n")
+    return pd.concat([zile, prezent], axis=1).groupby(["statie", "an", "luna"], sort=False).agg(
+        zile_luna=("zile_luna", "first"),
+        **{f"{v}_suma": (v, "sum") for v in VARIABILE},
+        **{f"{v}_n": (f"{v}_n", "sum") for v in VARIABILE})
+
+
+def agrega_lunar(bucati, prag=PRAG_COMPLETITUDINE):
+    """Tabel lunar (statie, an, luna, precip_total, tmin_med, tmax_med, tmed_med) și raportul validării."""
+    raport = dict.fromkeys(["randuri", "fara_data", "tmin_peste_tmax", "nesortate"]
+                           + [f"{v}_invalid" for v in LIMITE]
+                           + [f"{v}_luni_incomplete" for v in VARIABILE], 0)
+    deschise = None
+    ultima_inchisa = pd.Series(dtype="datetime64[ns]")
+    lunare = []
+
+    for bucata in bucati:
+        partial = _partial_zilnic(valideaza(bucata, raport))
+        if deschise is not None:
+            partial = pd.concat([deschise, partial]).groupby(level=[0, 1], sort=False).agg(_PARTIAL_ZI)
+
+        # zilele deja închise care reapar înseamnă un fișier neordonat
+        zile = partial.index.get_level_values("zi")
+        limita = ultima_inchisa.reindex(partial.index.get_level_values("statie")).to_numpy()
+        vechi = zile.to_numpy() <= limita
+        if vechi.any():
+            raport["nesortate"] += int(vechi.sum())
+            partial = partial[~vechi]
+
+        # ultima zi a fiecărei stații rămâne deschisă
+        ultima = ~partial.index.get_level_values("statie").duplicated(keep="last")
+        deschise, inchise = partial[ultima], partial[~ultima]
+        if len(inchise):
+            lunare.append(_partial_lunar(_inchide_zile(inchise)))
+            maxim = inchise.reset_index().groupby("statie")["zi"].max()
+            ultima_inchisa = pd.concat([ultima_inchisa, maxim]).groupby(level=0).max()
+
+    if deschise is not None and len(deschise):
+        lunare.append(_partial_lunar(_inchide_zile(deschise)))
+    if not lunare:
+        raise ValueError("Nicio observație validă în fișierele de intrare")
+
+    suma = pd.concat(lunare).groupby(level=[0, 1, 2]).agg(
+        {"zile_luna": "first", **{c: "sum" for c in lunare[0].columns if c != "zile_luna"}})
+    rezultat = suma.index.to_frame(index=False)
+    for v, nume in zip(VARIABILE, ("precip_total", "tmin_med", "tmax_med", "tmed_med")):
+        zile_cerute = suma["zile_luna"].to_numpy() * (1.0 if v == "precip" else prag)
+        complet = suma[f"{v}_n"].to_numpy() >= zile_cerute
+        raport[f"{v}_luni_incomplete"] = int((~complet).sum())
+        valoare = suma[f"{v}_suma"] if v == "precip" else suma[f"{v}_suma"] / suma[f"{v}_n"].where(suma[f"{v}_n"] > 0)
+        rezultat[nume] = np.where(complet, valoare.to_numpy(), np.nan)
+    return rezultat, raport
+
+
+# ─── 3. Tabelul canonic ──────────────────────────────────────────────────────
+def tabel_canonic(lunar, coordonate):
+    """Coloanele registrului lunar; `coordonate` are Statie, Longitude, Latitude."""
+    luna = lunar["luna"].to_numpy(dtype=int)
+    df = pd.DataFrame({"Statie": lunar["statie"].to_numpy(),
+                       "tmed_med": lunar["tmed_med"], "tmin_med": lunar["tmin_med"],
+                       "tmax_med": lunar["tmax_med"], "precip_total": lunar["precip_total"],
+                       "An": lunar["an"].to_numpy(dtype=int), "Luna": luna,
+                       "An_numeric": lunar["an"].to_numpy(dtype=int), "Luna_numeric": luna})
+    df["Verificator"] = np.nan                # lunile ingerate nu sunt verificate
+    df["Anotimp"] = ETICHETE_ANOTIMP[COD_ANOTIMP[luna]]
+    df = df.merge(coordonate[["Statie", "Longitude", "Latitude"]].drop_duplicates("Statie"),
+                  on="Statie", how="left")
+    fara = sorted(df.loc[df["Latitude"].isna(), "Statie"].unique())
+    if fara:
+        raise ValueError("Stații fără coordonate: " + ", ".join(fara))
+    return df[COLOANE_REGISTRU]
+
+
+def _tip(coloana):
+    if pd.api.types.is_bool_dtype(coloana):
+        return "bool"
+    return "numeric" if pd.api.types.is_numeric_dtype(coloana) else "text"
+
+
+def verifica_compatibil(nou, vechi):
+    """Eroare dacă `nou` nu are tipurile registrului `vechi` sau Verificator are alte
+    valori decât 1.0 / NaN."""
+    diferite = [f"{c} ({_tip(nou[c])} în loc de {_tip(vechi[c])})"
+                for c in COLOANE_REGISTRU if c in vechi.columns and _tip(nou[c]) != _tip(vechi[c])]
+    if diferite:
+        raise ValueError("Tipuri diferite de registru: " + ", ".join(diferite))
+    if not nou["Verificator"].dropna().eq(1.0).all():
+        raise ValueError("Verificator trebuie să fie 1.0 sau NaN")
+
+
+def scrie_registru(nou, cale=REGISTRU_LUNAR):
+    """Înlocuiește/adaugă lunile din `nou` în registrul lunar existent."""
+    cale = Path(cale)
+    if cale.exists():
+        vechi = citeste_excel(cale)
+        vechi.columns = vechi.columns.str.strip()
+        verifica_compatibil(nou, vechi)
+        cheie = ["Statie", "An_numeric", "Luna_numeric"]
+        pastrat = vechi.merge(nou[cheie], on=cheie, how="left", indicator=True)["_merge"] == "left_only"
+        nou = pd.concat([vechi[pastrat.to_numpy()], nou], ignore_index=True)
+    nou = nou.sort_values(["Statie", "Luna_numeric", "An_numeric"], kind="stable")
+    nou.to_excel(cale, index=False)
+    return nou
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Agregă fișiere zilnice/orare în registrul lunar al stațiilor")
+    ap.add_argument("fisiere", nargs="+", help="fișiere CSV / text cu observații")
+    ap.add_argument("-o", "--registru", default=REGISTRU_LUNAR, help="registrul lunar de actualizat")
+    ap.add_argument("--statii", default=None,
+                    help="tabel (CSV/Excel) cu Statie, Longitude, Latitude (implicit: din registru)")
+    ap.add_argument("--statie", default=None, help="numele stației, dacă fișierul nu are coloană de stație")
+    ap.add_argument("--sep", default=",", help="separator (de ex. ';' sau '\\s+')")
+    ap.add_argument("--coloane", default="", help="corespondențe canonic=sursă, de ex. data=DATE,precip=PRCP")
+    ap.add_argument("--format-data", default=None, help="formatul datei, de ex. %%d.%%m.%%Y")
+    ap.add_argument("--bucata", type=int, default=RANDURI_PE_BUCATA, help="rânduri pe bucată")
+    args = ap.parse_args()
+
+    coloane = dict(p.split("=", 1) for p in args.coloane.split(",") if p)
+    bucati = (b for f in args.fisiere
+              for b in citeste_bucati(f, coloane, args.bucata, args.sep, args.format_data, args.statie))
+    lunar, raport = agrega_lunar(bucati)
+
+    sursa_coord = args.statii or args.registru
+    if not Path(sursa_coord).exists():
+        sys.exit(f"Lipsesc coordonatele stațiilor: {sursa_coord}")
+    coordonate = (pd.read_csv(sursa_coord) if sursa_coord.endswith(".csv") else citeste_excel(sursa_coord))
+    coordonate.columns = coordonate.columns.str.strip()
+    scrie_registru(tabel_canonic(lunar, coordonate), args.registru)
+
+    print(f"✅ {len(lunar)} luni-stație scrise în {args.registru}")
+    for cheie, valoare in raport.items():
+        print(f"   {cheie:18} {valoare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Instrumentare ușoară: cronometre pe etape, vârfuri de memorie, trasee JSON/CSV
+
+Etapele sunt numite și grupate pe categorii – „incarcare”, „calcul”,
+„desenare”, „salvare” – și se pot imbrica; pentru fiecare se păstrează durata
+totală și cea exclusivă (fără etapele copil), RSS-ul maxim al procesului și,
+opțional, vârful alocărilor urmărite de tracemalloc.
+
+Totul este inactiv (un singur test de variabilă) până la setarea mediului:
+   INSTRUMENTARE=1           cronometre + RSS maxim
+   INSTRUMENTARE=memorie     în plus vârful tracemalloc pe etapă (mai lent)
+   INSTRUMENTARE_DIR=…       directorul traseelor (implicit .trasee/)
+   INSTRUMENTARE_PROFIL=cprofile | pyinstrument   profil complet al rulării
+La activare se instrumentează și pd.read_excel, Figure.draw și Figure.savefig,
+deci fiecare script (toate importă acces_date.py) își cronometrează citirea,
+desenarea și salvarea fără alte modificări. Un traseu per rulare (sau per
+script în construieste_figuri.py) se scrie ca <script>_<pid>_<oră>.json / .csv.
+
+Rulare:
+    INSTRUMENTARE=1 python ../scripts/spi_spei_sezoniere.py
+    INSTRUMENTARE=1 INSTRUMENTARE_PROFIL=cprofile python ../scripts/construieste_figuri.py
+"""
+
+import atexit
+import csv
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:                       # Windows: fără RSS maxim
+    resource = None
+
+MOD = os.environ.get("INSTRUMENTARE", "").strip().lower()
+ACTIV = MOD not in ("", "0", "nu", "false")
+DIR_TRASEE = os.environ.get("INSTRUMENTARE_DIR", ".trasee")
+PROFIL = os.environ.get("INSTRUMENTARE_PROFIL", "").strip().lower()
+
+CATEGORII = ("incarcare", "calcul", "desenare", "salvare")
+COLOANE_CSV = ["etapa", "categorie", "parinte", "adancime", "inceput_s", "durata_s",
+               "exclusiv_s", "rss_max_mb", "varf_alocari_mb"]
+
+_stare = {"etape": [], "stiva": [], "t0": time.perf_counter(), "script": None, "profil": None}
+
+
+def _rss_max_mb():
+    if resource is None:
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(kb / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)   # macOS: octeți
+
+
+# ─── 1. Etape ────────────────────────────────────────────────────────────────
+@contextmanager
+def etapa(nume, categorie="calcul"):
+    """Cronometrează blocul `with` ca etapă (imbricată în etapa curentă, dacă există)."""
+    if not ACTIV:
+        yield
+        return
+    stiva = _stare["stiva"]
+    cadru = {"etapa": nume, "categorie": categorie, "copii_s": 0.0, "varf": 0,
+             "parinte": stiva[-1]["etapa"] if stiva else "", "adancime": len(stiva)}
+    if tracemalloc.is_tracing():
+        if stiva:
+            stiva[-1]["varf"] = max(stiva[-1]["varf"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+    stiva.append(cadru)
+    inceput = time.perf_counter()
+    try:
+        yield
+    finally:
+        durata = time.perf_counter() - inceput
+        stiva.pop()
+        varf = None
+        if tracemalloc.is_tracing():
+            cadru["varf"] = max(cadru["varf"], tracemalloc.get_traced_memory()[1])
+            varf = round(cadru["varf"] / 2**20, 1)
+            if stiva:
+                stiva[-1]["varf"] = max(stiva[-1]["varf"], cadru["varf"])
+        if stiva:
+            stiva[-1]["copii_s"] += durata
+        _stare["etape"].append({
+            "etapa": nume, "categorie": categorie, "parinte": cadru["parinte"],
+            "adancime": cadru["adancime"], "inceput_s": round(inceput - _stare["t0"], 6),
+            "durata_s": round(durata, 6), "exclusiv_s": round(durata - cadru["copii_s"], 6),
+            "rss_max_mb": _rss_max_mb(), "varf_alocari_mb": varf,
+        })
+
+
+def cronometrat(categorie="calcul", nume=None):
+    """Decorator: fiecare apel al funcției devine o etapă (fără cost când e inactiv)."""
+    def decorator(functie):
+        eticheta = nume or functie.__qualname__
+
+        @functools.wraps(functie)
+        def invelis(*args, **kwargs):
+            if not ACTIV:
+                return functie(*args, **kwargs)
+            with etapa(eticheta, categorie):
+                return functie(*args, **kwargs)
+        return invelis
+    return decorator
+
+
+def _instrumenteaza(obiect, atribut, categorie, nume):
+    original = getattr(obiect, atribut)
+    if getattr(original, "_instrumentat", False):
+        return
+    invelis = cronometrat(categorie, nume)(original)
+    invelis._instrumentat = True
+    setattr(obiect, atribut, invelis)
+
+
+# ─── 2. Trasee ───────────────────────────────────────────────────────────────
+def sumar(etape=None):
+    """Secunde exclusive pe categorie, pentru traseul curent."""
+    rezultat = dict.fromkeys(CATEGORII, 0.0)
+    for e in _stare["etape"] if etape is None else etape:
+        rezultat[e["categorie"]] = rezultat.get(e["categorie"], 0.0) + e["exclusiv_s"]
+    return {c: round(s, 6) for c, s in rezultat.items()}
+
+
+def scrie_traseu(script=None, director=None):
+    """Scrie etapele acumulate (JSON + CSV) și le golește; întoarce calea JSON."""
+    if not _stare["etape"]:
+        return None
+    script = script or _stare["script"] or Path(sys.argv[0] or "interactiv").stem
+    director = Path(director or DIR_TRASEE)
+    director.mkdir(parents=True, exist_ok=True)
+    baza = director / f"{script}_{os.getpid()}_{datetime.now():%Y%m%d-%H%M%S}"
+
+    etape = sorted(_stare["etape"], key=lambda e: e["inceput_s"])
+    traseu = {"script": script, "pid": os.getpid(), "mod": MOD,
+              "durata_totala_s": round(time.perf_counter() - _stare["t0"], 6),
+              "rss_max_mb": _rss_max_mb(), "sumar": sumar(etape), "etape": etape}
+    cale_json = baza.with_suffix(".json")
+    cale_json.write_text(json.dumps(traseu, ensure_ascii=False, indent=1), encoding="utf-8")
+    with open(baza.with_suffix(".csv"), "w", newline="", encoding="utf-8") as f:
+        scriitor = csv.DictWriter(f, fieldnames=COLOANE_CSV)
+        scriitor.writeheader()
+        scriitor.writerows(etape)
+    _scrie_profil(baza)
+    _stare["etape"].clear()
+    _stare["t0"] = time.perf_counter()
+    return cale_json
+
+
+# ─── 3. Profilare completă (opțională) ───────────────────────────────────────
+def _porneste_profil():
+    if PROFIL == "cprofile":
+        import cProfile
+        profil = cProfile.Profile()
+        profil.enable()
+    elif PROFIL == "pyinstrument":
+        from pyinstrument import Profiler
+        profil = Profiler()
+        profil.start()
+    else:
+        return
+    _stare["profil"] = profil
+
+
+def _scrie_profil(baza):
+    profil = _stare["profil"]
+    if profil is None:
+        return
+    if PROFIL == "cprofile":
+        profil.disable()
+        profil.dump_stats(baza.with_suffix(".prof"))
+        profil.enable()
+    else:
+        profil.stop()
+        baza.with_suffix(".html").write_text(profil.output_html(), encoding="utf-8")
+        profil.reset()
+        profil.start()
+
+
+@contextmanager
+def sesiune(script):
+    """O rulare cu traseu propriu (ex. un script executat de construieste_figuri.py)."""
+    if not ACTIV:
+        yield
+        return
+    scrie_traseu()                                  # ce s-a acumulat înainte (importuri)
+    _stare["script"] = script
+    try:
+        with etapa(script, "script"):
+            yield
+    finally:
+        scrie_traseu(script)
+        _stare["script"] = None
+
+
+# ─── 4. Activare ─────────────────────────────────────────────────────────────
+def activeaza():
+    """Instrumentează funcțiile din biblioteci și programează scrierea traseului la ieșire."""
+    import pandas as pd
+    _instrumenteaza(pd, "read_excel", "incarcare", "pd.read_excel")
+    try:
+        from matplotlib.figure import Figure
+    except ImportError:
+        pass
+    else:
+        _instrumenteaza(Figure, "draw", "desenare", "Figure.draw")
+        _instrumenteaza(Figure, "savefig", "salvare", "Figure.savefig")
+    if MOD == "memorie" and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _porneste_profil()
+    atexit.register(scrie_traseu)
+
+
+if ACTIV:
+    activeaza()
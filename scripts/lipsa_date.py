@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Modelul datelor lipsă: calendar complet, măști de validitate, adnotări, raport
+
+Lipsurile se deduc din date, nu se scriu de mână în scripturi:
+   • completeaza_ani / mascheaza_ani – axa anilor devine continuă, iar anii
+     fără observații (în registrul lunar canonic) devin NaN și în tabelele
+     derivate care i-au completat cu 0
+   • intervale_lipsa / adnoteaza_lipsuri – fiecare interval consecutiv fără
+     date este marcat pe grafic (bandă, linie, etichetă), fără redesenarea
+     figurii
+   • raport_completitudine – pe stație și variabilă: luni așteptate, luni cu
+     înregistrare, luni valide și intervalele lipsă, pe calendarul complet;
+     sursa este registrul lunar sau cubul de date (cub_date.py), citit după
+     masca lui de validitate (Cub.valid)
+
+Rulare (din directorul cu registrele Excel):
+    python ../scripts/lipsa_date.py [director_cub]
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from acces_date import citeste_excel
+from cub_date import deschide_cub, Cub
+from motor_spi_spei import pivoteaza
+
+REGISTRU_LUNAR = "Date-climatologice-6statii-3Temp-Prec.xlsx"
+OUTPUT_FILE = "Raport_completitudine_6statii.xlsx"
+VARIABILE = ["precip_total", "tmed_med", "tmin_med", "tmax_med"]
+ETICHETA = "lipsă date"
+
+
+# ─── 1. Axa anilor ───────────────────────────────────────────────────────────
+def completeaza_ani(tabel, coloana_an=None, ani=None):
+    """Reindexează pe toți anii dintre primul și ultimul (sau pe `ani`); anii noi sunt NaN.
+
+    Fără `coloana_an`, anii sunt indexul tabelului (Series sau DataFrame).
+    """
+    index = tabel.index if coloana_an is None else tabel[coloana_an]
+    ani = np.arange(int(index.min()), int(index.max()) + 1) if ani is None else ani
+    if coloana_an is None:
+        return tabel.reindex(ani)
+    return tabel.set_index(coloana_an).reindex(ani).rename_axis(coloana_an).reset_index()
+
+
+def ani_fara_date(tabel, coloana_an="An_numeric", coloane=None):
+    """Anii din intervalul acoperit fără nicio valoare validă în `coloane`."""
+    index = tabel.index if coloana_an is None else tabel[coloana_an]
+    if coloane is None:
+        coloane = [c for c in tabel.select_dtypes("number").columns if c != coloana_an]
+    are_date = tabel[coloane].notna().any(axis=1).to_numpy()
+    ani = np.asarray(index, dtype=int)
+    toti = np.arange(ani.min(), ani.max() + 1)
+    return np.setdiff1d(toti, ani[are_date])
+
+
+def ani_fara_date_registru(cale=REGISTRU_LUNAR):
+    """Anii fără observații în registrul lunar canonic (sursa tuturor tabelelor derivate)."""
+    df = citeste_excel(cale)
+    df.columns = df.columns.str.strip()
+    return ani_fara_date(df, "An_numeric", VARIABILE)
+
+
+def mascheaza_ani(tabel, ani, coloana_an=None):
+    """Copie a tabelului cu valorile anilor `ani` puse pe NaN (coloana anului rămâne)."""
+    tabel = tabel.copy()
+    index = tabel.index if coloana_an is None else tabel[coloana_an]
+    lipsa = np.isin(np.asarray(index), ani)
+    coloane = [c for c in tabel.columns if c != coloana_an]
+    tabel.loc[lipsa, coloane] = np.nan
+    return tabel
+
+
+# ─── 2. Intervale și adnotări pe grafic ──────────────────────────────────────
+def intervale_lipsa(x, valid=None):
+    """Intervalele (început, sfârșit) consecutive de pași întregi fără date.
+
+    Lipsă înseamnă fie `valid` fals, fie o valoare întreagă absentă din `x`.
+    """
+    x = np.asarray(x, dtype=int)
+    valid = np.ones(x.size, dtype=bool) if valid is None else np.asarray(valid, dtype=bool)
+    toti = np.arange(x.min(), x.max() + 1)
+    prezent = np.zeros(toti.size + 2, dtype=bool)
+    prezent[0] = prezent[-1] = True
+    prezent[1:-1][x[valid] - x.min()] = True
+    schimbari = np.flatnonzero(np.diff(prezent.astype(np.int8)))
+    return [(int(toti[a]), int(toti[b - 1])) for a, b in zip(schimbari[::2], schimbari[1::2])]
+
+
+def adnoteaza_lipsuri(ax, x, valid=None, eticheta=ETICHETA, culoare="gray"):
+    """Marchează pe `ax` fiecare interval fără date: bandă, linie punctată și etichetă verticală."""
+    for inceput, sfarsit in intervale_lipsa(x, valid):
+        mijloc = (inceput + sfarsit) / 2
+        text = str(inceput) if inceput == sfarsit else f"{inceput}–{sfarsit}"
+        ax.axvspan(inceput - 0.5, sfarsit + 0.5, color=culoare, alpha=0.08, lw=0, zorder=0)
+        ax.axvline(mijloc, color=culoare, linestyle="--", linewidth=1, alpha=0.6, zorder=0)
+        ax.text(mijloc, 0.98, f"{text}\n({eticheta})", transform=ax.get_xaxis_transform(),
+                rotation=90, ha="center", va="top", fontsize=8, color=culoare,
+                bbox=dict(facecolor="white", edgecolor="none", alpha=0.8, pad=1))
+
+
+# ─── 3. Raport de completitudine ─────────────────────────────────────────────
+def _luna_text(cheie):
+    return f"{cheie // 12}-{cheie % 12 + 1:02d}"
+
+
+def _inregistrari(sursa, statii, cheie, statie, an, luna):
+    """(statii × timp): luna are o înregistrare – rând în tabel sau masca cubului."""
+    if isinstance(sursa, Cub):
+        return np.asarray(sursa.valid()).reshape(len(statii), -1)[:, cheie - sursa.an0 * 12]
+    rand = pivoteaza(sursa.assign(_inregistrare=1.0), ["_inregistrare"], statie, an, luna)[3][0]
+    return ~np.isnan(rand)
+
+
+def raport_completitudine(df, variabile=VARIABILE, statie="Statie", an="An_numeric", luna="Luna_numeric"):
+    """Un rând pe (stație, variabilă): luni așteptate, cu înregistrare, valide, procent și
+    intervalele lipsă. `df` este tabelul lung sau un cub lunar (cub_date.Cub)."""
+    statii, ani, luni, cub = pivoteaza(df, variabile, statie, an, luna)
+    cheie = ani * 12 + luni - 1
+    valid = ~np.isnan(cub)
+    inregistrat = _inregistrari(df, statii, cheie, statie, an, luna)
+    randuri = []
+    for k, variabila in enumerate(variabile):
+        for s, nume in enumerate(statii):
+            lipsuri = intervale_lipsa(cheie, valid[k, s])
+            randuri.append({
+                "Statie": nume, "Variabila": variabila,
+                "Luni_asteptate": cheie.size, "Luni_inregistrate": int(inregistrat[s].sum()),
+                "Luni_valide": int(valid[k, s].sum()),
+                "Procent": round(100 * valid[k, s].mean(), 1),
+                "Lipsuri": "; ".join(_luna_text(a) if a == b else f"{_luna_text(a)}…{_luna_text(b)}"
+                                     for a, b in lipsuri),
+            })
+    return pd.DataFrame(randuri)
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        sursa = deschide_cub(sys.argv[1])
+    else:
+        sursa = citeste_excel(REGISTRU_LUNAR)
+        sursa.columns = sursa.columns.str.strip()
+    raport = raport_completitudine(sursa)
+    raport.to_excel(OUTPUT_FILE, index=False)
+    print(raport.to_string(index=False))
+    print(f"✅ Raport de completitudine salvat în fișierul: {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+"""
+Motor vectorizat SPI / SPEI pentru mai multe serii deodată
+(stații meteorologice sau celule de grilă).
+
+Datele intră ca tablou 2-D (serii × timp); netezirea, transformarea CDF și
+normalizarea se fac pe tot tabloul într-o singură trecere, iar rezultatul se
+asamblează direct ca tabel pe coloane (fără dicționare rând cu rând).
+
+Modul multi-scară (1, 3, 6, 9, 12, 24 luni) construiește toate acumulările
+dintr-o singură sumă cumulativă pe serie. Lunile lipsă rămân NaN pe axa
+calendaristică completă: ferestrele care le ating nu primesc valoare, iar
+ajustarea ignoră valorile NaN. Distribuțiile se ajustează separat
+pentru fiecare lună calendaristică (SPI: gamma cu loc = 0 pe valorile pozitive
+plus probabilitatea de zero p0, H = p0 + (1 − p0)·G; SPEI: Pearson III cu 3
+parametri), iar parametrii se păstrează într-un
+depozit (CSV) ca rulările ulterioare să evalueze doar CDF-ul; depozitul
+ține și formula ETP a SPEI și o amprentă a eșantionului ajustat, deci o altă
+variantă ETP sau un istoric revizuit duc la reajustare, nu la parametri vechi.
+
+Ajustarea are două metode: "mle" (scipy `.fit`, serie cu serie) și "lmom"
+(estimatori L-momente în formă închisă pentru gamma și Pearson III, Hosking
+1990 – vectorizați pe tot lotul).
+"""
+
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy.special import gammaln
+from scipy.stats import gamma, pearson3, norm
+
+from cub_date import Cub
+from instrumentare import cronometrat
+
+CLIP_CDF = 1e-6
+# Acordul metodelor: |indice "mle" − indice "lmom"| (medie, cuantila 99 %) admis;
+# în cozi (|z| > 3, câteva valori din 60) estimatorii pot diferi mai mult.
+TOLERANTA_ACORD = {"SPI": (0.05, 0.3), "SPEI": (0.1, 0.8)}
+SCARI_STANDARD = (1, 3, 6, 9, 12, 24)
+
+# ─── 1. Format lung → tablou (serii × timp) ──────────────────────────────────
+def pivoteaza(df, coloane, statie="Statie", an="An_numeric", luna="Luna_numeric", complet=True):
+    """Returnează (statii, ani, luni, cub) cu cub de formă (coloane × statii × timp).
+
+    Axa timpului este calendarul complet dintre prima și ultima lună; lunile
+    fără rânduri (de ex. 2014) rămân NaN, deci acumulările mobile nu trec peste
+    ele. Cu `complet=False` axa conține doar lunile prezente în date. `df` poate
+    fi și un cub lunar (cub_date.Cub), citit după masca lui de validitate.
+    """
+    if isinstance(df, Cub):
+        return df.pivoteaza(coloane, complet)
+    coduri_st, statii = pd.factorize(df[statie], sort=False)
+    cheie = df[an].to_numpy(dtype=np.int64) * 12 + df[luna].to_numpy(dtype=np.int64) - 1
+    if complet:
+        timp = np.arange(cheie.min(), cheie.max() + 1)
+        coduri_t = cheie - timp[0]
+    else:
+        timp, coduri_t = np.unique(cheie, return_inverse=True)
+
+    cub = np.full((len(coloane), len(statii), len(timp)), np.nan)
+    for k, col in enumerate(coloane):
+        cub[k, coduri_st, coduri_t] = df[col].to_numpy(dtype=float)
+    return np.asarray(statii), timp // 12, timp % 12 + 1, cub
+
+
+# ─── 2. Acumulări mobile dintr-o singură sumă cumulativă ─────────────────────
+def acumulari(serii, scari, centrat=False):
+    """Sume mobile pe ferestrele `scari` (luni), pe ultima axă a tabloului.
+
+    Implicit fereastra se termină în luna curentă (definiția SPI/SPEI); primele
+    k-1 luni și ferestrele care ating un NaN rămân NaN. Cu `centrat=True`
+    fereastra este centrată, cu marginile extinse ca în
+    `uniform_filter1d(mode='nearest')` (varianta SPI-3 / SPEI-3 istorică).
+    """
+    serii = np.atleast_2d(np.asarray(serii, dtype=float))
+    n = serii.shape[-1]
+    stanga = 0
+    if centrat:
+        stanga = max(k // 2 for k in scari)
+        dreapta = max(k - 1 - k // 2 for k in scari)
+        latimi = [(0, 0)] * (serii.ndim - 1) + [(stanga, dreapta)]
+        serii = np.pad(serii, latimi, mode="edge")
+
+    valid = ~np.isnan(serii)
+    zero = np.zeros(serii.shape[:-1] + (1,))
+    suma_cum = np.concatenate([zero, np.cumsum(np.where(valid, serii, 0.0), axis=-1)], axis=-1)
+    nr_cum = np.concatenate([zero, np.cumsum(valid, axis=-1)], axis=-1)
+
+    rezultat = {}
+    for k in scari:
+        sfarsit = np.arange(n) + 1
+        if centrat:
+            sfarsit = sfarsit + stanga + (k - 1 - k // 2)
+        inceput = sfarsit - k
+        complet = inceput >= 0
+        inceput = np.maximum(inceput, 0)
+        suma = suma_cum[..., sfarsit] - suma_cum[..., inceput]
+        nr = nr_cum[..., sfarsit] - nr_cum[..., inceput]
+        rezultat[k] = np.where(complet & (nr == k), suma, np.nan)
+    return rezultat
+
+
+# ─── 3. Ajustare și standardizare pe lot ─────────────────────────────────────
+def _ajusteaza_mle(serii, distributie, floc=None):
+    param = np.full((serii.shape[0], 3), np.nan)
+    fixe = {} if floc is None else {"floc": floc}
+    for i, s in enumerate(serii):
+        s = s[~np.isnan(s)]
+        if s.size:
+            param[i] = distributie.fit(s, **fixe)
+    return param
+
+
+def momente_l(serii):
+    """L-momentele l1, l2 și raportul t3 pentru fiecare rând (NaN ignorate)."""
+    x = np.sort(serii, axis=-1)                 # NaN ajung la sfârșit
+    n = (~np.isnan(x)).sum(axis=-1).astype(float)
+    j = np.arange(x.shape[-1], dtype=float)
+    x = np.where(np.isnan(x), 0.0, x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b0 = x.sum(axis=-1) / n
+        b1 = (j * x).sum(axis=-1) / (n * (n - 1))
+        b2 = (j * (j - 1) * x).sum(axis=-1) / (n * (n - 1) * (n - 2))
+        l2 = 2 * b1 - b0
+        t3 = (6 * b2 - 6 * b1 + b0) / l2
+    insuficient = n < 3
+    return (np.where(insuficient, np.nan, b0), np.where(insuficient, np.nan, l2),
+            np.where(insuficient, np.nan, t3))
+
+
+def _lmom_gamma(serii):
+    l1, l2, _ = momente_l(serii)
+    t = l2 / l1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(t < 0.5, np.pi * t ** 2, 1 - t)
+        alfa = np.where(t < 0.5,
+                        (1 - 0.3080 * z) / (z - 0.05812 * z ** 2 + 0.01765 * z ** 3),
+                        (0.7213 * z - 0.5947 * z ** 2) / (1 - 2.1817 * z + 1.2113 * z ** 2))
+        alfa = np.where((t > 0) & (t < 1), alfa, np.nan)
+    return np.column_stack([alfa, np.zeros_like(alfa), l1 / alfa])
+
+
+def _lmom_pearson3(serii):
+    l1, l2, t3 = momente_l(serii)
+    a3 = np.abs(t3)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        z = np.where(a3 < 1 / 3, 3 * np.pi * t3 ** 2, 1 - a3)
+        alfa = np.where(a3 < 1 / 3,
+                        (1 + 0.2906 * z) / (z + 0.1882 * z ** 2 + 0.0442 * z ** 3),
+                        (0.36067 * z - 0.59567 * z ** 2 + 0.25361 * z ** 3)
+                        / (1 - 2.78861 * z + 2.56096 * z ** 2 - 0.77045 * z ** 3))
+        skew = 2 * np.sign(t3) / np.sqrt(alfa)
+        sigma = l2 * np.sqrt(np.pi * alfa) * np.exp(gammaln(alfa) - gammaln(alfa + 0.5))
+    # t3 ≈ 0: limita normală (alfa → ∞)
+    simetric = a3 < 1e-6
+    skew = np.where(simetric, 0.0, skew)
+    sigma = np.where(simetric, l2 * np.sqrt(np.pi), sigma)
+    return np.column_stack([skew, l1, sigma])
+
+
+def _ajusteaza_lmom(serii, distributie, floc=None):
+    if distributie is gamma:
+        if floc is None:                          # _lmom_gamma este modelul cu loc = 0
+            raise ValueError("Metoda 'lmom' ajustează gamma doar cu loc fixat (floc); "
+                             "gamma cu loc liber este disponibilă doar cu 'mle'")
+        param = _lmom_gamma(serii - floc)
+        param[:, 1] = floc
+        return param
+    if distributie is pearson3 and floc is None:
+        return _lmom_pearson3(serii)
+    raise ValueError(f"Metoda 'lmom' nu este disponibilă pentru {distributie.name} (floc={floc})")
+
+
+METODE_AJUSTARE = {"mle": _ajusteaza_mle, "lmom": _ajusteaza_lmom}
+
+
+def ajusteaza(serii, distributie, metoda="mle", floc=None):
+    """Parametrii (shape, loc, scale) pentru fiecare rând, cu metoda aleasă.
+
+    Cu `floc` parametrul loc este fixat (ca în scipy `.fit(floc=…)`). Ambele
+    metode ajustează același model; gamma cu loc liber există doar la "mle".
+    """
+    if metoda not in METODE_AJUSTARE:
+        raise ValueError(f"Metodă de ajustare necunoscută: {metoda!r} "
+                         f"(disponibile: {', '.join(METODE_AJUSTARE)})")
+    return METODE_AJUSTARE[metoda](np.atleast_2d(np.asarray(serii, dtype=float)), distributie, floc)
+
+
+def standardizeaza(serii, distributie, param):
+    """CDF-ul distribuției ajustate → variabilă normală standard, pe tot lotul
+    (cu probabilitatea de zero p0 din a patra coloană, dacă există)."""
+    cdf = distributie.cdf(serii, param[:, [0]], loc=param[:, [1]], scale=param[:, [2]])
+    if param.shape[1] > 3:
+        cdf = param[:, [3]] + (1 - param[:, [3]]) * cdf
+    return norm.ppf(np.clip(cdf, CLIP_CDF, 1 - CLIP_CDF))
+
+
+def ajusteaza_indice(serii, distributie, metoda="mle", loc_liber=False):
+    """Parametrii (shape, loc, scale, p0) ai modelului indicelui, pe rânduri.
+
+    SPI (gamma): loc = 0 pe valorile pozitive, zerourile intră în p0 –
+    același model pentru "mle" și "lmom". `loc_liber=True` păstrează gamma
+    cu 3 parametri a tezei (doar "mle", fără p0). SPEI (Pearson III): p0 = 0.
+
+    Cele două metode dau același indice până la TOLERANTA_ACORD:
+
+    >>> rng = np.random.default_rng(0)
+    >>> p = rng.gamma(2.0, 30.0, (50, 60)) * (rng.random((50, 60)) > 0.05)
+    >>> d = rng.gamma(4.0, 15.0, (50, 60)) - 50
+    >>> for nume, x, dist in (("SPI", p, gamma), ("SPEI", d, pearson3)):
+    ...     z = [standardizeaza(x, dist, ajusteaza_indice(x, dist, m)) for m in METODE_AJUSTARE]
+    ...     print(nume, acord_metode(*z, *TOLERANTA_ACORD[nume])[-1])
+    SPI True
+    SPEI True
+    """
+    serii = np.atleast_2d(np.asarray(serii, dtype=float))
+    param = np.zeros((serii.shape[0], 4))
+    if distributie is gamma and not loc_liber:
+        n = (~np.isnan(serii)).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            param[:, 3] = np.where(n > 0, (serii == 0).sum(axis=1) / n, np.nan)
+        param[:, :3] = ajusteaza(np.where(serii > 0, serii, np.nan), gamma, metoda, floc=0.0)
+    else:
+        param[:, :3] = ajusteaza(serii, distributie, metoda)
+    return param
+
+
+@cronometrat()
+def ajusteaza_lunar(acumulat, luni, distributie, referinta=None, metoda="mle", sloturi=12):
+    """Parametrii pe luni calendaristice, de formă (serii × sloturi × 4), implicit 12 luni.
+
+    Ultima coloană este p0, probabilitatea de zero: pentru gamma (SPI) se
+    ajustează doar valorile pozitive, cu loc = 0, iar zerourile intră în p0;
+    pentru Pearson III (SPEI) p0 = 0. `referinta` (opțional) este o mască pe
+    axa timpului care limitează ajustarea la perioada de referință. Cu
+    `sloturi` ≠ 12, `luni` poate fi orice cod sezonier 1…sloturi (de ex. ziua
+    din an pentru date zilnice).
+
+    Cu 60 de ani (și luni cu zero precipitații), nicio valoare nu ajunge la
+    limita de tăiere a CDF-ului:
+
+    >>> rng = np.random.default_rng(1)
+    >>> luni = np.tile(np.arange(1, 13), 60)
+    >>> p = rng.gamma(1.5, 30, (20, luni.size)) * (rng.random((20, luni.size)) > 0.05)
+    >>> spi = standardizeaza_lunar(p, luni, gamma, ajusteaza_lunar(p, luni, gamma))
+    >>> bool(np.abs(spi).max() < norm.ppf(1 - CLIP_CDF))
+    True
+    """
+    acumulat = np.atleast_2d(acumulat)
+    param = np.full((acumulat.shape[0], sloturi, 4), np.nan)
+    for m in range(1, sloturi + 1):
+        coloane = luni == m
+        if referinta is not None:
+            coloane = coloane & referinta
+        param[:, m - 1] = ajusteaza_indice(acumulat[:, coloane], distributie, metoda)
+    return param
+
+
+def standardizeaza_lunar(acumulat, luni, distributie, param):
+    """Ca `standardizeaza`, dar fiecare valoare folosește parametrii lunii ei
+    (cu probabilitatea de zero p0 din ultima coloană, dacă există)."""
+    p = param[:, np.asarray(luni) - 1]
+    cdf = distributie.cdf(acumulat, p[..., 0], loc=p[..., 1], scale=p[..., 2])
+    if p.shape[-1] > 3:
+        cdf = p[..., 3] + (1 - p[..., 3]) * cdf
+    return norm.ppf(np.clip(cdf, CLIP_CDF, 1 - CLIP_CDF))
+
+
+def acord_metode(a, b, medie_max, p99_max):
+    """(medie, cuantila 99 %, în toleranță) pentru |a − b| pe valorile comune."""
+    ok = ~np.isnan(a) & ~np.isnan(b)
+    dif = np.abs(a[ok] - b[ok])
+    medie, p99 = dif.mean(), np.quantile(dif, 0.99)
+    return medie, p99, bool(medie <= medie_max and p99 <= p99_max)
+
+
+def indice_lot(acumulat, distributie, metoda="mle", loc_liber=False):
+    """Ajustează și standardizează fiecare rând al unui lot de acumulări."""
+    acumulat = np.atleast_2d(acumulat)
+    return standardizeaza(acumulat, distributie, ajusteaza_indice(acumulat, distributie, metoda, loc_liber))
+
+
+def _indice_3(serii, distributie, metoda, loc_liber=False):
+    serii = np.asarray(serii, dtype=float)
+    smoothed = acumulari(serii, (3,), centrat=True)[3] / 3
+    return indice_lot(smoothed, distributie, metoda, loc_liber).reshape(serii.shape)
+
+
+@cronometrat()
+def compute_spi_3(series, metoda="mle", loc_liber=False):
+    """SPI-3 pentru o serie (1-D) sau un lot de serii (2-D, timpul pe ultima axă).
+
+    `loc_liber=True` (doar "mle") ajustează gamma cu 3 parametri, ca în teză.
+    """
+    return _indice_3(series, gamma, metoda, loc_liber)
+
+
+@cronometrat()
+def compute_spei_3(deficit, metoda="mle"):
+    """SPEI-3 pentru o serie (1-D) sau un lot de serii (2-D, timpul pe ultima axă)."""
+    return _indice_3(deficit, pearson3, metoda)
+
+
+# ─── 4. Depozit de parametri ajustați ────────────────────────────────────────
+def eticheta_perioada(perioada):
+    return f"{perioada[0]}-{perioada[1]}"
+
+
+FARA_ETP = "-"                            # cheia ETP a indicilor fără ETP (SPI)
+ETP_NECUNOSCUT = "?"                      # SPEI din depozite scrise fără cheia ETP
+
+
+def amprenta_serii(serii):
+    """Amprenta (SHA-1, 16 caractere) a fiecărei serii (rând), cu NaN canonic."""
+    serii = np.atleast_2d(np.asarray(serii, dtype=np.float64))
+    serii = np.where(np.isnan(serii), np.nan, serii)
+    return np.array([hashlib.sha1(np.ascontiguousarray(r).tobytes()).hexdigest()[:16] for r in serii])
+
+
+class DepozitParametri:
+    """Parametrii (shape, loc, scale) cheiați după indice, stație, scară, lună,
+    perioadă de referință, metoda de ajustare și varianta ETP (etp.eticheta_etp);
+    lângă ei, amprenta eșantionului ajustat. Se citesc și se scriu ca CSV."""
+
+    CHEIE = ["Indice", "Statie", "Scara", "Luna", "Perioada", "Metoda", "ETP"]
+    PARAM = ["shape", "loc", "scale", "p0"]
+    AMPRENTA = "Amprenta"
+
+    def __init__(self, cale=None):
+        self.cale = Path(cale) if cale is not None else None
+        if self.cale is not None and self.cale.exists():
+            self._df = pd.read_csv(self.cale, dtype={"Statie": str, "Perioada": str, "ETP": str,
+                                                     self.AMPRENTA: str})
+            if "Metoda" not in self._df.columns:          # depozite scrise înainte de "lmom"
+                self._df["Metoda"] = "mle"
+            if "ETP" not in self._df.columns:             # varianta ETP nu se știe: SPEI se reajustează
+                self._df["ETP"] = np.where(self._df["Indice"] == "SPI", FARA_ETP, ETP_NECUNOSCUT)
+            if self.AMPRENTA not in self._df.columns:
+                self._df[self.AMPRENTA] = np.nan
+            if "p0" not in self._df.columns:              # SPI cu loc liber, fără p0: se reajustează
+                self._df = self._df[self._df["Indice"] != "SPI"].assign(p0=0.0)
+            self._df = self._df.set_index(self.CHEIE)
+        else:
+            index = pd.MultiIndex.from_tuples([], names=self.CHEIE)
+            self._df = pd.DataFrame(columns=self.PARAM + [self.AMPRENTA], index=index)
+
+    def _index(self, indice, scara, perioada, statii, metoda, etp):
+        return pd.MultiIndex.from_product(
+            [[indice], list(statii), [scara], range(1, 13), [eticheta_perioada(perioada)], [metoda], [etp]],
+            names=self.CHEIE)
+
+    def obtine(self, indice, scara, perioada, statii, metoda="mle", etp=FARA_ETP, amprente=None):
+        """Tablou (statii × 12 × 4); NaN acolo unde parametrii lipsesc.
+
+        Cu `amprente` (una pe stație, vezi amprenta_serii), parametrii ajustați
+        pe alt eșantion decât cel curent se consideră lipsă.
+        """
+        valori = self._df.reindex(self._index(indice, scara, perioada, statii, metoda, etp))
+        param = valori[self.PARAM].to_numpy(dtype=float, copy=True).reshape(len(statii), 12, len(self.PARAM))
+        if amprente is not None:
+            stocate = valori[self.AMPRENTA].to_numpy(dtype=object).reshape(len(statii), 12)
+            param[stocate != np.asarray(amprente, dtype=object)[:, None]] = np.nan
+        return param
+
+    def actualizeaza(self, indice, scara, perioada, statii, param, metoda="mle", etp=FARA_ETP,
+                     amprente=None):
+        nou = pd.DataFrame(np.asarray(param, dtype=float).reshape(-1, len(self.PARAM)), columns=self.PARAM,
+                           index=self._index(indice, scara, perioada, statii, metoda, etp))
+        nou[self.AMPRENTA] = np.nan if amprente is None else np.repeat(np.asarray(amprente, dtype=object), 12)
+        df = pd.concat([self._df, nou]) if len(self._df) else nou
+        self._df = df[~df.index.duplicated(keep="last")]
+
+    def scrie(self, cale=None):
+        cale = Path(cale) if cale is not None else self.cale
+        self._df.reset_index().to_csv(cale, index=False)
+
+
+def indice_lunar(acumulat, ani, luni, distributie, perioada,
+                 depozit=None, indice=None, scara=None, statii=None, metoda="mle", etp=FARA_ETP):
+    """Indice standardizat cu ajustare pe luni calendaristice.
+
+    Cu `depozit`, parametrii existenți pentru (indice, stație, scară, perioadă,
+    metodă, ETP) sunt refolosiți dacă amprenta eșantionului de referință nu
+    s-a schimbat; se ajustează doar seriile fără parametri valabili.
+    """
+    referinta = (ani >= perioada[0]) & (ani <= perioada[1])
+    if depozit is None:
+        param = ajusteaza_lunar(acumulat, luni, distributie, referinta, metoda)
+    else:
+        amprente = amprenta_serii(acumulat[:, referinta])
+        param = depozit.obtine(indice, scara, perioada, statii, metoda, etp, amprente)
+        de_ajustat = np.isnan(param).all(axis=2).any(axis=1)
+        if de_ajustat.any():
+            param[de_ajustat] = ajusteaza_lunar(acumulat[de_ajustat], luni, distributie,
+                                                referinta, metoda)
+            depozit.actualizeaza(indice, scara, perioada, np.asarray(statii)[de_ajustat],
+                                 param[de_ajustat], metoda, etp, amprente[de_ajustat])
+    return standardizeaza_lunar(acumulat, luni, distributie, param)
+
+
+# ─── 5. Tabel final pe coloane ───────────────────────────────────────────────
+def tabel_rezultate(statii, ani, luni, indici, valid=None, zecimale=3):
+    """Asamblează un DataFrame lung din tablouri (serii × timp).
+
+    `indici` este un dict {nume_coloană: tablou}; `valid` (opțional) marchează
+    perechile stație-lună prezente în datele de intrare.
+    """
+    n_st, n_t = len(statii), len(ani)
+    coloane = {
+        "Statie": np.repeat(statii, n_t),
+        "An": np.tile(ani, n_st).astype(int),
+        "Luna": np.tile(luni, n_st).astype(int),
+    }
+    for nume, valori in indici.items():
+        coloane[nume] = np.round(np.asarray(valori).ravel(), zecimale)
+
+    df = pd.DataFrame(coloane)
+    if valid is not None:
+        df = df[np.asarray(valid).ravel()].reset_index(drop=True)
+    return df
+
+
+@cronometrat()
+def spi_spei_3(df, precip="precip_total", etp="ETP", metoda="mle", istoric=False):
+    """SPI-3 și SPEI-3 pentru toate stațiile dintr-un tabel lung, într-o trecere.
+
+    Cu `istoric=True` calculul este cel al lucrării: seriile conțin doar lunile
+    prezente în date (ferestrele trec peste lunile lipsă, de ex. 2014), iar SPI
+    folosește gamma cu loc liber (doar "mle").
+    """
+    statii, ani, luni, (p, e) = pivoteaza(df, [precip, etp], complet=not istoric)
+    spi = compute_spi_3(p, metoda, loc_liber=istoric)
+    spei = compute_spei_3(p - e, metoda)
+    return tabel_rezultate(statii, ani, luni, {"SPI-3": spi, "SPEI-3": spei},
+                           valid=~np.isnan(p))
+
+
+def spi_spei_multiscara(df, scari=SCARI_STANDARD, precip="precip_total", etp="ETP",
+                        perioada_ref=None, depozit=None, metoda="mle", sursa_etp=None):
+    """SPI-k și SPEI-k pentru toate scările, ca tabel lat (o coloană pe indice și scară).
+
+    Ajustarea se face pe luni calendaristice, pe perioada de referință
+    `perioada_ref` (implicit toată seria); `depozit` păstrează parametrii,
+    cheiați și după `sursa_etp` (etp.eticheta_etp a coloanei `etp`).
+    """
+    surse = None if sursa_etp is None else {"SPEI": sursa_etp}
+    return spei_ansamblu(df, {"SPEI": etp}, scari, precip, perioada_ref, depozit, metoda, surse)
+
+
+@cronometrat()
+def spei_ansamblu(df, coloane_etp, scari=SCARI_STANDARD, precip="precip_total",
+                  perioada_ref=None, depozit=None, metoda="mle", surse_etp=None):
+    """SPI-k o dată și SPEI-k pentru fiecare variantă de ETP, într-un singur tabel lat.
+
+    `coloane_etp` este un dict {nume_indice: coloană ETP}, de ex.
+    {"SPEI_hargreaves": "ETP_hargreaves", "SPEI_thornthwaite": "ETP_thornthwaite"};
+    pivotarea și acumulările precipitațiilor se fac o singură dată pentru toate.
+    `surse_etp` ({nume_indice: etp.eticheta_etp(...)}) dă cheia ETP din depozit;
+    implicit numele coloanei.
+    """
+    nume_etp = list(coloane_etp)
+    statii, ani, luni, cub = pivoteaza(df, [precip] + [coloane_etp[n] for n in nume_etp])
+    p = cub[0]
+    if perioada_ref is None:
+        perioada_ref = (int(ani.min()), int(ani.max()))
+
+    acc_p = acumulari(p, scari)
+    surse_etp = surse_etp or {}
+    acc = {"SPI": (acc_p, gamma, FARA_ETP)}
+    for nume, e in zip(nume_etp, cub[1:]):
+        # sumele mobile sunt liniare: Σ(P − ETP) = ΣP − ΣETP
+        acc_e = acumulari(e, scari)
+        acc[nume] = ({k: acc_p[k] - acc_e[k] for k in scari}, pearson3,
+                     surse_etp.get(nume, coloane_etp[nume]))
+
+    indici = {}
+    for nume, (acumulat, distributie, sursa) in acc.items():
+        for k in scari:
+            indici[f"{nume}-{k}"] = indice_lunar(acumulat[k], ani, luni, distributie, perioada_ref,
+                                                 depozit, nume, k, statii, metoda, sursa)
+    return tabel_rezultate(statii, ani, luni, indici, valid=~np.isnan(p))
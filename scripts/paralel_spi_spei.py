@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+SPI-3 / SPEI-3 în paralel pe stații, cu intrări și ieșiri în memorie partajată
+
+   • tablourile (stații × timp) de P și P − ETP se copiază o singură dată în
+     multiprocessing.shared_memory; la fel tabloul de ieșire
+   • stațiile se împart în PARTI_PE_PROCES × procese felii consecutive;
+     fiecare proces se atașează la memorie o singură dată (initializer),
+     ajustează și standardizează feliile primite (compute_spi_3 /
+     compute_spei_3) și scrie direct în ieșire – între procese circulă doar
+     capetele feliilor
+   • fiecare serie se ajustează independent, deci rezultatul este identic cu
+     rularea pe un singur proces
+Eficiența scalării (accelerare / număr de procese) se raportează pe un lot
+sintetic de serii lunare (ca în benchmark_ajustare.py); numărul de procese se
+limitează la nucleele gazdei, iar pe o gazdă cu un singur nucleu raportul
+spune că scalarea nu se poate măsura, în loc să afișeze eficiențe.
+
+Rulare:
+    python paralel_spi_spei.py                      # 600 de serii sintetice, 1…N procese
+    python paralel_spi_spei.py -n 2000 -j 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from instrumentare import cronometrat
+from motor_spi_spei import compute_spi_3, compute_spei_3, pivoteaza, tabel_rezultate
+
+PARTI_PE_PROCES = 4                       # felii per proces, pentru echilibrarea încărcării
+SERII_RAPORT = 600
+
+_tablouri = {}                            # vederile atașate în fiecare proces
+
+
+# ─── 1. Memorie partajată ────────────────────────────────────────────────────
+def _ataseaza(nume):
+    """Atașare fără ca procesul de lucru să preia ștergerea segmentului.
+
+    Înainte de Python 3.13 (fără `track`), procesele de lucru moștenesc
+    urmăritorul de resurse al părintelui (fork, spawn și forkserver pe POSIX):
+    reînregistrarea aceluiași nume nu schimbă nimic, iar o dezînregistrare
+    din procesul de lucru ar șterge-o pe a părintelui (KeyError la unlink).
+    """
+    try:
+        return shared_memory.SharedMemory(name=nume, track=False)
+    except TypeError:                     # Python < 3.13
+        return shared_memory.SharedMemory(name=nume)
+
+
+def _initializeaza(nume_intrare, nume_iesire, forma):
+    for cheie, nume in (("intrare", nume_intrare), ("iesire", nume_iesire)):
+        shm = _ataseaza(nume)
+        _tablouri[cheie] = (shm, np.ndarray(forma, dtype=np.float64, buffer=shm.buf))
+
+
+def _felie(inceput, sfarsit, metoda, loc_liber=False):
+    """Indicii pentru stațiile [inceput, sfarsit), scriși direct în ieșire."""
+    intrare, iesire = _tablouri["intrare"][1], _tablouri["iesire"][1]
+    iesire[0, inceput:sfarsit] = compute_spi_3(intrare[0, inceput:sfarsit], metoda, loc_liber)
+    iesire[1, inceput:sfarsit] = compute_spei_3(intrare[1, inceput:sfarsit], metoda)
+    return inceput, sfarsit
+
+
+# ─── 2. Rulare paralelă ──────────────────────────────────────────────────────
+def felii(n_statii, procese, parti=PARTI_PE_PROCES):
+    """Capetele (inceput, sfarsit) ale feliilor consecutive de stații."""
+    margini = np.linspace(0, n_statii, min(n_statii, procese * parti) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(margini[:-1], margini[1:]) if b > a]
+
+
+def indici_paralel(precip, deficit, metoda="mle", procese=None, loc_liber=False):
+    """(SPI-3, SPEI-3) pentru tablouri (stații × timp), calculate pe `procese` procese."""
+    procese = min(procese or os.cpu_count() or 1, os.cpu_count() or 1)
+    intrare = np.stack([precip, deficit]).astype(np.float64)
+    if procese == 1:
+        return compute_spi_3(intrare[0], metoda, loc_liber), compute_spei_3(intrare[1], metoda)
+
+    shm_in = shared_memory.SharedMemory(create=True, size=intrare.nbytes)
+    shm_out = shared_memory.SharedMemory(create=True, size=intrare.nbytes)
+    iesire = None
+    try:
+        np.ndarray(intrare.shape, dtype=np.float64, buffer=shm_in.buf)[:] = intrare
+        iesire = np.ndarray(intrare.shape, dtype=np.float64, buffer=shm_out.buf)
+        with ProcessPoolExecutor(max_workers=procese, initializer=_initializeaza,
+                                 initargs=(shm_in.name, shm_out.name, intrare.shape)) as executor:
+            viitoare = [executor.submit(_felie, a, b, metoda, loc_liber) for a, b in felii(intrare.shape[1], procese)]
+            for v in viitoare:
+                v.result()
+        rezultat = iesire.copy()
+    finally:
+        iesire = None                     # fără vederi rămase, segmentele se pot închide
+        for shm in (shm_in, shm_out):
+            shm.close()
+            shm.unlink()
+    return rezultat[0], rezultat[1]
+
+
+@cronometrat()
+def spi_spei_3_paralel(df, precip="precip_total", etp="ETP", metoda="mle", procese=None,
+                       istoric=False):
+    """Ca motor_spi_spei.spi_spei_3, cu ajustarea împărțită pe procese."""
+    statii, ani, luni, (p, e) = pivoteaza(df, [precip, etp], complet=not istoric)
+    spi, spei = indici_paralel(p, p - e, metoda, procese, loc_liber=istoric)
+    return tabel_rezultate(statii, ani, luni, {"SPI-3": spi, "SPEI-3": spei},
+                           valid=~np.isnan(p))
+
+
+# ─── 3. Eficiența scalării ───────────────────────────────────────────────────
+def eficienta(precip, deficit, procese, metoda="mle"):
+    """Rânduri (procese, secunde, accelerare, eficiență) față de primul număr de procese."""
+    randuri = []
+    for n in procese:
+        t0 = time.perf_counter()
+        indici_paralel(precip, deficit, metoda, n)
+        randuri.append((n, time.perf_counter() - t0))
+    n0, t_baza = randuri[0]
+    return [(n, t, t_baza / t, t_baza * n0 / (t * n)) for n, t in randuri]
+
+
+def main() -> None:
+    from benchmark_ajustare import date_sintetice
+
+    maxim = os.cpu_count() or 1
+    implicit = sorted({1, *(2 ** k for k in range(1, maxim.bit_length()) if 2 ** k < maxim), maxim})
+    ap = argparse.ArgumentParser(description="Eficiența SPI-3 / SPEI-3 paralel pe 1…N procese")
+    ap.add_argument("-n", "--serii", type=int, default=SERII_RAPORT, help="număr de serii sintetice")
+    ap.add_argument("-j", "--procese", type=int, nargs="+", default=implicit,
+                    help=f"numere de procese de comparat (cel mult {maxim}, nucleele gazdei)")
+    ap.add_argument("--metoda", default="mle", help="ajustarea distribuțiilor: mle sau lmom")
+    args = ap.parse_args()
+
+    procese = sorted({min(max(n, 1), maxim) for n in args.procese})
+    _, precip, deficit = date_sintetice(args.serii)
+    print(f"── {args.serii} serii × {precip.shape[1]} luni, metoda {args.metoda}")
+    if procese != sorted(set(args.procese)):
+        print(f"  -j limitat la {maxim} nuclee: {' '.join(map(str, procese))}")
+    if len(procese) < 2:
+        t = eficienta(precip, deficit, procese, args.metoda)[0][1]
+        print(f"  {procese[0]} proces: {t:.2f} s – gazda are {maxim} nucleu(e), scalarea nu se poate "
+              f"măsura (rezultatul paralel este identic cu cel pe un proces)")
+        return
+    print(f"  {'procese':>7} {'secunde':>9} {'accelerare':>11} {'eficiență':>10}")
+    for n, t, acc, ef in eficienta(precip, deficit, procese, args.metoda):
+        print(f"  {n:>7} {t:9.2f} {acc:10.2f}x {ef:9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,15 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import matplotlib.colors as mcolors
 
+from acces_date import citeste_excel
+from lipsa_date import completeaza_ani, ani_fara_date, adnoteaza_lipsuri
+from tendinte import tendinte
+
 # 1. Încarcă fișierul
-df = pd.read_excel("Precip-medii-pe-anotimp_1961-2020.xlsx")
+df = citeste_excel("Precip-medii-pe-anotimp_1961-2020.xlsx")
 df.columns = df.columns.str.strip()
-df = df.set_index("An")
+df = completeaza_ani(df.set_index("An"))
 
 # 2. Setup figură
 fig, axs = plt.subplots(2, 2, figsize=(14, 10))
@@ -20,7 +23,8 @@ pozitii    = {(0, 0): "Iarna", (0, 1): "Primăvara", (1, 0): "Vara", (1, 1): "To
 xticks_maj = [1961, 1965, 1970, 1975, 1980, 1985, 1990, 1995,
               2000, 2005, 2010, 2015, 2020]
 all_years  = list(range(1961, 2021))
-xticks_min = [y for y in all_years if y not in xticks_maj and y != 2014]
+ani_lipsa  = set(ani_fara_date(df, None).tolist())
+xticks_min = [y for y in all_years if y not in xticks_maj and y not in ani_lipsa]
 
 start_levels = {
     "Iarna": 20,
@@ -33,6 +37,9 @@ def brighten(hexcol, factor=0.1):
     rgb = np.array(mcolors.to_rgb(hexcol))
     return tuple((1 - factor) * rgb + factor)
 
+# Trend OLS + Mann-Kendall / Sen pentru toate anotimpurile, într-un singur apel
+trend = tendinte(df[sezoane].to_numpy(dtype=float).T, df.index.to_numpy())
+
 # 4. Plot
 for (i, j), sezon in pozitii.items():
     ax = axs[i, j]
@@ -44,9 +51,10 @@ for (i, j), sezon in pozitii.items():
     ax.plot(x, y, lw=1.8, color=col, label="Nivel precipitații")
 
     # Trend
-    mask = ~y.isna()
-    z = np.polyfit(x[mask], y[mask], 1)
-    ax.plot(x, np.poly1d(z)(x), ls="--", lw=2, color="#C62828", label="Trend")
+    k = sezoane.index(sezon)
+    sen, p_mk = trend["sen"][k], trend["p"][k]
+    ax.plot(x, trend["ols"][k] * x + trend["interceptie_ols"][k], ls="--", lw=2, color="#C62828",
+            label=f"Trend (Sen {sen*10:+.1f} mm/dec, MK p={p_mk:.3f})")
 
     # Limite axă
     y_base, y_top = ax.get_ylim()
@@ -67,24 +75,8 @@ for (i, j), sezon in pozitii.items():
         ax.plot([yr, yr], [-0.02, 0.02], transform=ax.get_xaxis_transform(),
                 color="gray", lw=0.5)
 
-    # Text și linie pentru 2014
-    if 2014 in x:
-        txt = ax.text(2014, 0.02, "2014 - lipsă date",
-                      rotation=90, ha="center", va="bottom",
-                      color="gray", fontsize=8,
-                      transform=ax.get_xaxis_transform())
-
-        fig.canvas.draw()
-        bbox = txt.get_window_extent(fig.canvas.get_renderer())
-        y_text_top = ax.transData.inverted().transform((0, bbox.y1))[1]
-        pad = (y_top - y_base) * 0.01
-
-        ax.vlines(2014, ymin=y_text_top + pad, ymax=y_top,
-                  linestyle="--", linewidth=1, color="gray")
-
-        if not pd.isna(y.loc[2014]):
-            ax.hlines(y=y.loc[2014], xmin=2013.5, xmax=2014.5,
-                      linestyle=':', color='gray', linewidth=1)
+    # Ani fără date (bandă + etichetă)
+    adnoteaza_lipsuri(ax, x, y.notna())
 
     # Axe & legendă
     ax.set_xticks(xticks_maj)
@@ -1,23 +1,27 @@
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 
+from agregate import vedere
+from bootstrap import ic_diferenta
+
 # Nume luni în limba română
 luni_romana = ['Ianuarie', 'Februarie', 'Martie', 'Aprilie', 'Mai', 'Iunie',
                'Iulie', 'August', 'Septembrie', 'Octombrie', 'Noiembrie', 'Decembrie']
 
-# Încarcă fișierul Excel
-df = pd.read_excel("Date_6statii_cu_scor_hellmann_lunar.xlsx")
-
-# Creează coloana Interval
-df['Interval'] = pd.cut(df['An_numeric'], bins=[1960, 1990, 2020], labels=['1961–1990', '1991–2020'])
-
-# Marcare luni secetoase (1 sau 2)
-df['este_secetoasa'] = df['hellmann_score_lunar'].isin([1, 2])
-
-# Calculează procentul lunilor secetoase
-monthly_dry_ratio = df.groupby(['Interval', 'Luna_numeric'])['este_secetoasa'].mean().reset_index()
-monthly_dry_ratio['Procent_secetos'] = monthly_dry_ratio['este_secetoasa'] * 100
-monthly_dry_ratio['Luna'] = monthly_dry_ratio['Luna_numeric'].apply(lambda x: luni_romana[x - 1])
+# Procentul lunilor secetoase (scor Hellmann 1 sau 2) pe interval și lună,
+# precalculat din registrul lunar (vezi agregate.py)
+monthly_dry_ratio = vedere("hellmann_secetos")
+monthly_dry_ratio['Luna'] = np.array(luni_romana)[monthly_dry_ratio['Luna_numeric'].to_numpy() - 1]
+
+# Semnificația schimbării pe fiecare lună: fracția anuală de stații secetoase,
+# o serie pe lună calendaristică, bootstrap pe blocuri de 2 ani
+anual = vedere("hellmann_secetos_anual").pivot(index='Luna_numeric', columns='An_numeric',
+                                                values='Procent_secetos')
+ani = anual.columns.to_numpy()
+ic = ic_diferenta(anual.to_numpy(), ani <= 1990, ani > 1990, lungime_bloc=2, procese=1)
+semnificativ = dict(zip(anual.index, ic['p_permutare'] < 0.05))
+for luna, d, inf, sup, p in zip(anual.index, ic['diferenta'], ic['ic_inf'], ic['ic_sup'], ic['p_permutare']):
+    print(f"{luni_romana[luna - 1]:11} Δ = {d:+5.1f} pp [IC95%: {inf:+5.1f}; {sup:+5.1f}], p = {p:.3f}")
 
 # Pivot pentru plotare
 pivot_data = monthly_dry_ratio.pivot(index='Luna', columns='Interval', values='Procent_secetos')
@@ -34,8 +38,9 @@ plt.ylabel("Procent luni secetoase (%)", fontsize=11)
 plt.xlabel("Luna", fontsize=11)
 plt.ylim(0, 100)
 plt.grid(True, linestyle='--', alpha=0.5)
-plt.xticks(rotation=45)
-plt.legend(title='', loc='upper right')
+plt.xticks(range(12), [l + ('*' if semnificativ.get(i + 1) else '') for i, l in enumerate(luni_romana)],
+           rotation=45)
+plt.legend(title='* diferență semnificativă (p < 0,05)', title_fontsize=9, loc='upper right')
 plt.tight_layout()
 plt.savefig("grafic_repartitie_luni_secetoase_baragan.png", dpi=300)
 print("Grafic salvat ca 'repartitie_luni_secetoase_baragan.png'")
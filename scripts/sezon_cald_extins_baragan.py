@@ -1,9 +1,10 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 
+from acces_date import citeste_excel
+
 # === Încărcare fișiere Excel (header pe rândul 4)
-df_6190 = pd.read_excel("Date-climatologice-sezon-cald-extins_1961-1990.xlsx", header=3)
-df_9120 = pd.read_excel("Date-climatologice-sezon-cald-extins_1991-2020.xlsx", header=3)
+df_6190 = citeste_excel("Date-climatologice-sezon-cald-extins_1961-1990.xlsx", header=3)
+df_9120 = citeste_excel("Date-climatologice-sezon-cald-extins_1991-2020.xlsx", header=3)
 df_6190.set_index("Luna", inplace=True)
 df_9120.set_index("Luna", inplace=True)
 
@@ -2,6 +2,8 @@ import pandas as pd
 import matplotlib.pyplot as plt
 from pathlib import Path
 
+from acces_date import citeste_excel
+
 # --------------------------------------------------
 #  Fișiere sursă (schimbă doar dacă le muți)
 # --------------------------------------------------
@@ -12,7 +14,7 @@ F_9120 = Path("Date-climatologice-sezon-rece-extins_1991-2020.xlsx")
 #  Citește fișierul: rândul 1 = "Luna 10 11 12 1 2 3"
 # --------------------------------------------------
 def load_file(path: Path) -> pd.DataFrame:
-    df = pd.read_excel(path, header=1)         # header=1 -> rândul „Luna …”
+    df = citeste_excel(path, header=1)         # header=1 -> rândul „Luna …”
     df.rename(columns={df.columns[0]: "Indicator"}, inplace=True)
     # convertează capetele de coloană la int (10,11…)
     new_cols = []
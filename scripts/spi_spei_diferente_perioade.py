@@ -2,33 +2,31 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
-# 1. Încarcă datele
-df = pd.read_excel("Rezultate_SPI3_SPEI3_6statii.xlsx")
+from agregate import medii_regionale, vedere
+from bootstrap import ic_diferenta
+from calendar_climatic import an_sezonier, cod_perioada, cod_sezon, ANOTIMPURI
 
-# 2. Atribuie anotimpul pe baza lunii
-def get_anotimp(luna):
-    if luna in [12, 1, 2]:
-        return "Iarnă"
-    elif luna in [3, 4, 5]:
-        return "Primăvară"
-    elif luna in [6, 7, 8]:
-        return "Vară"
-    else:
-        return "Toamnă"
-
-df["Anotimp"] = df["Luna"].apply(get_anotimp)
-
-# 3. Atribuie perioada
-df["Perioadă"] = df["An"].apply(lambda x: "1961–1990" if x <= 1990 else "1991–2020")
-
-# 4. Diferența SPI - SPEI
-df["Dif_SPI_SPEI"] = df["SPI-3"] - df["SPEI-3"]
-
-# 5. Calculează medii pe anotimp și perioadă
-grouped = df.groupby(["Perioadă", "Anotimp"])["Dif_SPI_SPEI"].mean().reset_index()
+# 1–5. Mediile diferenței SPI − SPEI pe perioadă și anotimp (decembrie aparține
+#      iernii anului următor), precalculate din tabelul de indici (vezi agregate.py)
+grouped = medii_regionale("Anotimp", "Dif_SPI_SPEI").rename(
+    columns={"Perioada": "Perioadă", "Sezon": "Anotimp", "Medie": "Dif_SPI_SPEI"})
 
 # 6. Ordine anotimpuri
 anotimpuri = ["Primăvară", "Vară", "Toamnă", "Iarnă"]
+
+# 6b. Incertitudinea schimbării între perioade: seria lunară medie pe stații,
+#     câte un rând pe anotimp (NaN în afara lui), bootstrap pe blocuri de 12 luni
+lunar = vedere("serie_regionala")
+ani_axa, luni_axa = lunar["An"].to_numpy(), lunar["Luna"].to_numpy()
+cod_anotimpuri = np.array([ANOTIMPURI.index(a) for a in anotimpuri])
+serii_anotimp = np.where(cod_sezon(luni_axa)[None, :] == cod_anotimpuri[:, None],
+                         lunar["Dif_SPI_SPEI"].to_numpy()[None, :], np.nan)
+per_axa = cod_perioada(an_sezonier(ani_axa, luni_axa))
+# puține serii: reeșantionarea rulează în procesul curent
+ic = ic_diferenta(serii_anotimp, per_axa == 0, per_axa == 1, procese=1)
+for k, anotimp in enumerate(anotimpuri):
+    print(f"{anotimp:10} Δ(1991–2020 − 1961–1990) = {ic['diferenta'][k]:+.3f} "
+          f"[IC95%: {ic['ic_inf'][k]:+.3f}; {ic['ic_sup'][k]:+.3f}], p = {ic['p_permutare'][k]:.3f}")
 grouped["Anotimp"] = pd.Categorical(grouped["Anotimp"], categories=anotimpuri, ordered=True)
 grouped = grouped.sort_values(["Anotimp", "Perioadă"])
 
@@ -56,7 +54,8 @@ for perioada, offset in zip(["1961–1990", "1991–2020"], [-bar_width/2, bar_w
 
 # 9. Stilizare
 ax.set_xticks(x)
-ax.set_xticklabels(anotimpuri, fontsize=11)
+ax.set_xticklabels([f"{a}\nΔ {ic['diferenta'][k]:+.2f} [{ic['ic_inf'][k]:+.2f}; {ic['ic_sup'][k]:+.2f}]"
+                    for k, a in enumerate(anotimpuri)], fontsize=11)
 ax.set_ylabel("Diferență medie SPI–SPEI", fontsize=12)
 ax.set_xlabel("Anotimp", fontsize=12)
 ax.set_title("Comparația Diferențelor SPI–SPEI între Perioadele 1961–1990 și 1991–2020", fontsize=14)
@@ -1,16 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Încarcă datele
-fisier_date = "Rezultate_SPI3_SPEI3_6statii.xlsx"
-df = pd.read_excel(fisier_date)
+from agregate import medii_pe_statii
 
-# Filtrare pentru lunile semestrului cald (aprilie–septembrie)
-df = df[df["Luna"].isin([4, 5, 6, 7, 8, 9])]
-
-# Calculează mediile pe stații
-medii = df.groupby("Statie")[["SPI-3", "SPEI-3"]].mean().reset_index()
+# Mediile pe stații pentru lunile semestrului cald (aprilie–septembrie),
+# precalculate din tabelul de indici (vezi agregate.py)
+medii = medii_pe_statii("Semestru", "Semestru cald").reset_index()
 
 # Configurare poziții și dimensiuni
 bar_width = 0.35
@@ -1,16 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Încarcă datele
-fisier_date = "Rezultate_SPI3_SPEI3_6statii.xlsx"
-df = pd.read_excel(fisier_date)
+from agregate import medii_pe_statii
 
-# Filtrare pentru lunile semestrului rece (noiembrie–martie)
-df = df[df["Luna"].isin([11, 12, 1, 2, 3])]
-
-# Calculează mediile pe stații
-medii = df.groupby("Statie")[["SPI-3", "SPEI-3"]].mean().reset_index()
+# Mediile pe stații pentru lunile semestrului rece (noiembrie–martie),
+# precalculate din tabelul de indici (vezi agregate.py)
+medii = medii_pe_statii("Semestru", "Semestru rece").reset_index()
 
 # Configurare poziții și dimensiuni
 bar_width = 0.35
@@ -1,22 +1,9 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import os
 
-# === 1. Încarcă datele
-df = pd.read_excel("Rezultate_SPI3_SPEI3_6statii.xlsx")
+from agregate import medii_pe_statii
 
-# === 2. Atribuie anotimpul
-def map_luna_la_anotimp(luna):
-    if luna in [12, 1, 2]:
-        return "Iarnă"
-    elif luna in [3, 4, 5]:
-        return "Primăvară"
-    elif luna in [6, 7, 8]:
-        return "Vară"
-    else:
-        return "Toamnă"
-
-df["Anotimp"] = df["Luna"].apply(map_luna_la_anotimp)
+# === 1–2. Mediile pe stație și anotimp sunt precalculate (vezi agregate.py)
 
 # === 3. Setări stil
 culori = {"SPI-3": "#F57C00", "SPEI-3": "#005288"}
@@ -38,8 +25,7 @@ sp_toamna = {
 
 # === 5. Generează grafice
 for anotimp in ["Primăvară", "Vară", "Toamnă", "Iarnă"]:
-    df_sezon = df[df["Anotimp"] == anotimp]
-    medii = df_sezon.groupby("Statie")[["SPI-3", "SPEI-3"]].mean().round(2)
+    medii = medii_pe_statii("Anotimp", anotimp).round(2)
     statii = medii.index.tolist()
     x = range(len(statii))
 
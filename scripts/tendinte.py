@@ -0,0 +1,126 @@
+"""
+Tendințe pe mai multe serii deodată: Mann-Kendall, panta Sen și regresia OLS
+
+Datele intră ca tablou 2-D (serii × timp), cu NaN pentru valori lipsă;
+toate statisticile se calculează pe tot tabloul, fără bucle pe serii:
+   • Mann-Kendall: S, varianța cu corecția pentru valori egale, Z, p (bilateral)
+     și tau; opțional corecția Hamed & Rao (1998) pentru autocorelație
+   • panta Sen (mediana pantelor pe perechi) și interceptul Conover
+   • panta OLS, interceptul și p-valoarea testului t pentru pantă
+Perechile (i, j) se procesează pe blocuri de serii de cel mult
+ELEMENTE_PE_BLOC diferențe, ca memoria să rămână limitată și pentru mii de
+serii lungi.
+"""
+
+import numpy as np
+from scipy.stats import norm, t as student
+
+from instrumentare import cronometrat
+
+ALFA = 0.05
+ELEMENTE_PE_BLOC = 20_000_000           # ≈ 160 MB de diferențe float64 pe bloc
+
+
+def _perechi(n_t):
+    return np.triu_indices(n_t, k=1)
+
+
+# ─── 1. Mann-Kendall ─────────────────────────────────────────────────────────
+def _suma_egalitati(y):
+    """Σ t(t−1)(2t+5) pe grupurile de valori egale din fiecare serie."""
+    s = np.sort(y, axis=1)                        # NaN la final, fiecare în grupul lui
+    n_serii, n_t = s.shape
+    nou = np.ones_like(s, dtype=bool)
+    nou[:, 1:] = s[:, 1:] != s[:, :-1]
+    grup = np.cumsum(nou.ravel()) - 1
+    marime = np.bincount(grup)
+    serie_grup = np.repeat(np.arange(n_serii), n_t)[nou.ravel()]
+    return np.bincount(serie_grup, weights=marime * (marime - 1) * (2 * marime + 5), minlength=n_serii)
+
+
+def _autocorelatie(z, intarzieri):
+    """Autocorelația fiecărei serii (NaN ignorate) pentru întârzierile 1…intarzieri."""
+    centrat = z - np.nanmean(z, axis=1, keepdims=True)
+    centrat = np.where(np.isnan(centrat), 0.0, centrat)
+    numitor = (centrat**2).sum(axis=1)
+    return np.stack([(centrat[:, :-k] * centrat[:, k:]).sum(axis=1) for k in range(1, intarzieri + 1)],
+                    axis=1) / np.where(numitor > 0, numitor, np.nan)[:, None]
+
+
+def _factor_hamed_rao(y, x, sen, n, alfa):
+    """n/n* din Hamed & Rao (1998), pe rangurile seriei fără trendul Sen."""
+    rezidual = y - sen[:, None] * x
+    valid = ~np.isnan(rezidual)
+    ranguri = np.where(valid, np.argsort(np.argsort(np.where(valid, rezidual, np.inf), axis=1), axis=1)
+                       + 1.0, np.nan)
+    n_t = y.shape[1]
+    r = _autocorelatie(ranguri, n_t - 1)
+    k = np.arange(1, n_t)
+    r = np.where(np.abs(r) > norm.ppf(1 - alfa / 2) / np.sqrt(n)[:, None], r, 0.0)
+    nn = n[:, None].astype(float)
+    pondere = np.clip((nn - k) * (nn - k - 1) * (nn - k - 2), 0, None)
+    factor = 1 + 2 / (n * (n - 1) * (n - 2)) * (pondere * r).sum(axis=1)
+    return np.where(factor > 0, factor, 1.0)
+
+
+def _bloc(y, x, autocorelatie, alfa):
+    i, j = _perechi(y.shape[1])
+    dy = y[:, j] - y[:, i]
+    dx = x[j] - x[i]
+    n = (~np.isnan(y)).sum(axis=1)
+
+    s = np.nansum(np.sign(dy), axis=1)
+    var_s = (n * (n - 1) * (2 * n + 5) - _suma_egalitati(y)) / 18.0
+    with np.errstate(all="ignore"):
+        sen = np.nanmedian(dy / dx, axis=1)
+        if autocorelatie:
+            var_s = var_s * _factor_hamed_rao(y, x, sen, n, alfa)
+        z = np.where(var_s > 0, (s - np.sign(s)) / np.sqrt(var_s), 0.0)
+        tau = s / (n * (n - 1) / 2)
+
+    # intercept Conover: median(y) − panta · median(x), doar pe valorile prezente
+    x_valid = np.where(np.isnan(y), np.nan, x)
+    interceptie_sen = np.nanmedian(y, axis=1) - sen * np.nanmedian(x_valid, axis=1)
+    return {"n": n, "S": s, "var_S": var_s, "Z": z, "p": 2 * norm.sf(np.abs(z)), "tau": tau,
+            "sen": sen, "interceptie_sen": interceptie_sen}
+
+
+# ─── 2. Regresie liniară ─────────────────────────────────────────────────────
+def ols(y, x):
+    """Panta, interceptul și p-valoarea pantei OLS pentru fiecare serie."""
+    valid = ~np.isnan(y)
+    n = valid.sum(axis=1)
+    xv = np.where(valid, x, np.nan)
+    with np.errstate(all="ignore"):
+        dx = xv - np.nanmean(xv, axis=1, keepdims=True)
+        dy = y - np.nanmean(y, axis=1, keepdims=True)
+        sxx = np.nansum(dx**2, axis=1)
+        panta = np.nansum(dx * dy, axis=1) / sxx
+        interceptie = np.nanmean(y, axis=1) - panta * np.nanmean(xv, axis=1)
+        rezidual = np.nansum((dy - panta[:, None] * dx) ** 2, axis=1)
+        eroare = np.sqrt(rezidual / (n - 2) / sxx)
+        p = 2 * student.sf(np.abs(panta / eroare), n - 2)
+    return {"ols": panta, "interceptie_ols": interceptie, "p_ols": np.where(n > 2, p, np.nan)}
+
+
+# ─── 3. Interfață ────────────────────────────────────────────────────────────
+@cronometrat()
+def tendinte(y, x=None, autocorelatie=False, alfa=ALFA):
+    """Toate statisticile de trend pentru un tablou (serii × timp) sau o singură serie.
+
+    `x` este axa timpului (implicit 0…n−1); pantele sunt în unități de y pe
+    unitate de x. Întoarce un dict de tablouri de lungime egală cu numărul de
+    serii (sau scalari, pentru o serie 1-D).
+    """
+    y = np.asarray(y, dtype=float)
+    o_serie = y.ndim == 1
+    y = np.atleast_2d(y)
+    x = np.arange(y.shape[1], dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    pas = max(1, ELEMENTE_PE_BLOC // max(1, y.shape[1] * (y.shape[1] - 1) // 2))
+    blocuri = [_bloc(y[k:k + pas], x, autocorelatie, alfa) for k in range(0, y.shape[0], pas)]
+    rezultat = {cheie: np.concatenate([b[cheie] for b in blocuri]) for cheie in blocuri[0]}
+    rezultat.update(ols(y, x))
+    if o_serie:
+        return {cheie: v[0] for cheie, v in rezultat.items()}
+    return rezultat
@@ -1,16 +1,13 @@
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib import cm
 import matplotlib.patheffects as path_effects
 import numpy as np
 
-# Încarcă datele
-df = pd.read_excel("Date_6statii_cu_scor_hellmann_lunar.xlsx")
+from agregate import vedere
 
-# Calculează scorul mediu anual pentru fiecare stație
-annual_scores = df.groupby(['Statie', 'An_numeric'])['hellmann_score_lunar'].mean().reset_index()
-annual_scores.rename(columns={'hellmann_score_lunar': 'scor_hellmann_mediu_anual'}, inplace=True)
+# Scorul mediu anual pentru fiecare stație, precalculat (vezi agregate.py)
+annual_scores = vedere("hellmann_anual")
 
 # Media anuală pe toate stațiile
 mean_scores = annual_scores.groupby('An_numeric')['scor_hellmann_mediu_anual'].mean().reset_index()